@@ -0,0 +1,31 @@
+import re
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from autostack_engine.utils.database.models.project.models import ProjectAvatar
+
+router = APIRouter()
+
+AVATAR_HASH = re.compile(r"^[0-9a-f]{32}$")
+
+# An avatar hash always names the same image, so browsers and proxies may keep it for good
+AVATAR_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@router.get("/avatars/{avatar_hash}.png")
+async def get_avatar(avatar_hash: str, request: Request):
+    """A project's identicon, answered with 304 when the client already has it"""
+    if not AVATAR_HASH.match(avatar_hash):
+        raise HTTPException(status_code=404, detail="Avatar not found")
+
+    avatar = await ProjectAvatar.find_one(ProjectAvatar.hash == avatar_hash)
+    if not avatar:
+        raise HTTPException(status_code=404, detail="Avatar not found")
+
+    etag = f'"{avatar.etag}"'
+    headers = {"ETag": etag, "Cache-Control": AVATAR_CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=avatar.data, media_type=avatar.content_type, headers=headers)
@@ -1,4 +1,3 @@
-import asyncio
 import uuid
 from typing import Optional
 import strawberry
@@ -7,6 +6,7 @@ import structlog
 from autostack_engine.gateway.graphql.resolvers.ai.ai_query import DeleteChatResponse, JobCreated
 from autostack_engine.services.ai.services.ai import AIService
 from autostack_engine.services.project.services.project import ProjectService
+from autostack_engine.utils.jobs.queue import AI_QUEUE
 
 
 logger = structlog.get_logger()
@@ -34,13 +34,11 @@ class ModelMutation:
             job_id = str(uuid.uuid4())
             await operation_store.create_operation(job_id)
             
-            # Start background task
-            asyncio.create_task(
-                ModelMutation._execute_ai_generation(
-                    job_id,
-                    user_input,
-                    operation_store
-                )
+            await info.context["job_dispatcher"].dispatch(
+                AI_QUEUE,
+                "ai.generate",
+                job_id,
+                {"user_input": user_input}
             )
             
             return JobCreated(
@@ -52,56 +50,6 @@ class ModelMutation:
             logger.error(f"Error initiating AI generation: {e}")
             raise e
 
-    @staticmethod
-    async def _execute_ai_generation(job_id: str, user_input: str, operation_store):
-        """Background task for AI generation"""
-        from autostack_engine.services.ai.services.ai import AIService
-        from autostack_engine.utils.project.subscription import ProjectCreationStatus
-        import json
-        from datetime import datetime
-        
-        try:
-            await operation_store.update_operation(
-                job_id,
-                ProjectCreationStatus.PROCESSING if hasattr(ProjectCreationStatus, 'PROCESSING') else ProjectCreationStatus.VALIDATING,
-                "AI is generating your project architecture...",
-                30
-            )
-            
-            ai_service = AIService()
-            success, result, chat_id, error = await ai_service.generate_project_config(user_input)
-            
-            if success:
-                # Store the result in Redis so get_job can find it
-                # We extend the operation_store mapping for 'result'
-                key = f"operation:{job_id}"
-                await operation_store.redis.hset(key, "result", json.dumps(result))
-                
-                await operation_store.update_operation(
-                    job_id,
-                    ProjectCreationStatus.COMPLETED,
-                    "Project architecture generated successfully!",
-                    100
-                )
-            else:
-                await operation_store.update_operation(
-                    job_id,
-                    ProjectCreationStatus.FAILED,
-                    error or "AI generation failed.",
-                    100,
-                    error=error
-                )
-                
-        except Exception as e:
-            logger.error(f"background_ai_generation_failed job_id={job_id} error={e}")
-            await operation_store.update_operation(
-                job_id,
-                ProjectCreationStatus.FAILED,
-                "An internal error occurred during generation.",
-                100,
-                error=str(e)
-            )
-
     @strawberry.mutation
     async def delete_chat(self, chat_id: str) -> DeleteChatResponse:
         """
@@ -9,6 +9,9 @@ from strawberry.scalars import JSON
 
 from autostack_engine.services.ai.services.ai import AIService
 from autostack_engine.utils.ai.util import generate_project_config
+from autostack_engine.utils.database.models.ai.models import ProjectChat
+from autostack_engine.utils.database.pagination import PAGE_MAX_SIZE
+from autostack_engine.utils.schema.models.generic import PageInfo
 
 logger = structlog.get_logger()
 
@@ -25,6 +28,27 @@ class ChatInfo:
     validation_error: Optional[JSON] = None # type: ignore
 
 
+@strawberry.type
+class ChatPage:
+    """Type representing one page of chats"""
+    chats: List[ChatInfo]
+    page_info: PageInfo
+    error: Optional[str] = None
+
+
+def chat_info(chat: ProjectChat) -> ChatInfo:
+    return ChatInfo(
+        id=str(chat.id),
+        chat_title=chat.chat_title,
+        prompt=chat.prompt,
+        initial_schema=chat.initial_schema,
+        created_at=chat.created_at.isoformat(),
+        updated_at=chat.updated_at.isoformat(),
+        has_validation_error=chat.has_validation_error,
+        validation_error=chat.validation_error
+    )
+
+
 @strawberry.type
 class DeleteChatResponse:
     """Response type for chat deletion"""
@@ -47,6 +71,7 @@ class JobResult:
     error: Optional[str] = None
     created_at: str
     completed_at: Optional[str] = None
+    event_id: Optional[str] = None
 
 @strawberry.type
 class UnsupportedItem:
@@ -84,22 +109,25 @@ class ModelQuery:
         Get the current status and result of an AI job.
         """
         operation_store = info.context["operation_store"]
-        key = f"operation:{job_id}"
         
-        # This is a bit of a hack to reuse the RedisOperationStore for AI "jobs"
-        # We'll use the same key prefix to keep things unified.
-        data = await operation_store.redis.hgetall(key)
+        # AI jobs are tracked as operations in the shared operation store
+        operation = await operation_store.get_operation(job_id)
         
-        if not data:
+        if not operation:
             return None
+        
+        result = operation.result
+        if result is None and operation.result_key:
+            result = await operation_store.load_result(operation.result_key)
             
         return JobResult(
             id=job_id,
-            status=data[b'status'].decode() if b'status' in data else "PENDING",
-            result=json.loads(data[b'result'].decode()) if b'result' in data and data[b'result'] else None,
-            error=data[b'error'].decode() if b'error' in data and data[b'error'] else None,
-            created_at=data[b'created_at'].decode() if b'created_at' in data else datetime.now().isoformat(),
-            completed_at=data[b'updated_at'].decode() if b'updated_at' in data else None
+            status=operation.status.value,
+            result=result,
+            error=operation.error,
+            created_at=operation.created_at or datetime.now().isoformat(),
+            completed_at=operation.updated_at,
+            event_id=operation.event_id
         )
 
     @strawberry.field
@@ -295,29 +323,55 @@ class ModelQuery:
     @strawberry.field
     async def list_chats(self) -> List[ChatInfo]:
         """
-        List all chats, sorted by most recent first.
+        List the most recent chats (at most PAGE_MAX_SIZE), most recent first.
+        Use list_chats_page to go further back.
         
         Returns:
             List of ChatInfo objects
         """
         try:
             ai_service = AIService()
-            chats = await ai_service.list_chats()
+            success, page, error = await ai_service.list_chats_page(first=PAGE_MAX_SIZE)
+            if not success:
+                logger.error(f"Error listing chats: {error}")
+                return []
             
-            return [
-                ChatInfo(
-                    id=str(chat.id),
-                    chat_title=chat.chat_title,
-                    prompt=chat.prompt,
-                    initial_schema=chat.initial_schema,
-                    created_at=chat.created_at.isoformat(),
-                    updated_at=chat.updated_at.isoformat(),
-                    has_validation_error=chat.has_validation_error,
-                    validation_error=chat.validation_error
-                )
-                for chat in chats
-            ]
+            return [chat_info(chat) for chat in page.items]
             
         except Exception as e:
             logger.error(f"Error listing chats: {e}")
             return []
+    
+    @strawberry.field
+    async def list_chats_page(
+        self,
+        first: int = 20,
+        after: Optional[str] = None,
+        with_total: bool = False
+    ) -> ChatPage:
+        """
+        List chats most recent first, one page at a time.
+        
+        Args:
+            first: Number of chats to return
+            after: end_cursor of the previous page
+            with_total: Also count all chats
+        
+        Returns:
+            ChatPage with the chats and the cursor of the next page
+        """
+        ai_service = AIService()
+        success, page, error = await ai_service.list_chats_page(first=first, after=after, with_total=with_total)
+        
+        if not success:
+            logger.error(f"Error listing chats: {error}")
+            return ChatPage(chats=[], page_info=PageInfo(), error=error)
+        
+        return ChatPage(
+            chats=[chat_info(chat) for chat in page.items],
+            page_info=PageInfo(
+                end_cursor=page.end_cursor,
+                has_next_page=page.has_next_page,
+                total_count=page.total_count
+            )
+        )
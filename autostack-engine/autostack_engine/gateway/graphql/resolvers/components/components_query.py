@@ -12,7 +12,6 @@ from autostack_engine.services.project.services.project import ProjectService
 from autostack_engine.utils.database.models.project.models import Project
 from autostack_engine.utils.database.models.components.models import Component, Connection
 from autostack_engine.utils.database.models.technologies.models import Technology
-from autostack_engine.utils.database.mongo_client import DatabaseManager
 from autostack_engine.utils.project.icon_generator import IdenticonGenerator
 
 logger = structlog.get_logger()
@@ -46,7 +45,7 @@ class ComponentsQuery:
         """Fetch a project by the project ID"""
         try:
             service = ComponentService()
-            result = await service.list_components(project_id=project_id)
+            result = await service.list_component_summaries(project_id=project_id)
             
             if not result:
                 logger.error(f"[GRAPHQL] Components for project with ID '{project_id}' do not exist.")
@@ -63,18 +62,18 @@ class ComponentsQuery:
                 for component in result:
                     try:
                         component_info = ComponentInfo(
-                            component_id=component.component_id,
-                            name=component.name,
-                            framework=component.framework.value if component.framework else None,
-                            technology=component.technology or "",
-                            dependencies=component.dependencies
+                            component_id=component['component_id'],
+                            name=component['name'],
+                            framework=component.get('framework'),
+                            technology=component.get('technology') or "",
+                            dependencies=component.get('dependencies')
                         )
                         component_infos.append(component_info)
-                    except AttributeError as ae:
-                        logger.error(f"[GRAPHQL] Missing attribute in component {component.component_id}: {str(ae)}")
+                    except KeyError as ke:
+                        logger.error(f"[GRAPHQL] Missing field in component {component.get('component_id')}: {str(ke)}")
                         continue
                     except Exception as e:
-                        logger.error(f"[GRAPHQL] Error processing component {component.component_id}: {str(e)}")
+                        logger.error(f"[GRAPHQL] Error processing component {component.get('component_id')}: {str(e)}")
                         continue
                 
                 return ComponentsResponse(
@@ -1,37 +1,22 @@
-from bson import Binary
 import strawberry
-import uuid
 import structlog
-from typing import Any, Dict, Optional, List
+import uuid
+from typing import Optional, List
 from strawberry.scalars import JSON
+from autostack_engine.services.logs.services.logs import LogManagementService
 from autostack_engine.utils.database.models.activities.models import ActivityLog
-from autostack_engine.utils.database.mongo_client import DatabaseManager
+from autostack_engine.utils.database.mongo_client import get_database_manager
+from autostack_engine.utils.database.pagination import paginate
+from autostack_engine.utils.database.serialization import document_to_json
+from autostack_engine.utils.logging.models import LogCategory, LogLevel
 from autostack_engine.utils.schema.models.components import JSON
+from autostack_engine.utils.schema.models.generic import PageInfo
+from autostack_engine.utils.schema.models.logs import LogEntry, LogsPage
 
 logger = structlog.get_logger()
 
 
 
-def serialize_details(details: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-    """Convert Binary and UUID objects to serializable types"""
-    if not details:
-        return None
-    
-    def convert_value(value):
-        if isinstance(value, Binary):
-            # Convert Binary to UUID string
-            return str(uuid.UUID(bytes=bytes(value)))
-        elif isinstance(value, uuid.UUID):
-            return str(value)
-        elif isinstance(value, dict):
-            return {k: convert_value(v) for k, v in value.items()}
-        elif isinstance(value, list):
-            return [convert_value(item) for item in value]
-        else:
-            return value
-    
-    return {k: convert_value(v) for k, v in details.items()}
-
 @strawberry.type
 class ActivityLogResponse:
     activity_type: Optional[str] = None
@@ -41,28 +26,36 @@ class ActivityLogResponse:
     chat_id: Optional[str] = None
     details: Optional[JSON] = None  # type: ignore
 
+@strawberry.type
+class ActivityLogPage:
+    logs: List[ActivityLogResponse]
+    page_info: PageInfo
+    error: Optional[str] = None
+
+# Fields read for ActivityLogResponse
+LOG_FIELDS = ("activity_type", "created_at", "project_id", "project_name", "chat_id", "details")
+
+
 @strawberry.type
 class ActivityLogQuery:
     @strawberry.field
     async def fetch_all_activity_logs(self) -> List[ActivityLogResponse]:
         try:
             
-            db = DatabaseManager()
+            db = get_database_manager()
             await db.connect([ActivityLog])
-            result = await ActivityLog.find_all().sort('-created_at').limit(10).to_list()
+            page = await paginate(
+                ActivityLog,
+                projection={field: 1 for field in LOG_FIELDS},
+                first=10
+            )
+            result = [document_to_json(document) for document in page.items]
             
             if result:
                 log_infos = []
                 
                 for log in result:
-                    log_info = ActivityLogResponse(
-                        activity_type=log.activity_type,
-                        created_at=log.created_at,
-                        project_id=log.project_id,
-                        project_name=log.project_name,
-                        chat_id=log.chat_id,
-                        details=serialize_details(log.details)
-                    )
+                    log_info = ActivityLogResponse(**{field: log.get(field) for field in LOG_FIELDS})
                     log_infos.append(log_info)
                     
                 return log_infos
@@ -72,6 +65,96 @@ class ActivityLogQuery:
         except Exception as e:
             logger.error(f"Error fetching all logs {e}")
             return []
-        
+    
+    @strawberry.field
+    async def fetch_activity_logs_page(
+        self,
+        first: int = 10,
+        after: Optional[str] = None,
+        project_id: Optional[str] = None,
+        with_total: bool = False
+    ) -> ActivityLogPage:
+        """Activity logs newest first; pass the previous page's end_cursor as `after` for the next one"""
+        try:
+            db = get_database_manager()
+            await db.connect([ActivityLog])
+            page = await paginate(
+                ActivityLog,
+                {"project_id": uuid.UUID(project_id)} if project_id else None,
+                projection={field: 1 for field in LOG_FIELDS},
+                first=first,
+                after=after,
+                with_total=with_total
+            )
             
-    
\ No newline at end of file
+            return ActivityLogPage(
+                logs=[
+                    ActivityLogResponse(**{field: log.get(field) for field in LOG_FIELDS})
+                    for log in map(document_to_json, page.items)
+                ],
+                page_info=PageInfo(
+                    end_cursor=page.end_cursor,
+                    has_next_page=page.has_next_page,
+                    total_count=page.total_count
+                )
+            )
+            
+        except Exception as e:
+            logger.error(f"Error fetching activity logs {e}")
+            return ActivityLogPage(logs=[], page_info=PageInfo(), error=str(e))
+    
+    @strawberry.field
+    async def fetch_service_logs_page(
+        self,
+        first: int = 100,
+        after: Optional[str] = None,
+        service_name: Optional[str] = None,
+        log_level: Optional[str] = None,
+        project_id: Optional[str] = None,
+        category: Optional[str] = None,
+        with_total: bool = False
+    ) -> LogsPage:
+        """Service logs newest first, optionally filtered; paged like fetch_activity_logs_page"""
+        try:
+            service = LogManagementService()
+            success, page, error = await service.get_logs_page(
+                first=first,
+                after=after,
+                service_name=service_name,
+                log_level=LogLevel(log_level.upper()) if log_level else None,
+                project_id=project_id,
+                category=LogCategory(category.upper()) if category else None,
+                with_total=with_total
+            )
+        except ValueError as e:
+            success, page, error = False, None, str(e)
+        
+        if not success:
+            logger.error(f"Error fetching service logs {error}")
+            return LogsPage(logs=[], page_info=PageInfo(), error=error)
+        
+        return LogsPage(
+            logs=[
+                LogEntry(
+                    log_id=str(log.log_id),
+                    timestamp=log.timestamp,
+                    service_name=log.service_name,
+                    log_level=log.log_level.value,
+                    category=log.category.value,
+                    message=log.message,
+                    operation=log.operation,
+                    project_id=log.project_id,
+                    component_id=log.component_id,
+                    technology_id=log.technology_id,
+                    duration_ms=log.duration_ms,
+                    error_traceback=log.error_traceback,
+                    request_id=log.request_id
+                )
+                for log in page.items
+            ],
+            page_info=PageInfo(
+                end_cursor=page.end_cursor,
+                has_next_page=page.has_next_page,
+                total_count=page.total_count
+            )
+        )
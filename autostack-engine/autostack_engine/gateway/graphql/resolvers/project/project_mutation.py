@@ -1,4 +1,3 @@
-import asyncio
 from enum import Enum
 import traceback
 import git
@@ -8,9 +7,13 @@ import structlog
 from typing import Any, List, Optional
 
 from autostack_engine.gateway.graphql.resolvers.project.project_query import GitInfo, get_git_info
+from autostack_engine.services.orchestration.service.batch import ManifestService
 from autostack_engine.services.orchestration.service.orchestration import OrchestrationService
 from autostack_engine.services.project.services.project import ProjectService
-from autostack_engine.utils.project.subscription import ProjectCreationStatus, ProjectDeletionStatus
+from autostack_engine.utils.database.models.orchestration.models import OperationCheckpoint
+from autostack_engine.utils.jobs.queue import ORCHESTRATION_QUEUE
+from autostack_engine.utils.orchestration.manifest import parse_manifest
+from autostack_engine.utils.project.subscription import TERMINAL_STATUSES
 from autostack_engine.utils.schema.models.components import ComponentInput, ConnectionInput
 from autostack_engine.utils.schema.models.environments import ProductionResponse
 from autostack_engine.utils.schema.models.generic import DeleteResponse
@@ -49,6 +52,23 @@ class InitiateProjectResponse:
     message: str
     error: Optional[str] = None
   
+@strawberry.type
+class BatchProjectOperation:
+    """A project of a manifest and the operation provisioning it"""
+    name: str
+    operation_id: str
+
+
+@strawberry.type
+class InitiateBatchResponse:
+    """Response when initiating provisioning of a manifest"""
+    success: bool
+    operation_id: str
+    message: str
+    projects: List[BatchProjectOperation] = strawberry.field(default_factory=list)
+    errors: List[str] = strawberry.field(default_factory=list)
+    error: Optional[str] = None
+
 @strawberry.type
 class GitInitialiseResponse:
     success: bool
@@ -61,6 +81,11 @@ def get_operation_store(info: strawberry.Info):
     return info.context["operation_store"]
 
 
+def get_job_dispatcher(info: strawberry.Info):
+    """Get job dispatcher from GraphQL context"""
+    return info.context["job_dispatcher"]
+
+
 @strawberry.type
 class ProjectMutuation:
     @strawberry.mutation
@@ -75,12 +100,13 @@ class ProjectMutuation:
             operation_id = str(uuid.uuid4())
             await operation_store.create_operation(operation_id)
             
-            asyncio.create_task(
-                ProjectMutuation._execute_project_creation(
-                    operation_id,
-                    input,
-                    operation_store
-                )
+            # Provisioning is not idempotent, so a failed creation is not retried
+            await get_job_dispatcher(info).dispatch(
+                ORCHESTRATION_QUEUE,
+                "project.create",
+                operation_id,
+                {"input": ProjectMutuation._project_input_dict(input)},
+                max_attempts=1
             )
             
             return InitiateProjectResponse(
@@ -104,122 +130,250 @@ class ProjectMutuation:
             )
           
     @staticmethod
-    async def _execute_project_creation(
-        operation_id: str,
-        input: FullProjectInput,
-        operation_store  
-    ): 
+    def _project_input_dict(input: FullProjectInput) -> dict:
+        """Convert the Strawberry input to the JSON-safe dict the orchestrator takes"""
+        input_dict = {
+            'project': {
+                'name': input.project.name,
+                'author': input.project.author,
+                'description': input.project.description,
+                'version': input.project.version,
+                'chat_id': input.project.chatId
+            }
+        }
+
+        if input.technologies:
+            input_dict['technologies'] = [
+                {
+                    'name': t.name,
+                    'category': t.category,
+                    'version': t.version,
+                    'enabled': t.enabled,
+                    'port': t.port,
+                    'environment_variables': t.environment_variables,
+                    'configuration': t.configuration
+                }
+                for t in input.technologies
+            ]
+
+        if input.components:
+            input_dict['components'] = [
+                {
+                    'component_id': c.component_id,
+                    'type': c.type,
+                    'name': c.name,
+                    'technology': c.technology,
+                    'framework': c.framework,
+                    'port': c.port,
+                    'environment_variables': c.environment_variables,
+                    'dependencies': c.dependencies or []
+                }
+                for c in input.components
+            ]
+
+        if input.connections:
+            input_dict['connections'] = [
+                {
+                    'source': conn.source,
+                    'target': conn.target,
+                    'type': conn.type,
+                    'port': conn.port
+                }
+                for conn in input.connections
+            ]
+        
+        return serialize_enums(input_dict)
+        
+    @strawberry.mutation
+    async def resume_operation(self, operation_id: str, info: strawberry.Info) -> InitiateProjectResponse:
         """
-        Background task that performs the actual project creation.
-        Updates Redis with progress at each step.
+        Resume a failed project creation. Steps that already completed are
+        skipped; progress is reported under the same operation_id.
         """
+        operation_store = get_operation_store(info)
         
         try:
-            # Step 1: Validating (10%) - kept in mutation
-            await operation_store.update_operation(
+            checkpoint = await OperationCheckpoint.find_one(OperationCheckpoint.operation_id == operation_id)
+            if not checkpoint:
+                return InitiateProjectResponse(
+                    success=False,
+                    operation_id=operation_id,
+                    message="Operation cannot be resumed",
+                    error=f"No checkpoints found for operation '{operation_id}'"
+                )
+            if checkpoint.completed:
+                return InitiateProjectResponse(
+                    success=False,
+                    operation_id=operation_id,
+                    message="Operation cannot be resumed",
+                    error="Operation already completed"
+                )
+            
+            operation = await operation_store.get_operation(operation_id)
+            if operation and operation.status.value not in TERMINAL_STATUSES:
+                return InitiateProjectResponse(
+                    success=False,
+                    operation_id=operation_id,
+                    message="Operation cannot be resumed",
+                    error="Operation is still running"
+                )
+            
+            await operation_store.create_operation(operation_id)
+            await get_job_dispatcher(info).dispatch(
+                ORCHESTRATION_QUEUE,
+                "project.resume",
                 operation_id,
-                ProjectCreationStatus.VALIDATING,
-                "Validating input data and project configuration",
-                10
+                {},
+                max_attempts=1
             )
             
             logger.info(
-                "project_creation_validating",
+                "project_creation_resumed",
                 operation_id=operation_id,
-                project_name=input.project.name
+                failed_step=checkpoint.failed_step
             )
             
-            # Convert Strawberry input to dict
-            input_dict = {
-                'project': {
-                    'name': input.project.name,
-                    'author': input.project.author,
-                    'description': input.project.description,
-                    'version': input.project.version,
-                    'chat_id': input.project.chatId
-                }
-            }
-            
-            if input.technologies:
-                input_dict['technologies'] = [
-                    {
-                        'name': t.name,
-                        'category': t.category,
-                        'version': t.version,
-                        'enabled': t.enabled,
-                        'port': t.port,
-                        'environment_variables': t.environment_variables,
-                        'configuration': t.configuration
-                    }
-                    for t in input.technologies
-                ]
-            
-            if input.components:
-                input_dict['components'] = [
-                    {
-                        'component_id': c.component_id,
-                        'type': c.type,
-                        'name': c.name,
-                        'technology': c.technology,
-                        'framework': c.framework,
-                        'port': c.port,
-                        'environment_variables': c.environment_variables,
-                        'dependencies': c.dependencies or []
-                    }
-                    for c in input.components
-                ]
-            
-            if input.connections:
-                input_dict['connections'] = [
-                    {
-                        'source': conn.source,
-                        'target': conn.target,
-                        'type': conn.type,
-                        'port': conn.port
-                    }
-                    for conn in input.connections
-                ]
-            
-            # Execute orchestration with progress tracking
-            orchestrator = OrchestrationService()
-            success, project_id, error = await orchestrator.orchestrate_full_project(
-                input_dict,
-                operation_store=operation_store,
-                operation_id=operation_id
+            return InitiateProjectResponse(
+                success=True,
+                operation_id=operation_id,
+                message=f"Resuming project creation from step '{checkpoint.failed_step or 'start'}'."
             )
             
-            if success:
-                logger.info(
-                    "project_creation_completed",
+        except Exception as e:
+            logger.error(
+                "project_resume_initiation_failed",
+                error=str(e),
+                traceback=traceback.format_exc()
+            )
+            return InitiateProjectResponse(
+                success=False,
+                operation_id=operation_id,
+                message="Failed to resume project creation",
+                error=str(e)
+            )
+        
+    @strawberry.mutation
+    async def cancel_operation(self, operation_id: str, info: strawberry.Info) -> InitiateProjectResponse:
+        """
+        Cancel a queued or running operation. Running commands are killed,
+        a cancelled project creation is rolled back, and subscribers receive
+        a CANCELLED update once the operation has stopped.
+        """
+        operation_store = get_operation_store(info)
+        
+        try:
+            operation = await operation_store.get_operation(operation_id)
+            if not operation:
+                return InitiateProjectResponse(
+                    success=False,
                     operation_id=operation_id,
-                    project_id=project_id,
-                    project_name=input.project.name
+                    message="Operation cannot be cancelled",
+                    error=f"Operation '{operation_id}' not found"
                 )
-            else:
-                logger.error(
-                    "project_creation_failed",
+            if operation.status.value in TERMINAL_STATUSES:
+                return InitiateProjectResponse(
+                    success=False,
                     operation_id=operation_id,
-                    error=error,
-                    project_name=input.project.name
+                    message="Operation cannot be cancelled",
+                    error=f"Operation already {operation.status.value.lower()}"
                 )
-                
+            
+            await operation_store.request_cancel(operation_id)
+            logger.info("operation_cancel_requested", operation_id=operation_id)
+            
+            return InitiateProjectResponse(
+                success=True,
+                operation_id=operation_id,
+                message="Cancellation requested. Use the operation ID to follow it."
+            )
+            
         except Exception as e:
-            error_msg = str(e)
-            await operation_store.update_operation(
+            logger.error(
+                "operation_cancel_failed",
+                error=str(e),
+                traceback=traceback.format_exc()
+            )
+            return InitiateProjectResponse(
+                success=False,
+                operation_id=operation_id,
+                message="Failed to cancel operation",
+                error=str(e)
+            )
+        
+    @strawberry.mutation
+    async def provision_manifest(self, manifest: str, info: strawberry.Info) -> InitiateBatchResponse:
+        """
+        Provision every project of a YAML or JSON manifest.
+        
+        The whole manifest is validated before anything is created; invalid
+        entries are returned in `errors`. Follow the batch operation_id for
+        aggregate progress, or each project's operation_id for its own.
+        """
+        operation_store = get_operation_store(info)
+        
+        try:
+            parsed, projects, error = parse_manifest(manifest)
+            if not parsed:
+                return InitiateBatchResponse(
+                    success=False,
+                    operation_id="",
+                    message="Invalid manifest",
+                    errors=[error],
+                    error=error
+                )
+            
+            prepared, errors = await ManifestService().prepare_manifest(projects)
+            if errors:
+                return InitiateBatchResponse(
+                    success=False,
+                    operation_id="",
+                    message=f"Manifest has {len(errors)} invalid projects",
+                    errors=errors,
+                    error=errors[0]
+                )
+            
+            operation_id = str(uuid.uuid4())
+            project_operations = [
+                BatchProjectOperation(name=item.name, operation_id=str(uuid.uuid4()))
+                for item in prepared
+            ]
+            for operation in [operation_id] + [item.operation_id for item in project_operations]:
+                await operation_store.create_operation(operation)
+            
+            # Records are inserted by the job, so like single creations it is not retried
+            await get_job_dispatcher(info).dispatch(
+                ORCHESTRATION_QUEUE,
+                "project.batch",
                 operation_id,
-                ProjectCreationStatus.FAILED,
-                "An unexpected error occurred during project creation",
-                100,
-                error=error_msg
+                {
+                    "projects": projects,
+                    "project_operation_ids": [item.operation_id for item in project_operations]
+                },
+                max_attempts=1
             )
             
-            logger.error(
-                "project_creation_exception",
+            logger.info("manifest_provisioning_initiated", operation_id=operation_id, projects=len(projects))
+            
+            return InitiateBatchResponse(
+                success=True,
                 operation_id=operation_id,
-                error=error_msg,
+                message=f"Provisioning of {len(projects)} projects initiated. Use the operation ID to track progress.",
+                projects=project_operations
+            )
+            
+        except Exception as e:
+            logger.error(
+                "manifest_provisioning_initiation_failed",
+                error=str(e),
                 traceback=traceback.format_exc()
             )
-    
+            return InitiateBatchResponse(
+                success=False,
+                operation_id="",
+                message="Failed to initiate manifest provisioning",
+                error=str(e)
+            )
+        
     @strawberry.mutation
     async def create_full_project(self, input: FullProjectInput) -> ProjectResponse:
         """
@@ -408,13 +562,11 @@ class ProjectMutuation:
                 project_name=project_name
             )
             
-            asyncio.create_task(
-                self._execute_project_deletion(
-                    operation_id,
-                    project_id,
-                    project_name,
-                    operation_store
-                )
+            await get_job_dispatcher(info).dispatch(
+                ORCHESTRATION_QUEUE,
+                "project.delete",
+                operation_id,
+                {"project_id": project_id, "project_name": project_name}
             )
             
             return InitiateProjectResponse(
@@ -437,57 +589,6 @@ class ProjectMutuation:
             )
 
 
-    async def _execute_project_deletion(
-        self,
-        operation_id: str,
-        project_id: str,
-        project_name: str,
-        operation_store  
-    ):
-        try:
-            await operation_store.update_operation(
-                operation_id,
-                ProjectDeletionStatus.DELETING_PROJECT,
-                f"Searching for {project_name} to delete",
-                10
-            )
-            
-            service = ProjectService()
-            success, error = await service.delete_project(project_id, True)
-            
-            if success:
-                await operation_store.update_operation(
-                    operation_id,
-                    ProjectDeletionStatus.COMPLETED,
-                    f"Successfully deleted project: {project_name}",
-                    100
-                )
-            else:
-                await operation_store.update_operation(
-                    operation_id,
-                    ProjectDeletionStatus.FAILED,
-                    f"Error deleting project: {project_name}",
-                    100,
-                    error=error
-                )
-                
-        except Exception as e:
-            error_msg = str(e)
-            await operation_store.update_operation(
-                operation_id,
-                ProjectDeletionStatus.FAILED,
-                "An unexpected error occurred during project deletion",
-                100,
-                error=error_msg
-            )
-            
-            logger.error(
-                "project_deletion_exception",
-                operation_id=operation_id,
-                error=error_msg,
-                traceback=traceback.format_exc()
-            )
-        
     @strawberry.mutation
     async def delete_project(
         self, 
@@ -12,11 +12,14 @@ import os
 
 from autostack_engine.services.environment.services.production import ProductionService
 from autostack_engine.services.project.services.project import ProjectService
-from autostack_engine.utils.database.models.project.models import Project
+from autostack_engine.utils.database.models.project.models import Project, ProjectManager
 from autostack_engine.utils.database.models.components.models import Component, Connection
 from autostack_engine.utils.database.models.technologies.models import Technology
-from autostack_engine.utils.database.mongo_client import DatabaseManager
-from autostack_engine.utils.project.icon_generator import IdenticonGenerator
+from autostack_engine.utils.database.mongo_client import get_database_manager
+from autostack_engine.utils.orchestration.timings import TimingHistory
+from autostack_engine.utils.project.avatars import avatar_url
+from autostack_engine.utils.schema.models.generic import PageInfo
+from autostack_engine.utils.schema.models.orchestration import FrameworkTimingStat, ProvisioningTimeReport, StepTimingStat
 
 logger = structlog.get_logger()
 
@@ -44,12 +47,20 @@ class ProjectInfo:
     description: Optional[str] = None
     version: str = "1.0.0"
     status: Optional[str] = "created"
-    avatar_data_url: str
+    avatar_data_url: str  # Same as avatar_url, kept for existing clients
     avatar_hash: Optional[str]
+    avatar_url: Optional[str] = None
     metadata: Optional[ProjectMetadata] = None
     git_info: Optional[GitInfo] = None
     
 
+@strawberry.type
+class ProjectPage:
+    projects: List[ProjectInfo]
+    page_info: PageInfo
+    error: Optional[str] = None
+
+
 @strawberry.type
 class ProjectArchitectureResponse:
     success: bool
@@ -89,6 +100,22 @@ def get_git_info(directory: Optional[str]) -> Optional[GitInfo]:
         logger.error(f"Error reading Git repository at {directory}: {e}")
         return None
 
+def project_info(project: Project) -> ProjectInfo:
+    """ProjectInfo of a project in a list, with its git info"""
+    return ProjectInfo(
+        id=project.id,
+        name=project.name,
+        author=project.author,
+        description=project.description,
+        version=project.version,
+        status=project.status.value if project.status else "created",
+        metadata=project.metadata,
+        git_info=get_git_info(project.metadata.directory if project.metadata else None),
+        avatar_data_url=avatar_url(project.avatar_hash) or "",
+        avatar_hash=project.avatar_hash,
+        avatar_url=avatar_url(project.avatar_hash)
+    )
+
 @strawberry.type
 class ProjectQuery:
     @strawberry.field
@@ -129,59 +156,65 @@ class ProjectQuery:
             status=result.status.value if hasattr(result.status, 'value') else result.status,
             metadata=metadata,
             git_info=git_info,
-            avatar_data_url=IdenticonGenerator.base64_to_data_url(result.avatar_data),
-            avatar_hash=result.avatar_hash
+            avatar_data_url=avatar_url(result.avatar_hash) or "",
+            avatar_hash=result.avatar_hash,
+            avatar_url=avatar_url(result.avatar_hash)
         )
         
     @strawberry.field
     async def fetch_all_projects() -> List[Optional[ProjectInfo]]:
+        """The four most recent projects"""
         try:
             service = ProjectService()
-            result = await service.list_projects()
-            
-            if isinstance(result, tuple) and len(result) == 2:
-                success, projects_or_error = result
-                if success:
-                    projects = projects_or_error
-                else:
-                    logger.error(f"Error listing projects: {projects_or_error}")
-                    return []
-            else:
-                projects = result
+            success, page, error = await service.list_projects_page(first=4)
             
-            if projects:
-                project_infos = []
-                count = 0
-                for project in projects:
-                    
-                    git_info = get_git_info(project.metadata.directory)
-                    
-                    project_info = ProjectInfo(
-                        id=project.id,
-                        name=project.name,
-                        author=project.author,
-                        description=project.description,
-                        version=project.version,
-                        status=project.status.value if project.status else "created",
-                        metadata=project.metadata,
-                        git_info=git_info,
-                        avatar_data_url=IdenticonGenerator.base64_to_data_url(project.avatar_data),
-                        avatar_hash=project.avatar_hash
-                    )
-                    project_infos.append(project_info)
-                    count += 1
-                    
-                    if count == 4:
-                        break
-                
-                return project_infos
-            else:
+            if not success:
+                logger.error(f"Error listing projects: {error}")
                 return []
+            
+            return [project_info(project) for project in page.items]
                 
         except Exception as e:
             logger.error(f"Error fetching all projects: {e}")
             return []
+    
+    @strawberry.field
+    async def fetch_projects_page(
+        self,
+        first: int = 20,
+        after: Optional[str] = None,
+        with_total: bool = False
+    ) -> ProjectPage:
+        """Projects newest first; pass the previous page's end_cursor as `after` for the next one"""
+        service = ProjectService()
+        success, page, error = await service.list_projects_page(first=first, after=after, with_total=with_total)
+        
+        if not success:
+            logger.error(f"Error listing projects: {error}")
+            return ProjectPage(projects=[], page_info=PageInfo(), error=error)
+        
+        return ProjectPage(
+            projects=[project_info(project) for project in page.items],
+            page_info=PageInfo(
+                end_cursor=page.end_cursor,
+                has_next_page=page.has_next_page,
+                total_count=page.total_count
+            )
+        )
         
+    @strawberry.field
+    async def provisioning_time_report(self, days: int = 30) -> ProvisioningTimeReport:
+        """Which provisioning steps and frameworks took the most time over the last `days`"""
+        report = await TimingHistory().report(days)
+        return ProvisioningTimeReport(
+            days=report["days"],
+            runs=report["runs"],
+            failed=report["failed"],
+            total_ms=report["total_ms"],
+            steps=[StepTimingStat(**row) for row in report["steps"]],
+            frameworks=[FrameworkTimingStat(**row) for row in report["frameworks"]]
+        )
+    
     @strawberry.field
     async def fetch_project_architecture(self, project_id: str) -> ProjectArchitectureResponse:
         """
@@ -189,30 +222,32 @@ class ProjectQuery:
         Returns consolidated JSON format for C4 diagram generation
         """
         try:
-            db = DatabaseManager()
+            db = get_database_manager()
             await db.connect([Project, Connection, Component, Technology])
-            project = await Project.get(project_id)
+            graph = await ProjectManager.get_project_graph_raw(
+                uuid.UUID(project_id),
+                include=("technologies", "components", "connections")
+            )
             
-            if not project:
+            if not graph:
                 return ProjectArchitectureResponse(
                     success=False,
                     error="Project not found",
                     message=f"No project found with ID: {project_id}"
                 )
             
-            # Build technologies list
-            technologies = await Technology.find({'project_id': uuid.UUID(project_id)}).to_list()
-            components = await Component.find({'project_id': uuid.UUID(project_id)}).to_list()
-            connections = await Connection.find({'project_id': uuid.UUID(project_id)}).to_list()
-            
+            project = graph["project"]
+            technologies = graph["technologies"]
+            components = graph["components"]
+            connections = graph["connections"]
             
             # Consolidated architecture data
             architecture_data = {
                 "project_id": project_id,
-                "project_name": getattr(project, 'name', project_id),
-                "technologies": [tech.model_dump(mode='json') for tech in technologies],
-                "components": [comp.model_dump(mode='json') for comp in components],
-                "connections": [conn.model_dump(mode='json') for conn in connections],
+                "project_name": project.get('name', project_id),
+                "technologies": technologies,
+                "components": components,
+                "connections": connections,
                 "metadata": {
                     "component_count": len(components),
                     "connection_count": len(connections),
@@ -237,7 +272,7 @@ class ProjectQuery:
     @strawberry.field
     async def fetch_production_environment(self, project_id: str) -> ProjectArchitectureResponse:
         try:
-            db = DatabaseManager()
+            db = get_database_manager()
             await db.connect([Project, Connection, Component, Technology])
             project = await Project.get(project_id)
             
@@ -1,9 +1,14 @@
 import traceback
 import strawberry
 from strawberry.types import Info
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
-from autostack_engine.utils.project.subscription import ProjectCreationStatus, ProjectCreationUpdate
+from autostack_engine.utils.project.subscription import (
+    TERMINAL_STATUSES,
+    OperationOutputLine,
+    ProjectCreationStatus,
+    ProjectCreationUpdate,
+)
 from autostack_engine.gateway.graphql.resolvers.ai.ai_query import JobResult
 import logging
 logger = logging.getLogger(__name__)
@@ -20,14 +25,15 @@ class ProjectSubscription:
     async def project_creation_status(
         self,
         operation_id: str,
-        info: Info
+        info: Info,
+        last_event_id: Optional[str] = None
     ) -> AsyncGenerator[ProjectCreationUpdate, None]:
-        
+        """Progress of a project operation; pass the last received event_id to resume after a reconnect"""
         operation_store = get_operation_store(info)
         
         # Subscribe to updates from Redis
         try:
-            queue = await operation_store.subscribe(operation_id)
+            queue = await operation_store.subscribe(operation_id, last_event_id)
         except Exception as e:
             logger.error(f"Failed to subscribe to operation {operation_id}: {e}")
             # Yield an error status instead of failing
@@ -45,11 +51,8 @@ class ProjectSubscription:
             async for update in ProjectSubscription._stream_updates(queue, operation_id):
                 yield update
                 
-                # Stop after completion or failure
-                if update.status in [
-                    ProjectCreationStatus.COMPLETED,
-                    ProjectCreationStatus.FAILED
-                ]:
+                # Stop after completion, failure or cancellation
+                if update.status.value in TERMINAL_STATUSES:
                     logger.info(f"Operation {operation_id} finished with status: {update.status}")
                     break
                     
@@ -82,56 +85,82 @@ class ProjectSubscription:
             except Exception as e:
                 logger.warning(f"Error during subscription cleanup for {operation_id}: {e}")
     
+    @strawberry.subscription
+    async def operation_output(
+        self,
+        operation_id: str,
+        info: Info
+    ) -> AsyncGenerator[OperationOutputLine, None]:
+        """Live stdout/stderr of the commands an operation runs (devbox, npx, pip)"""
+        operation_store = get_operation_store(info)
+        
+        try:
+            queue = await operation_store.subscribe_output(operation_id)
+        except Exception as e:
+            logger.error(f"Failed to subscribe to output of operation {operation_id}: {e}")
+            return
+        
+        try:
+            while True:
+                line = await queue.get()
+                if line is None:
+                    break
+                yield line
+        except GeneratorExit:
+            logger.info(f"Output subscription for {operation_id} closed by client")
+        except Exception as e:
+            error_str = str(e).lower()
+            if "disconnect" not in error_str and "closed" not in error_str:
+                logger.error(f"Error in output subscription {operation_id}: {e}")
+        finally:
+            try:
+                await operation_store.cleanup_output(queue)
+            except Exception as e:
+                logger.warning(f"Error during output subscription cleanup for {operation_id}: {e}")
+    
     @strawberry.subscription
     async def subscribe_to_job(
         self,
         job_id: str,
-        info: Info
+        info: Info,
+        last_event_id: Optional[str] = None
     ) -> AsyncGenerator[JobResult, None]:
-        import json
+        """Status of an AI job; pass the last received event_id to resume after a reconnect"""
         from datetime import datetime
         
         operation_store = get_operation_store(info)
         
         try:
-            queue = await operation_store.subscribe(job_id)
+            queue = await operation_store.subscribe(job_id, last_event_id)
         except Exception as e:
             logger.error(f"Failed to subscribe to job {job_id}: {e}")
             yield JobResult(
                 id=job_id,
                 status="FAILED",
                 error=str(e),
-                createdAt=datetime.now().isoformat()
+                created_at=datetime.now().isoformat()
             )
             return
 
         try:
-            # We need to adapt the ProjectCreationUpdate from the operation store to JobResult
+            # Updates carry timestamps and, on the terminal one, the result,
+            # so nothing has to be read back from Redis
             async for update in ProjectSubscription._stream_updates(queue, job_id):
-                # Retrieve the full data from Redis to get the 'result' field if it exists
-                key = f"operation:{job_id}"
-                raw_data = await operation_store.redis.hgetall(key)
-                
-                result_data = None
-                if b'result' in raw_data:
-                    try:
-                        result_data = json.loads(raw_data[b'result'].decode())
-                    except:
-                        pass
+                result_data = update.result
+                if result_data is None and update.result_key:
+                    result_data = await operation_store.load_result(update.result_key)
 
                 yield JobResult(
                     id=job_id,
                     status=update.status.value if hasattr(update.status, 'value') else str(update.status),
                     result=result_data,
                     error=update.error,
-                    created_at=raw_data[b'created_at'].decode() if b'created_at' in raw_data else datetime.now().isoformat(),
-                    completed_at=raw_data[b'updated_at'].decode() if b'updated_at' in raw_data else None
+                    created_at=update.created_at or datetime.now().isoformat(),
+                    completed_at=update.updated_at,
+                    event_id=update.event_id
                 )
                 
-                if update.status in [
-                    ProjectCreationStatus.COMPLETED,
-                    ProjectCreationStatus.FAILED
-                ]:
+                if update.status.value in TERMINAL_STATUSES:
                     break
         except GeneratorExit:
             logger.info(f"Job subscription for {job_id} closed by client")
@@ -1,13 +1,20 @@
 from fastapi import FastAPI, HTTPException, Request
+from starlette.requests import HTTPConnection
 from fastapi.middleware.cors import CORSMiddleware
 import strawberry
 from strawberry.fastapi import GraphQLRouter
 import logging
 from contextlib import asynccontextmanager
+from autostack_engine.gateway.avatars import router as avatars_router
 from autostack_engine.gateway.graphql.schema import Mutation, Query, Subscription
-from autostack_engine.utils.project.subscription import RedisOperationStore
+from autostack_engine.utils.database.mongo_client import get_database_manager
+from autostack_engine.utils.jobs.dispatch import JobDispatcher, job_execution_mode
+from autostack_engine.utils.jobs.queue import RedisJobQueue
+from autostack_engine.utils.logging.sink import get_log_sink
+from autostack_engine.utils.orchestration.models import user_id_var
+from autostack_engine.utils.project.coalescing import CoalescingOperationStore
+from autostack_engine.utils.project.subscription import create_operation_store
 from dotenv import load_dotenv
-import os
 from typing import Optional, Any
 
 load_dotenv()
@@ -16,42 +23,82 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Global reference to the operation store
-_operation_store: Optional[RedisOperationStore] = None
+_operation_store: Optional[CoalescingOperationStore] = None
+_job_dispatcher: Optional[JobDispatcher] = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage Redis store lifecycle"""
-    global _operation_store
+    """Manage operation store, job queue and MongoDB client lifecycle"""
+    global _operation_store, _job_dispatcher
     
-    store = RedisOperationStore(
-        redis_url=f'redis://{os.getenv("REDIS_USER")}:{os.getenv("REDIS_PASSWORD")}@{os.getenv("REDIS_HOST")}:6379/0',
-        max_connections=2000,
-        operation_ttl=3600
-    )
+    # Startup: one pooled MongoDB client with every document model registered
+    db = get_database_manager()
+    try:
+        await db.connect_all()
+        app.state.database = db
+        logger.info(f"MongoDB initialized with {len(db.initialized_models)} document models")
+    except Exception as e:
+        logger.error(f"Failed to initialize MongoDB: {e}")
+        raise
+    
+    store = create_operation_store(operation_ttl=3600)
     try:
         await store.initialize()
-        _operation_store = store
-        app.state.operation_store = store
-        logger.info("Redis operation store initialized successfully")
+        # Progress updates and command output are merged per window before they reach the store
+        _operation_store = CoalescingOperationStore(store)
+        app.state.operation_store = _operation_store
+        logger.info(f"{type(store).__name__} initialized successfully")
     except Exception as e:
-        logger.error(f"Failed to initialize Redis: {e}")
+        logger.error(f"Failed to initialize operation store: {e}")
         raise
     
+    # Provisioning and AI jobs run on worker processes unless configured inline
+    job_queue = None
+    if job_execution_mode() == "queue":
+        job_queue = RedisJobQueue()
+        try:
+            await job_queue.initialize()
+        except Exception as e:
+            logger.error(f"Failed to initialize job queue: {e}")
+            raise
+    _job_dispatcher = JobDispatcher(_operation_store, job_queue)
+    await _job_dispatcher.start()
+    logger.info(f"Jobs run {'on workers' if job_queue else 'inline'}")
+    
     yield
     
-    # Shutdown: Close Redis connections
+    # Shutdown: stop dispatching, flush pending updates and close the store
     logger.info("Shutting down application...")
+    await _job_dispatcher.close()
+    _job_dispatcher = None
+    await _operation_store.close()
     await store.close()
     _operation_store = None
-    logger.info("Redis connections closed")
+    logger.info("Operation store closed")
+    
+    # Flush batched service logs before the MongoDB client goes away
+    await get_log_sink().close()
+    logger.info("Service log sink flushed")
+    
+    await db.disconnect()
+    logger.info("MongoDB connections closed")
 
-async def get_context() -> dict:
+async def get_context(connection: HTTPConnection) -> dict:
     """
-    Context getter for GraphQL - injects operation_store into resolvers.
+    Context getter for GraphQL - injects operation_store, the job dispatcher
+    and the shared database manager into resolvers.
     This function is called for every GraphQL request.
+    
+    The caller's X-User-Id header (set by the fronting proxy) identifies the
+    user jobs are queued for, so admission can share capacity fairly.
     """
+    user_id = connection.headers.get("x-user-id")
+    user_id_var.set(user_id)
     return {
-        "operation_store": _operation_store
+        "operation_store": _operation_store,
+        "job_dispatcher": _job_dispatcher,
+        "database": get_database_manager(),
+        "user_id": user_id
     }
 
 app = FastAPI(
@@ -73,6 +120,7 @@ graphql_app = GraphQLRouter(
     ]
 )
 app.include_router(graphql_app)
+app.include_router(avatars_router)
 
 # Add CORS middleware
 app.add_middleware(
@@ -85,4 +133,15 @@ app.add_middleware(
 
 @app.get("/")
 async def root():
-    return {"message": "Microservices API Gateway", "version": "1.0.0"}
\ No newline at end of file
+    return {"message": "Microservices API Gateway", "version": "1.0.0"}
+
+@app.get("/metrics")
+async def metrics():
+    """Connection pool, log sink, subscription and job queue counters"""
+    return {
+        "mongodb": get_database_manager().pool_stats(),
+        "log_sink": get_log_sink().metrics(),
+        "subscriptions": _operation_store.subscription_stats() if _operation_store else None,
+        "operation_updates": _operation_store.stats() if _operation_store else None,
+        "jobs": await _job_dispatcher.stats() if _job_dispatcher else None
+    }
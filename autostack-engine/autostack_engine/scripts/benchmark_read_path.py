@@ -0,0 +1,131 @@
+# autostack_engine/scripts/benchmark_read_path.py
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+import uuid
+from typing import Awaitable, Callable, List
+
+from dotenv import load_dotenv
+
+from autostack_engine.utils.database.models.components.models import (
+    Component,
+    ComponentType,
+    Connection,
+    Environment,
+    Framework,
+)
+from autostack_engine.utils.database.models.project.models import Project, ProjectManager
+from autostack_engine.utils.database.models.technologies.models import Technology
+from autostack_engine.utils.database.mongo_client import get_database_manager
+from autostack_engine.utils.database.serialization import find_raw
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+ARCHITECTURE = ("technologies", "components", "connections")
+FRAMEWORKS = [Framework.FASTAPI, Framework.EXPRESS, Framework.DJANGO, Framework.NESTJS]
+
+
+async def seed_project(component_count: int) -> Project:
+    """A throwaway project with component_count components, each connected to the previous one"""
+    project = Project(name=f"benchmark-{uuid.uuid4().hex[:8]}", description="Read path benchmark")
+    await project.insert()
+
+    await Technology.insert_many([
+        Technology(project_id=project.id, name=name, port=port)
+        for name, port in (("postgresql", 5432), ("redis", 6379), ("node", None), ("python", None))
+    ])
+    components = [
+        Component(
+            project_id=project.id,
+            component_id=f"service-{index}",
+            type=ComponentType.API,
+            name=f"Service {index}",
+            technology="python",
+            framework=FRAMEWORKS[index % len(FRAMEWORKS)],
+            port=8000 + index,
+            environment_variables={"LOG_LEVEL": "info", "SERVICE_INDEX": str(index)},
+            dependencies=[f"service-{index - 1}"] if index else [],
+            directory=f"services/service-{index}"
+        )
+        for index in range(component_count)
+    ]
+    await Component.insert_many(components)
+    await Connection.insert_many([
+        Connection(project_id=project.id, source=comp.component_id, target=comp.dependencies[0], port=comp.port)
+        for comp in components if comp.dependencies
+    ])
+    return project
+
+
+async def architecture_models(project_id: uuid.UUID):
+    graph = await ProjectManager.get_project_graph(project_id, include=ARCHITECTURE)
+    return {name: [doc.model_dump(mode='json') for doc in graph[name]] for name in ARCHITECTURE}
+
+
+async def architecture_raw(project_id: uuid.UUID):
+    return await ProjectManager.get_project_graph_raw(project_id, include=ARCHITECTURE)
+
+
+async def components_models(project_id: uuid.UUID):
+    return await Component.find({"project_id": project_id}).to_list()
+
+
+async def components_raw(project_id: uuid.UUID):
+    return await find_raw(
+        Component,
+        {"project_id": project_id},
+        projection={"component_id": 1, "name": 1, "framework": 1, "technology": 1, "dependencies": 1}
+    )
+
+
+async def measure(read: Callable[[uuid.UUID], Awaitable], project_id: uuid.UUID, iterations: int) -> List[float]:
+    await read(project_id)  # warm up the connection and the server's cache
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await read(project_id)
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def benchmark(component_count: int, iterations: int):
+    db = get_database_manager()
+    await db.connect([Project, Technology, Component, Connection, Environment])
+
+    project = await seed_project(component_count)
+    logger.info(f"Seeded project {project.name} with {component_count} components")
+    try:
+        for label, current, fast in (
+            ("architecture", architecture_models, architecture_raw),
+            ("components", components_models, components_raw),
+        ):
+            before = await measure(current, project.id, iterations)
+            after = await measure(fast, project.id, iterations)
+            logger.info(
+                f"{label:<14} models: mean {statistics.mean(before):7.2f} ms, p50 {statistics.median(before):7.2f} ms | "
+                f"raw: mean {statistics.mean(after):7.2f} ms, p50 {statistics.median(after):7.2f} ms | "
+                f"{statistics.mean(before) / statistics.mean(after):.1f}x"
+            )
+    finally:
+        await ProjectManager.delete_project_cascade(project.id)
+        await db.disconnect()
+
+
+def main():
+    """Main entry point for the benchmark-read-path script"""
+    parser = argparse.ArgumentParser(
+        description="Compare model-validated and raw reads of a project's architecture and components"
+    )
+    parser.add_argument("--components", type=int, default=150, help="Components in the seeded project")
+    parser.add_argument("--iterations", type=int, default=50, help="Timed reads per path")
+    args = parser.parse_args()
+
+    asyncio.run(benchmark(args.components, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
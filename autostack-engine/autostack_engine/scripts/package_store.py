@@ -0,0 +1,64 @@
+# autostack_engine/scripts/package_store.py
+import argparse
+import asyncio
+import json
+import logging
+import shutil
+import sys
+
+from dotenv import load_dotenv
+
+from autostack_engine.utils.packages.store import get_package_store
+from autostack_engine.utils.process.runner import run_command
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def verify_npm_cache() -> bool:
+    """Let npm check (and repair) the shared cache instead of wiping it"""
+    store = get_package_store()
+    if not shutil.which("npm"):
+        logger.warning("npm not found on PATH, skipping npm cache verification")
+        return True
+
+    result = await run_command(["npm", "cache", "verify"], env=store.node_env(), label="npm-cache")
+    if not result.ok:
+        logger.error(f"npm cache verify failed: {result.stderr}")
+    return result.ok
+
+
+def main():
+    """Main entry point for the package-store script"""
+    parser = argparse.ArgumentParser(description="Maintain the shared package store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    gc_parser = subparsers.add_parser("gc", help="Remove entries not used recently and unlinked objects")
+    gc_parser.add_argument("--max-age-days", type=float, default=30, help="Keep entries used within this many days")
+
+    verify_parser = subparsers.add_parser("verify", help="Check store integrity and drop broken entries")
+    verify_parser.add_argument("--deep", action="store_true", help="Re-hash every object")
+
+    subparsers.add_parser("stats", help="Show store size and entry counts")
+
+    args = parser.parse_args()
+    store = get_package_store()
+
+    if args.command == "gc":
+        result = store.gc(args.max_age_days)
+        logger.info(
+            f"Removed {result['manifests']} manifests, {result['objects']} objects "
+            f"({result['bytes'] / 1024 ** 2:.1f} MiB) and {result['wheels']} wheels"
+        )
+    elif args.command == "verify":
+        result = store.verify(deep=args.deep)
+        logger.info(f"Checked {result['manifests']} manifests, removed {result['broken']} broken")
+        if not asyncio.run(verify_npm_cache()):
+            sys.exit(1)
+    else:
+        print(json.dumps(store.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# autostack_engine/scripts/provision_manifest.py
+import argparse
+import asyncio
+import logging
+import sys
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from autostack_engine.services.orchestration.service.batch import ManifestService
+from autostack_engine.utils.database.mongo_client import get_database_manager
+from autostack_engine.utils.logging.sink import get_log_sink
+from autostack_engine.utils.orchestration.admission import get_admission_controller
+from autostack_engine.utils.orchestration.manifest import parse_manifest
+from autostack_engine.utils.project.subscription import create_operation_store
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROGRESS_INTERVAL = 2
+
+
+async def follow_progress(operation_store, operation_id: str):
+    """Log the batch operation's aggregate progress whenever it changes"""
+    last = None
+    while True:
+        await asyncio.sleep(PROGRESS_INTERVAL)
+        operation = await operation_store.get_operation(operation_id)
+        if operation and (operation.progress, operation.message) != last:
+            last = (operation.progress, operation.message)
+            logger.info(f"[{operation.progress:3d}%] {operation.message}")
+
+
+async def provision_manifest(manifest_path: Path, dry_run: bool, parallel: Optional[int]) -> int:
+    """Validate and provision a manifest; returns the number of failed projects"""
+    parsed, projects, error = parse_manifest(manifest_path.read_text())
+    if not parsed:
+        logger.error(error)
+        return 1
+
+    db = get_database_manager()
+    await db.connect_all()
+    service = ManifestService(db)
+
+    try:
+        if dry_run:
+            prepared, errors = await service.prepare_manifest(projects)
+            for message in errors:
+                logger.error(message)
+            if not errors:
+                logger.info(f"Manifest is valid: {', '.join(item.name for item in prepared)}")
+            return len(errors)
+
+        if parallel:
+            get_admission_controller().max_concurrent = parallel
+
+        # Operations go to the configured store, so the UI can follow them too
+        operation_store = create_operation_store(operation_ttl=3600)
+        await operation_store.initialize()
+        try:
+            operation_id = str(uuid.uuid4())
+            project_operation_ids = [str(uuid.uuid4()) for _ in projects]
+            for operation in [operation_id] + project_operation_ids:
+                await operation_store.create_operation(operation)
+            logger.info(f"Provisioning {len(projects)} projects as operation {operation_id}")
+
+            progress = asyncio.create_task(follow_progress(operation_store, operation_id))
+            try:
+                success, results, error = await service.provision_manifest(
+                    projects,
+                    operation_store=operation_store,
+                    operation_id=operation_id,
+                    project_operation_ids=project_operation_ids
+                )
+            finally:
+                progress.cancel()
+
+            if not results:
+                logger.error(error)
+                return len(projects)
+
+            for result in results:
+                if result["success"]:
+                    logger.info(f"✓ {result['name']}: {result['project_id']}")
+                else:
+                    logger.error(f"✗ {result['name']} (operation {result['operation_id']}): {result['error']}")
+            return sum(1 for result in results if not result["success"])
+        finally:
+            await operation_store.close()
+
+    finally:
+        await get_log_sink().close()
+        await db.disconnect()
+
+
+def main():
+    """Main entry point for the provision-manifest script"""
+    parser = argparse.ArgumentParser(description="Provision every project of a YAML or JSON manifest")
+    parser.add_argument("manifest", help="Manifest file: a 'projects' list, a list of projects or one project")
+    parser.add_argument("--dry-run", action="store_true", help="Only validate the manifest")
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=None,
+        help="Projects provisioned at once (default: ADMISSION_MAX_CONCURRENT)"
+    )
+    args = parser.parse_args()
+
+    manifest_path = Path(args.manifest)
+    if not manifest_path.is_file():
+        parser.error(f"Manifest not found: {manifest_path}")
+
+    failures = asyncio.run(provision_manifest(manifest_path, args.dry_run, args.parallel))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# autostack_engine/scripts/run_worker.py
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import signal
+
+from dotenv import load_dotenv
+
+from autostack_engine.utils.jobs.queue import parse_queues
+from autostack_engine.utils.jobs.worker import JobWorker
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def run_worker(queues: dict[str, int]):
+    """Run one worker process until it is signalled to stop"""
+    asyncio.run(JobWorker(queues).run())
+
+
+def main():
+    """Main entry point for the worker script"""
+    parser = argparse.ArgumentParser(description="Run background jobs (project provisioning, AI generation)")
+    parser.add_argument("--processes", type=int, default=1, help="Number of worker processes")
+    parser.add_argument(
+        "--queues",
+        default=None,
+        help="Queues and per-process concurrency, e.g. 'orchestration:2,ai:4' (default: JOB_QUEUES)"
+    )
+    args = parser.parse_args()
+
+    queues = parse_queues(args.queues)
+    if args.processes <= 1:
+        run_worker(queues)
+        return
+
+    logger.info(f"Starting {args.processes} worker processes for {queues}")
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(queues,), name=f"worker-{i}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+
+    def forward(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# autostack_engine/scripts/warm_scaffold_cache.py
+import argparse
+import asyncio
+import logging
+import os
+import shutil
+import sys
+import uuid
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from autostack_engine.services.component.services.components import CACHEABLE_FRAMEWORKS, ComponentService
+from autostack_engine.utils.database.models.components.models import Component, ComponentType, Framework
+from autostack_engine.utils.devbox.planner import get_devbox_planner
+from autostack_engine.utils.scaffold.cache import SKELETON_NAME, get_scaffold_cache
+
+load_dotenv()
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FRONTEND_FRAMEWORKS = {Framework.REACT, Framework.NEXTJS, Framework.ANGULAR, Framework.VUE, Framework.SVELTE}
+
+
+async def prepare_project(project_dir: Path, packages: list[str]) -> bool:
+    """Create a throwaway devbox project to scaffold skeletons in"""
+    project_dir.mkdir(parents=True, exist_ok=True)
+
+    if not shutil.which("devbox"):
+        logger.error("devbox command not found")
+        return False
+
+    planner = get_devbox_planner(str(project_dir))
+    planner.add(packages)
+    success, error = await planner.wait()
+    if not success:
+        logger.error(error)
+        return False
+
+    return True
+
+
+async def warm_scaffold_cache(frameworks: list[Framework], project_dir: Path, packages: list[str]) -> int:
+    """Scaffold and capture a skeleton for each framework; returns the number of failures"""
+    if not await prepare_project(project_dir, packages):
+        return len(frameworks)
+
+    service = ComponentService()
+    failures = 0
+
+    for framework in frameworks:
+        component = Component.model_construct(
+            id=uuid.uuid4(),
+            project_id=uuid.uuid4(),
+            component_id=SKELETON_NAME,
+            type=ComponentType.WEB if framework in FRONTEND_FRAMEWORKS else ComponentType.API,
+            name=SKELETON_NAME,
+            technology="nodejs",
+            framework=framework
+        )
+
+        logger.info(f"Warming {framework.value} skeleton...")
+        success, error = await service.warm_scaffold_cache(project_dir, component)
+        if success:
+            logger.info(f"✓ {framework.value}")
+        else:
+            failures += 1
+            logger.error(f"✗ {framework.value}: {error}")
+
+    stats = get_scaffold_cache().stats()
+    logger.info(
+        f"Scaffold cache at {stats['root']}: {stats['entries']} skeletons, "
+        f"{stats['size_bytes'] / 1024 ** 2:.1f} MiB of {stats['max_bytes'] / 1024 ** 2:.0f} MiB"
+    )
+    return failures
+
+
+def main():
+    """Main entry point for the warm-scaffold-cache script"""
+    parser = argparse.ArgumentParser(description="Pre-build framework skeletons for the scaffold cache")
+    parser.add_argument(
+        "frameworks",
+        nargs="*",
+        help=f"Frameworks to warm (default: all of {', '.join(sorted(f.value for f in CACHEABLE_FRAMEWORKS))})"
+    )
+    parser.add_argument(
+        "--project-dir",
+        default=os.getenv("AUTOSTACK_SCAFFOLD_WARM_DIR", str(get_scaffold_cache().root.parent / "warm")),
+        help="devbox project used to run the framework CLIs"
+    )
+    parser.add_argument(
+        "--package",
+        action="append",
+        dest="packages",
+        help="devbox package for the toolchain (repeatable, default: nodejs@latest)"
+    )
+    args = parser.parse_args()
+
+    try:
+        frameworks = [Framework(name.lower()) for name in args.frameworks] or sorted(
+            CACHEABLE_FRAMEWORKS, key=lambda f: f.value
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    unsupported = [f.value for f in frameworks if f not in CACHEABLE_FRAMEWORKS]
+    if unsupported:
+        parser.error(f"Not cacheable: {', '.join(unsupported)}")
+
+    failures = asyncio.run(warm_scaffold_cache(
+        frameworks,
+        Path(args.project_dir),
+        args.packages or ["nodejs@latest"]
+    ))
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ from uuid import UUID
 
 from autostack_engine.utils.database.models.ai.models import ProjectChat, SchemaRating
 from autostack_engine.utils.database.mongo_client import DatabaseManager
+from autostack_engine.utils.database.pagination import Page, paginate
 from autostack_engine.utils.orchestration.models import BaseService
 
 
@@ -121,6 +122,12 @@ unified_schema = {
 }
 
 
+# Chat fields list views show
+CHAT_LIST_FIELDS = (
+    "chat_title", "prompt", "initial_schema", "has_validation_error", "validation_error", "created_at", "updated_at"
+)
+
+
 class ComponentTypeInput(Enum):
     DATABASE = "database"
     CACHE = "cache"
@@ -154,8 +161,8 @@ class AIService(BaseService):
     
     service_name = "AI"
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        super().__init__(db)
         self.client = genai.Client()
         
     def _generate_chat_title(self, prompt: str) -> str:
@@ -197,8 +204,7 @@ class AIService(BaseService):
         """
         
         try:
-            db = DatabaseManager()
-            await db.connect([ProjectChat])
+            await self.db.connect([ProjectChat])
             
             supported_techs_by_category = {
                 "runtime": [],
@@ -366,8 +372,7 @@ class AIService(BaseService):
             tuple: (success, result/error_object, chat_id, error_message)
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ProjectChat])
+            await self.db.connect([ProjectChat])
             
             # Load existing chat
             existing_chat = await ProjectChat.get(chat_id)
@@ -525,8 +530,7 @@ class AIService(BaseService):
             Optional[ProjectChat]: The chat document or None if not found
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ProjectChat])
+            await self.db.connect([ProjectChat])
             
             chat = await ProjectChat.get(chat_id)
             if chat:
@@ -541,25 +545,43 @@ class AIService(BaseService):
             return None
     
     
-    async def list_chats(self) -> list[ProjectChat]:
+    async def list_chats_page(
+        self,
+        first: int = 20,
+        after: Optional[str] = None,
+        with_total: bool = False
+    ) -> tuple[bool, Optional[Page], Optional[str]]:
         """
-        List all chats, sorted by most recent first.
+        List chats most recent first, one page at a time.
+        
+        Args:
+            first: Number of chats to return
+            after: end_cursor of the previous page
+            with_total: Also count all chats
         
         Returns:
-            list[ProjectChat]: List of chat documents
+            tuple: (success: bool, page with ProjectChat items: Optional[Page], error_message: Optional[str])
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ProjectChat])
-            
-            chats = await ProjectChat.find_all().sort("-created_at").to_list()
-            self.log_info(f"Retrieved {len(chats)} total chats")
-            
-            return chats
+            await self.db.connect([ProjectChat])
+            
+            page = await paginate(
+                ProjectChat,
+                first=first,
+                after=after,
+                projection={field: 1 for field in CHAT_LIST_FIELDS},
+                with_total=with_total
+            )
+            page.items = [ProjectChat.model_validate(document) for document in page.items]
+            self.log_info(f"Retrieved {len(page.items)} chats")
             
+            return True, page, None
+        
+        except ValueError as e:
+            return False, None, str(e)
         except Exception as e:
             self.log_error(f"Error listing chats: {e}")
-            return []
+            return False, None, str(e)
     
     async def delete_chat(self, chat_id: str) -> tuple[bool, Optional[str]]:
         """
@@ -572,8 +594,7 @@ class AIService(BaseService):
             tuple: (success: bool, error_message: Optional[str])
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ProjectChat])
+            await self.db.connect([ProjectChat])
             
             chat = await ProjectChat.get(chat_id)
             if not chat:
@@ -602,8 +623,7 @@ class AIService(BaseService):
             tuple: (success: bool, error_message: Optional[str])
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ProjectChat])
+            await self.db.connect([ProjectChat])
             
             chat = await ProjectChat.get(chat_id)
             if not chat:
@@ -643,8 +663,7 @@ class AIService(BaseService):
             tuple: (success: bool, error_message: Optional[str])
         """
         try:
-            db = DatabaseManager()
-            await db.connect([SchemaRating])
+            await self.db.connect([SchemaRating])
             
             rating = await SchemaRating.get(chat_id)
             if not rating:
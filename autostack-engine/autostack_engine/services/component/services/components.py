@@ -1,5 +1,7 @@
 import json
-import subprocess
+import os
+import shlex
+import shutil
 import asyncio
 import traceback
 from uuid import UUID
@@ -10,7 +12,12 @@ from jinja2 import Environment, FileSystemLoader, select_autoescape
 from autostack_engine.utils.database.models.activities.models import ActivityLog, ActivityType
 from autostack_engine.utils.database.models.project.models import Project
 from autostack_engine.utils.database.mongo_client import DatabaseManager
+from autostack_engine.utils.database.serialization import find_raw
+from autostack_engine.utils.devbox.planner import get_devbox_planner
+from autostack_engine.utils.devbox.session import devbox_run
 from autostack_engine.utils.orchestration.models import BaseService
+from autostack_engine.utils.packages.store import get_package_store
+from autostack_engine.utils.scaffold.cache import SKELETON_NAME, ScaffoldCache, get_scaffold_cache
 from autostack_engine.utils.database.models.components.models import (
     Component, 
     Connection, 
@@ -20,6 +27,21 @@ from autostack_engine.utils.database.models.components.models import (
     Framework
 )
 
+# Frameworks whose CLI output is a reusable skeleton. Django is left out on
+# purpose: startproject writes a per-project SECRET_KEY into settings.py.
+CACHEABLE_FRAMEWORKS = {
+    Framework.EXPRESS,
+    Framework.NESTJS,
+    Framework.REACT,
+    Framework.NEXTJS,
+    Framework.ANGULAR,
+    Framework.VUE,
+    Framework.SVELTE,
+}
+
+# Seconds before a scaffold or install command is killed
+SCAFFOLD_TIMEOUT = float(os.getenv("SCAFFOLD_TIMEOUT_SECONDS", "9000"))
+
 
 class DockerfileGenerator:
     """Generates Dockerfiles using Jinja2 templates"""
@@ -133,9 +155,70 @@ class ComponentService(BaseService):
     
     service_name = "COMPONENT"
     
-    def __init__(self):
-        super().__init__()
+    # Scaffolding limits shared by every ComponentService in the process
+    _scaffold_semaphore: Optional[asyncio.Semaphore] = None
+    _framework_semaphores: Dict[str, asyncio.Semaphore] = {}
+    
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        super().__init__(db)
         self.dockerfile_generator = DockerfileGenerator()
+        self.scaffold_cache = get_scaffold_cache()
+        self.package_store = get_package_store()
+    
+    @classmethod
+    def _get_scaffold_semaphores(cls, component: Component) -> tuple[asyncio.Semaphore, asyncio.Semaphore]:
+        """Machine-wide and per-framework scaffolding semaphores"""
+        if cls._scaffold_semaphore is None:
+            cls._scaffold_semaphore = asyncio.Semaphore(int(os.getenv("SCAFFOLD_MAX_CONCURRENCY", "4")))
+        
+        framework = component.framework.value if component.framework else component.technology
+        if framework not in cls._framework_semaphores:
+            cls._framework_semaphores[framework] = asyncio.Semaphore(int(os.getenv("SCAFFOLD_MAX_PER_FRAMEWORK", "2")))
+        
+        return cls._scaffold_semaphore, cls._framework_semaphores[framework]
+    
+    async def _scaffold_component_bounded(self, project_path: Path, component: Component):
+        """Scaffold a component once a machine-wide and a framework slot are free"""
+        machine_slot, framework_slot = self._get_scaffold_semaphores(component)
+        async with framework_slot:
+            async with machine_slot:
+                return await self._scaffold_component(project_path, component)
+    
+    def prepare_components(
+        self,
+        components_data: list[Dict[str, Any]],
+        connections_data: Optional[list[Dict[str, Any]]] = None
+    ) -> tuple[list[Component], list[Connection]]:
+        """Build Component and Connection documents from their configurations without saving them"""
+        created_components = []
+        for comp_data in components_data:
+            # Handle ID field
+            if 'id' in comp_data:
+                comp_data['component_id'] = comp_data['id']
+                del comp_data['id']
+            
+            # Parse framework enum
+            if comp_data.get('framework') and isinstance(comp_data['framework'], str):
+                try:
+                    comp_data['framework'] = Framework(comp_data['framework'].lower())
+                except ValueError:
+                    self.log_warning(f"Invalid framework '{comp_data['framework']}', setting to None")
+                    comp_data['framework'] = None
+            
+            # Parse component type
+            if isinstance(comp_data.get('type'), str):
+                comp_data['type'] = ComponentType(comp_data['type'].lower())
+            
+            # Set directory
+            if not comp_data.get('directory'):
+                type_value = comp_data['type'].value
+                comp_data['directory'] = f"{type_value}/{comp_data['component_id']}"
+            
+            component = Component(**comp_data)
+            created_components.append(component)
+        
+        connections = [Connection(**conn_data) for conn_data in connections_data or []]
+        return created_components, connections
     
     async def create_components(
         self,
@@ -157,41 +240,14 @@ class ComponentService(BaseService):
             tuple: (success: bool, component_ids: Optional[list], error_message: Optional[str])
         """
         try:
-            db = DatabaseManager()
-            await db.connect([Project, Component, Connection])
+            await self.db.connect([Project, Component, Connection])
             
             # Verify project exists
             project = await Project.get(project_id)
             if not project:
                 return False, None, f"Project '{project_id}' does not exist"
             
-            # Create components
-            created_components = []
-            for comp_data in components_data:
-                # Handle ID field
-                if 'id' in comp_data:
-                    comp_data['component_id'] = comp_data['id']
-                    del comp_data['id']
-                
-                # Parse framework enum
-                if comp_data.get('framework') and isinstance(comp_data['framework'], str):
-                    try:
-                        comp_data['framework'] = Framework(comp_data['framework'].lower())
-                    except ValueError:
-                        self.log_warning(f"Invalid framework '{comp_data['framework']}', setting to None")
-                        comp_data['framework'] = None
-                
-                # Parse component type
-                if isinstance(comp_data.get('type'), str):
-                    comp_data['type'] = ComponentType(comp_data['type'].lower())
-                
-                # Set directory
-                if not comp_data.get('directory'):
-                    type_value = comp_data['type'].value
-                    comp_data['directory'] = f"{type_value}/{comp_data['component_id']}"
-                
-                component = Component(**comp_data)
-                created_components.append(component)
+            created_components, connections = self.prepare_components(components_data, connections_data)
             
             await Component.insert_many(created_components)
             component_ids = [comp.component_id for comp in created_components]
@@ -199,12 +255,7 @@ class ComponentService(BaseService):
             self.log_info(f"Created {len(created_components)} components for project '{project_id}'")
             
             # Create connections
-            if connections_data:
-                connections = []
-                for conn_data in connections_data:
-                    connection = Connection(**conn_data)
-                    connections.append(connection)
-                
+            if connections:
                 await Connection.insert_many(connections)
                 self.log_info(f"Created {len(connections)} connections")
             
@@ -222,6 +273,52 @@ class ComponentService(BaseService):
             self.log_error(error_msg)
             return False, None, str(e)
     
+    async def initialize_components(
+        self,
+        project_id: str,
+        component_ids: Optional[list[str]] = None,
+        skip_scaffolded: bool = False
+    ) -> tuple[bool, Optional[list[str]], Optional[str]]:
+        """
+        Scaffold already created components of a project locally.
+        
+        Args:
+            project_id: The project ID
+            component_ids: Components to initialize (default: all of the project's)
+            skip_scaffolded: Leave components that were already scaffolded (status RUNNING) alone
+            
+        Returns:
+            tuple: (success: bool, component_ids: Optional[list], error_message: Optional[str])
+        """
+        try:
+            await self.db.connect([Project, Component])
+            
+            project = await Project.get(project_id)
+            if not project:
+                return False, None, f"Project '{project_id}' does not exist"
+            
+            project_uuid = UUID(project_id) if isinstance(project_id, str) else project_id
+            query = {"project_id": project_uuid}
+            if component_ids is not None:
+                query["component_id"] = {"$in": component_ids}
+            components = await Component.find(query).to_list()
+            
+            pending = components
+            if skip_scaffolded:
+                pending = [comp for comp in components if comp.status != ComponentStatus.RUNNING]
+                if len(pending) < len(components):
+                    self.log_info(f"Skipping {len(components) - len(pending)} already scaffolded components")
+            
+            if pending and not await self._initialize_components_locally(project.metadata.directory, pending):
+                return False, None, "Failed to initialize components locally"
+            
+            return True, [comp.component_id for comp in components], None
+            
+        except Exception as e:
+            error_msg = f"Error initializing components: {traceback.format_exc()}"
+            self.log_error(error_msg)
+            return False, None, str(e)
+    
     async def _initialize_components_locally(self, project_directory: str, components: list[Component]):
         """Initialize components locally (simplified - delegates to existing logic)"""
         try:
@@ -234,26 +331,36 @@ class ComponentService(BaseService):
             self.log_info(f"Found {len(scaffold_components)} components requiring scaffolding")
             self.log_info(f"Found {len(service_components)} service components")
             
-            # Install required packages for all components
-            all_packages = set()
+            # Make sure the toolchains are installed; a no-op when the project's
+            # devbox step already applied them
+            all_packages = []
             for component in components:
-                packages = component.get_required_devbox_packages()
-                all_packages.update(packages)
+                all_packages.extend(component.get_required_devbox_packages())
             
             if all_packages:
-                await self._add_devbox_packages(project_path, list(all_packages))
+                await self._add_devbox_packages(project_path, all_packages)
             
-            # Scaffold components that need it - run sequentially to avoid conflicts
-            for component in scaffold_components:
-                await self._scaffold_component(project_path, component)
+            # Scaffold components concurrently, bounded per machine and per framework
+            scaffold_results = await asyncio.gather(
+                *(self._scaffold_component_bounded(project_path, component) for component in scaffold_components),
+                return_exceptions=True
+            )
+            failed = [
+                component.component_id
+                for component, result in zip(scaffold_components, scaffold_results)
+                if result is False or isinstance(result, BaseException)
+            ]
+            if failed:
+                self.log_warning(f"Scaffolding failed for {len(failed)} component(s): {', '.join(failed)}")
             
             # Generate devbox service configurations for databases/caches
             if service_components:
                 await self._generate_service_configs(project_path, service_components)
             
             # Generate Dockerfiles for all components
-            for component in components:
-                await self._generate_component_dockerfile(project_path, component)
+            await asyncio.gather(
+                *(self._generate_component_dockerfile(project_path, component) for component in components)
+            )
             
             self.log_info("All components initialized locally")
             return True
@@ -306,70 +413,194 @@ class ComponentService(BaseService):
             return False
     
     async def _add_devbox_packages(self, project_path: Path, packages: List[str]):
-        """Add packages to devbox using devbox shell"""
+        """Register packages with the project's devbox planner and wait until they are installed"""
+        try:
+            planner = get_devbox_planner(str(project_path))
+            planner.add(packages)
+            
+            success, error = await planner.wait()
+            if not success:
+                self.log_error(f"Error adding devbox packages: {error}")
+            return success
+                
+        except Exception as e:
+            self.log_error(f"Error adding devbox packages: {e}")
+            return False
+    
+    def _get_scaffold_name(self, component: Component) -> str:
+        """Name the framework CLI gives the scaffolded project"""
+        if component.framework == Framework.ANGULAR:
+            return f"temp_{component.component_id}"
+        return component.component_id
+    
+    def _get_toolchain_version(self, project_path: Path, component: Component) -> str:
+        """
+        Toolchain a component is scaffolded with, e.g. "nodejs@20.11.1".
+        Read from devbox.lock (resolved version) or devbox.json (requested version).
+        """
+        runtime = "nodejs" if component.technology == "nodejs" else "python"
+        requested = f"{runtime}@latest"
+        
         try:
-            # Check if devbox is available
+            with open(project_path / "devbox.json") as f:
+                packages = json.load(f).get("packages", [])
+            if isinstance(packages, dict):
+                packages = [f"{name}@{version}" for name, version in packages.items()]
+            for package in packages:
+                if package.split("@")[0] == runtime:
+                    requested = package if "@" in package else f"{package}@latest"
+                    break
+            
+            with open(project_path / "devbox.lock") as f:
+                locked = json.load(f).get("packages", {}).get(requested, {})
+            if locked.get("version"):
+                return f"{runtime}@{locked['version']}"
+        except (OSError, json.JSONDecodeError):
+            pass
+        
+        return requested
+    
+    def _get_skeleton_key(self, project_path: Path, component: Component) -> tuple[str, Dict[str, Any]]:
+        """Scaffold cache key and metadata for a component: framework + toolchain + command"""
+        toolchain = self._get_toolchain_version(project_path, component)
+        skeleton_cmd = self._get_scaffold_command(component, SKELETON_NAME)
+        key = ScaffoldCache.make_key(component.framework.value, toolchain, skeleton_cmd)
+        return key, {
+            "framework": component.framework.value,
+            "toolchain": toolchain,
+            "command": skeleton_cmd
+        }
+    
+    async def warm_scaffold_cache(self, project_path: Path, component: Component) -> tuple[bool, Optional[str]]:
+        """
+        Build the skeleton for a component's framework if it is not cached yet.
+        
+        Returns:
+            tuple: (success: bool, error_message: Optional[str])
+        """
+        if component.framework not in CACHEABLE_FRAMEWORKS:
+            return False, f"Framework '{component.framework}' is not cacheable"
+        
+        key, meta = self._get_skeleton_key(project_path, component)
+        if self.scaffold_cache.has(key):
+            self.log_info(f"Skeleton for {meta['framework']} ({meta['toolchain']}) already cached")
+            return True, None
+        
+        async def build_skeleton(staging_dir: Path) -> bool:
+            return await self._run_scaffold_command(project_path, component, staging_dir, SKELETON_NAME)
+        
+        if not await self.scaffold_cache.populate(
+            key, build_skeleton, project_path / ".autostack" / "scaffold", meta
+        ):
+            return False, f"Failed to scaffold {meta['framework']} skeleton"
+        
+        return True, None
+    
+    async def _run_scaffold_command(self, project_path: Path, component: Component, target_dir: Path, name: str) -> bool:
+        """Run the framework CLI so the scaffolded project ends up in target_dir, named name"""
+        # npm/npx share the package store's cache instead of a per-user one
+        node_env = None
+        if component.technology == "nodejs" and self.package_store.enabled:
+            node_env = self.package_store.node_env_vars()
+        
+        if component.technology == "nodejs":
+            # Verify (and repair) the npm cache instead of wiping it, since other
+            # components may be scaffolding from the same cache concurrently
+            self.log_info(f"Verifying npm cache for {component.component_id} to prevent JSON parse issues")
+            verify_result = await devbox_run(
+                ["npm", "cache", "verify"],
+                cwd=str(project_path.resolve()),
+                project_directory=str(project_path),
+                extra_env=node_env,
+                timeout=SCAFFOLD_TIMEOUT,
+                label=component.component_id
+            )
+            if not verify_result.ok:
+                self.log_warning(f"npm cache verify failed (may be harmless, continuing): {verify_result.stderr}")
+            else:
+                self.log_info("npm cache verified successfully")
+        
+        scaffold_cmd = self._get_scaffold_command(component, name)
+        self.log_info(f"Scaffolding {component.component_id} with {scaffold_cmd}")
+        
+        if component.framework == Framework.ANGULAR:
+            # Each component gets its own work dir inside the project, so parallel
+            # Angular scaffolds never share a temp directory and devbox still
+            # finds the project's devbox.json by walking up from it
+            work_dir = project_path / ".autostack" / "scaffold" / component.component_id
+            if work_dir.exists():
+                shutil.rmtree(work_dir)
+            work_dir.mkdir(parents=True)
+            temp_dir = work_dir / name
+
+            self.log_info(f"Running Angular scaffolding in {work_dir} -> creating {temp_dir}")
+
             try:
-                subprocess.run(["devbox", "version"], capture_output=True, check=True)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                self.log_warning("devbox command not found. Skipping package addition.")
-                return False
+                result = await devbox_run(
+                    scaffold_cmd,
+                    cwd=str(work_dir),
+                    project_directory=str(project_path),
+                    extra_env=node_env,
+                    timeout=SCAFFOLD_TIMEOUT,
+                    label=component.component_id
+                )
 
-            self.log_info(f"Adding devbox packages: {packages}")
-            
-            # Run devbox add synchronously within async context
-            # Start the devbox shell process
-            process = await asyncio.to_thread(
-                subprocess.Popen,
-                ["devbox", "shell"],
-                cwd=str(project_path),
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+                if not result.ok:
+                    self.log_error(f"Angular scaffolding failed: {result.stderr}")
+                    return False
+
+                if not temp_dir.exists():
+                    self.log_error(f"Temporary Angular project directory not found at {temp_dir}")
+                    self.log_error(f"Current contents of {work_dir}: {list(work_dir.glob('*'))}")
+                    return False
+
+                self.log_info(f"Moving files from {temp_dir} to {target_dir}")
 
-            # Send the add command to the shell and then exit
-            commands = "devbox add " + " ".join(packages) + "\nexit\n"
-            stdout, stderr = await asyncio.to_thread(process.communicate, commands)
+                target_dir.mkdir(parents=True, exist_ok=True)
+                for item in temp_dir.iterdir():
+                    target = target_dir / item.name
+                    if target.exists():
+                        if target.is_dir():
+                            shutil.rmtree(target)
+                        else:
+                            target.unlink()
+                    item.rename(target)
 
-            if process.returncode == 0:
-                self.log_info("Devbox packages added successfully")
+                self.log_info("Angular files moved successfully")
                 return True
-            else:
-                self.log_error(f"Error adding devbox packages: {stderr}")
-                return False
-                
-        except Exception as e:
-            self.log_error(f"Error adding devbox packages: {e}")
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+
+        # General case: the CLI scaffolds into its working directory
+        target_dir.mkdir(parents=True, exist_ok=True)
+        result = await devbox_run(
+            scaffold_cmd,
+            cwd=str(target_dir),
+            project_directory=str(project_path),
+            extra_env=node_env,
+            timeout=SCAFFOLD_TIMEOUT,
+            label=component.component_id
+        )
+        if not result.ok:
+            self.log_error(f"Scaffolding failed for {component.component_id}: {result.stderr}")
             return False
+        return True
     
     async def _scaffold_component(self, project_path: Path, component: Component):
-        """Scaffold a component using its framework CLI with devbox run"""
+        """Scaffold a component using its framework CLI inside the devbox environment"""
         try:
+            component_dir = project_path / component.directory
+            if component.status in (ComponentStatus.SCAFFOLDING, ComponentStatus.FAILED) and component_dir.exists():
+                # Left over from an interrupted or failed attempt; start clean
+                self.log_info(f"Removing partial scaffold of {component.component_id}")
+                await asyncio.to_thread(shutil.rmtree, component_dir, True)
+
             await ComponentManager.update_component_status(
                 component.component_id,
                 ComponentStatus.SCAFFOLDING
             )
-            component_dir = project_path / component.directory
             component_dir.mkdir(parents=True, exist_ok=True)
 
-            if component.technology == "nodejs":
-                self.log_info(f"Clearing npm cache for {component.component_id} to prevent JSON parse issues")
-                clear_cmd = ["devbox", "run", "npm", "cache", "clean", "--force"]
-                clear_result = await asyncio.to_thread(
-                    subprocess.run,
-                    clear_cmd,
-                    cwd=str(project_path.resolve()),  
-                    capture_output=True,
-                    text=True,
-                    timeout=9000
-                )
-                if clear_result.returncode != 0:
-                    self.log_warning(f"npm cache clean failed (may be harmless, continuing): {clear_result.stderr}")
-                else:
-                    self.log_info("npm cache cleared successfully")
-                
             scaffold_cmd = self._get_scaffold_command(component)
             if not scaffold_cmd:
                 self.log_warning(f"No scaffold command for {component.framework}")
@@ -379,90 +610,44 @@ class ComponentService(BaseService):
                 )
                 return
 
-            self.log_info(f"Scaffolding {component.component_id} with {scaffold_cmd}")
+            scaffold_name = self._get_scaffold_name(component)
 
-            if component.framework == Framework.ANGULAR:
-                parent_dir = component_dir.parent
-                parent_dir.mkdir(parents=True, exist_ok=True)
-                temp_name = f"temp_{component.component_id}"
-                temp_dir = parent_dir / temp_name
+            if self.scaffold_cache.enabled and component.framework in CACHEABLE_FRAMEWORKS:
+                # Restore a pristine skeleton for this framework/toolchain, building it once on a miss
+                key, meta = self._get_skeleton_key(project_path, component)
 
-                full_cmd = [
-                    "devbox", "run", "npx", "@angular/cli", "new", temp_name,
-                    "--routing=true", "--style=css", "--skip-git=true", "--skip-install"
-                ]
+                async def build_skeleton(staging_dir: Path) -> bool:
+                    return await self._run_scaffold_command(project_path, component, staging_dir, SKELETON_NAME)
 
-                self.log_info(f"Running Angular scaffolding in {parent_dir} -> creating {temp_dir}")
+                async def scaffold_directly(target_dir: Path) -> bool:
+                    return await self._run_scaffold_command(project_path, component, target_dir, scaffold_name)
 
-                result = await asyncio.to_thread(
-                    subprocess.run,
-                    full_cmd,
-                    cwd=str(parent_dir.resolve()),
-                    capture_output=True,
-                    text=True,
-                    timeout=9000 
+                success, cache_hit = await self.scaffold_cache.get_or_build(
+                    key,
+                    component_dir,
+                    scaffold_name,
+                    builder=build_skeleton,
+                    staging_parent=project_path / ".autostack" / "scaffold",
+                    meta=meta,
+                    fallback=scaffold_directly
                 )
-
-                if result.returncode != 0:
-                    self.log_error(f"Angular scaffolding failed: {result.stderr}")
-                    await ComponentManager.update_component_status(component.component_id, ComponentStatus.FAILED)
-                    return False
-
-                temp_project_dir_path = project_path
-                temp_project_dir_path.mkdir(parents=True, exist_ok=True)
-                temp_dir_path = temp_project_dir_path / temp_name
-                
-                if not temp_dir_path.exists():
-                    self.log_error(f"Temporary Angular project directory not found at {temp_dir}")
-                    self.log_error(f"Current contents of parent {parent_dir}: {list(parent_dir.glob('*'))}")
-                    await ComponentManager.update_component_status(component.component_id, ComponentStatus.FAILED)
-                    return False
-
-                self.log_info(f"Moving files from {temp_dir} to {component_dir}")
-
-                component_dir.mkdir(parents=True, exist_ok=True)
-                for item in temp_dir_path.iterdir():
-                    target = component_dir / item.name
-                    if target.exists():
-                        if target.is_dir():
-                            import shutil
-                            shutil.rmtree(target)
-                        else:
-                            target.unlink()
-                    item.rename(target)
-
-                
-                if temp_dir_path.exists():
-                    temp_dir_path.rmdir()
-                self.log_info("Angular files moved successfully")
-
-            elif component.framework == Framework.DJANGO:
-                cwd = str(component_dir)
-                full_cmd = ["devbox", "run"] + scaffold_cmd 
+                if success:
+                    self.log_info(
+                        f"Scaffolded {component.component_id} from skeleton cache "
+                        f"({'hit' if cache_hit else 'miss, captured'})"
+                    )
             else:
-                # General case
-                cwd = str(component_dir)
-                full_cmd = ["devbox", "run"] + scaffold_cmd
+                success = await self._run_scaffold_command(project_path, component, component_dir, scaffold_name)
 
-            if component.framework != Framework.ANGULAR:  
-                result = await asyncio.to_thread(
-                    subprocess.run,
-                    full_cmd,
-                    cwd=cwd,
-                    capture_output=True,
-                    text=True,
-                    timeout=9000 
-                )
-                if result.returncode != 0:
-                    self.log_error(f"Scaffolding failed for {component.component_id}: {result.stderr}")
-                    await ComponentManager.update_component_status(component.component_id, ComponentStatus.FAILED)
-                    return False
+            if not success:
+                await ComponentManager.update_component_status(component.component_id, ComponentStatus.FAILED)
+                return False
 
             # Post-scaffolding steps (common)
             if component.environment_variables:
                 await self._create_env_file(component_dir, component.environment_variables)
 
-            await self._initialize_project_dependencies(component_dir, component)
+            await self._initialize_project_dependencies(component_dir, component, project_path)
 
             await ComponentManager.update_component_status(
                 component.component_id,
@@ -483,8 +668,7 @@ class ComponentService(BaseService):
     async def update_component(self, component_id: str, updates: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Update a component"""
         try:
-            db = DatabaseManager()
-            await db.connect([Component])
+            await self.db.connect([Component])
             
             component = await Component.find_one({"component_id": component_id})
             if not component:
@@ -510,17 +694,18 @@ class ComponentService(BaseService):
             self.log_error(error_msg)
             return False, error_msg
     
-    def _get_scaffold_command(self, component: Component) -> List[str]:
+    def _get_scaffold_command(self, component: Component, name: Optional[str] = None) -> List[str]:
         """Get the scaffold command based on framework"""
+        name = name or self._get_scaffold_name(component)
         framework_commands = {
-            Framework.DJANGO: ["django-admin", "startproject", component.component_id, "."],
+            Framework.DJANGO: ["django-admin", "startproject", name, "."],
             Framework.FLASK: ["pip", "install", "flask"],
             Framework.FASTAPI: ["pip", "install", "fastapi", "uvicorn"],
             Framework.EXPRESS: ["npx", "express-generator", ".", "--no-view"],
-            Framework.NESTJS: ["npx", "@nestjs/cli", "new", component.component_id, "--skip-git"],
+            Framework.NESTJS: ["npx", "@nestjs/cli", "new", name, "--skip-git"],
             Framework.REACT: ["npm", "create", "vite@latest", ".", "--", "--template", "react"],
             Framework.NEXTJS: ["npx", "create-next-app@latest", ".", "--yes", "--no-eslint"],
-            Framework.ANGULAR: ["npx", "@angular/cli", "new", component.component_id, "--routing=true", "--style=css", "--skip-git=true", "--skip-install"], 
+            Framework.ANGULAR: ["npx", "@angular/cli", "new", name, "--routing=true", "--style=css", "--skip-git=true", "--skip-install"], 
             Framework.VUE: ["npm", "create", "vite@latest", ".", "--", "--template", "vue"],  # Switched to Vite
             Framework.SVELTE: ["npm", "create", "vite@latest", ".", "--", "--template", "svelte"],  # Switched to Vite
             Framework.VANILLA: ["npm", "init", "-y"] if component.technology == "nodejs" else ["python", "-m", "venv", "venv"],
@@ -538,18 +723,23 @@ class ComponentService(BaseService):
         
         return []
     
-    async def _initialize_project_dependencies(self, component_dir: Path, component: Component):
+    async def _initialize_project_dependencies(
+        self,
+        component_dir: Path,
+        component: Component,
+        project_path: Optional[Path] = None
+    ):
         """Initialize project dependencies based on technology"""
         try:
             if component.technology == "python":
                 await self._setup_python_project(component_dir, component)
             elif component.technology == "nodejs":
-                await self._setup_nodejs_project(component_dir, component)
+                await self._setup_nodejs_project(component_dir, component, project_path)
         except Exception as e:
             self.log_error(f"Error initializing project dependencies: {e}")
     
     async def _setup_python_project(self, component_dir: Path, component: Component):
-        """Setup Python project with virtual environment and dependencies"""
+        """Setup Python project with dependencies from the shared wheelhouse"""
         try:
             # Create requirements.txt if it doesn't exist
             requirements_file = component_dir / "requirements.txt"
@@ -565,30 +755,27 @@ class ComponentService(BaseService):
                 
                 self.log_info(f"Created requirements.txt for {component.component_id}")
             
-            # Install dependencies using devbox shell
-            # Start the devbox shell process for pip install
-            process = await asyncio.to_thread(
-                subprocess.Popen,
-                ["devbox", "shell"],
+            if self.package_store.enabled:
+                # Build any missing wheels into the shared wheelhouse (a no-op for
+                # wheels already there), then install offline from it
+                self.package_store.ensure_layout()
+                wheelhouse = shlex.quote(str(self.package_store.wheelhouse_dir))
+                install = (
+                    f"pip wheel -q -r requirements.txt -w {wheelhouse} --find-links {wheelhouse} && "
+                    f"pip install --no-index --find-links {wheelhouse} -r requirements.txt"
+                )
+            else:
+                install = "pip install -r requirements.txt"
+            
+            # Install dependencies inside the devbox environment
+            result = await devbox_run(
+                ["bash", "-c", install],
                 cwd=str(component_dir),
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-
-            # Send the pip install command to the shell and then exit
-            pip_command = "pip install -r requirements.txt\nexit\n"
-            stdout, stderr = await asyncio.to_thread(process.communicate, pip_command)
-
-            result = subprocess.CompletedProcess(
-                args=["devbox", "shell"],
-                returncode=process.returncode,
-                stdout=stdout,
-                stderr=stderr
+                timeout=SCAFFOLD_TIMEOUT,
+                label=component.component_id
             )
             
-            if result.returncode == 0:
+            if result.ok:
                 self.log_info(f"Installed Python dependencies for {component.component_id}")
             else:
                 self.log_error(f"Error installing Python dependencies: {result.stderr}")
@@ -596,37 +783,53 @@ class ComponentService(BaseService):
         except Exception as e:
             self.log_error(f"Error setting up Python project: {e}")
     
-    async def _setup_nodejs_project(self, component_dir: Path, component: Component):
-        """Setup Node.js project with dependencies"""
+    async def _setup_nodejs_project(self, component_dir: Path, component: Component, project_path: Optional[Path] = None):
+        """Setup Node.js project with dependencies, hardlinked from the package store when possible"""
         try:
             package_json = component_dir / "package.json"
             if not package_json.exists():
                 self.log_warning(f"No package.json found for {component.component_id}")
                 return
             
-            # Install dependencies using devbox shell
-            full_command = [
-                "devbox", "run", "--",
-                "bash", "-c",
-                f"cd {component_dir} && npm install"
-            ]
-            result = await asyncio.to_thread(
-                subprocess.run,
-                full_command,
-                cwd=str(component_dir),
-                capture_output=True,
-                text=True,
-                timeout=9000
-            )
+            store = self.package_store
+            key = None
+            node_version = None
+            if store.enabled:
+                node_version = self._get_toolchain_version(project_path or component_dir, component)
+                key = store.node_key(component_dir, node_version)
+            
+            if key:
+                async with store.lock(key):
+                    if await store.restore_node_modules(component_dir, key):
+                        self.log_info(f"Linked Node.js dependencies for {component.component_id} from package store")
+                        return
+                    
+                    if await self._npm_install(component_dir, component):
+                        await store.save_node_modules(component_dir, key, node_version)
+                return
             
-            if result.returncode == 0:
-                self.log_info(f"Installed Node.js dependencies for {component.component_id}")
-            else:
-                self.log_error(f"Error installing Node.js dependencies: {result.stderr}")
+            await self._npm_install(component_dir, component)
                 
         except Exception as e:
             self.log_error(f"Error setting up Node.js project: {e}")
     
+    async def _npm_install(self, component_dir: Path, component: Component) -> bool:
+        """Run npm install inside the devbox environment against the shared npm cache"""
+        result = await devbox_run(
+            ["npm", "install", "--prefer-offline"],
+            cwd=str(component_dir),
+            extra_env=self.package_store.node_env_vars() if self.package_store.enabled else None,
+            timeout=SCAFFOLD_TIMEOUT,
+            label=component.component_id
+        )
+        
+        if result.ok:
+            self.log_info(f"Installed Node.js dependencies for {component.component_id}")
+            return True
+        
+        self.log_error(f"Error installing Node.js dependencies: {result.stderr}")
+        return False
+    
     async def _create_env_file(self, component_dir: Path, env_vars: Dict[str, Any]):
         """Create .env file for component"""
         try:
@@ -697,8 +900,7 @@ class ComponentService(BaseService):
     async def delete_component(self, component_id: str, delete_files: bool = False) -> tuple[bool, Optional[str]]:
         """Delete a component"""
         try:
-            db = DatabaseManager()
-            await db.connect([Component, Project, ActivityLog])
+            await self.db.connect([Component, Project, ActivityLog])
             
             component = await Component.get(component_id)
             if not component:
@@ -739,12 +941,29 @@ class ComponentService(BaseService):
     async def list_components(self, project_id: str) -> list[Component]:
         """List all components for a project"""
         try:
-            db = DatabaseManager()
-            await db.connect([Component])
+            await self.db.connect([Component])
             
             project_uuid = UUID(project_id) if isinstance(project_id, str) else project_id
             return await Component.find({'project_id': project_uuid}).to_list(None)
         except Exception as e:
             self.log_error(f"Error listing components: {e}")
             return []
+    
+    async def list_component_summaries(self, project_id: str) -> list[Dict[str, Any]]:
+        """
+        List a project's components as JSON-ready dicts with only the fields
+        list views show, read without building Component models
+        """
+        try:
+            await self.db.connect([Component])
+            
+            project_uuid = UUID(project_id) if isinstance(project_id, str) else project_id
+            return await find_raw(
+                Component,
+                {'project_id': project_uuid},
+                projection={'component_id': 1, 'name': 1, 'framework': 1, 'technology': 1, 'dependencies': 1}
+            )
+        except Exception as e:
+            self.log_error(f"Error listing components: {e}")
+            return []
 
@@ -1,15 +1,14 @@
 import json
 import os
-import threading
-import subprocess
 import better_exceptions
 import structlog
 
 
 from autostack_engine.utils.database.models.project.models import Project
 from autostack_engine.utils.database.models.technologies.models import Technology
-from autostack_engine.utils.database.mongo_client import DatabaseManager
+from autostack_engine.utils.database.mongo_client import get_database_manager
 from autostack_engine.utils.kafka.base_topic import BaseTopic
+from autostack_engine.utils.process.runner import run_command
 from autostack_engine.utils.schema.models.technologies import TechnologyManager
 
 better_exceptions.hook()
@@ -20,7 +19,7 @@ class DevelopmentCreateTopic(BaseTopic):
     
     async def create_technologies(self, project_id, technologies):
         try:
-            db = DatabaseManager()
+            db = get_database_manager()
             await db.connect([Project, Technology])
 
             existing_project = await Project.get(project_id)
@@ -74,35 +73,21 @@ class DevelopmentCreateTopic(BaseTopic):
             devbox_json_path = os.path.join(project_directory, "devbox.json")
             if not os.path.exists(devbox_json_path):
                 logger.info("Initializing devbox in project directory")
-                init_result = subprocess.run(
-                    ["devbox", "init"], 
-                    cwd=project_directory, 
-                    capture_output=True, 
-                    text=True
-                )
-                if init_result.returncode != 0:
+                init_result = await run_command(["devbox", "init"], cwd=project_directory)
+                if not init_result.ok:
                     logger.error(f'Error initializing devbox: {init_result.stderr}')
                     return None
             
             # Get the technologies and add them to devbox
             package_specs = TechnologyManager.get_devbox_technologies(technologies)
             
-            def run_devbox_async():
-                result = subprocess.run(
-                    ["devbox", "add"] + package_specs, 
-                    cwd=project_directory, 
-                    capture_output=True, 
-                    text=True
-                )
-                if result.returncode == 0:
-                    logger.info("Devbox packages installed successfully")
-                else:
-                    logger.error(f'Error adding packages: {result.stderr}')
+            result = await run_command(["devbox", "add"] + package_specs, cwd=project_directory)
+            if result.ok:
+                logger.info("Devbox packages installed successfully")
+            else:
+                logger.error(f'Error adding packages: {result.stderr}')
             
-            # Run in background thread
-            threading.Thread(target=run_devbox_async, daemon=True).start()
-            
-            return True  # Return immediately
+            return True
         
         except Exception as e:
             logger.error("environment.create_tech_error", 
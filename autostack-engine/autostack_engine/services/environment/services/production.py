@@ -10,9 +10,8 @@ from pathlib import Path
 from uuid import UUID
 
 from autostack_engine.utils.database.models.components.models import Component, ComponentType, Connection, Framework
-from autostack_engine.utils.database.models.project.models import Project
+from autostack_engine.utils.database.models.project.models import Project, ProjectManager
 from autostack_engine.utils.database.models.technologies.models import Technology, TechnologyCategory
-from autostack_engine.utils.database.mongo_client import DatabaseManager
 from autostack_engine.utils.orchestration.models import BaseService
 
 logger = structlog.get_logger()
@@ -306,13 +305,7 @@ class ProductionService(BaseService):
     async def fetch_project_data(self, project_id: str) -> Dict[str, Any]:
         """Fetch project, components, technologies, and connections from MongoDB"""
         try:
-            db = DatabaseManager()
-            await db.connect([Project, Component, Connection, Technology])
-            
-            project = await Project.get(project_id)
-            if not project:
-                logger.error(f"Project '{project_id}' not found")
-                return None
+            await self.db.connect([Project, Component, Connection, Technology])
             
             try:
                 project_uuid = UUID(project_id) if isinstance(project_id, str) else project_id
@@ -321,13 +314,20 @@ class ProductionService(BaseService):
                 return None
             
             self.log_info(f"Fetching data for project_id: {project_uuid}")
-        
-            components = await Component.find({'project_id': project_uuid}).to_list(None)
-            connections = await Connection.find({'project_id': project_uuid}).to_list(None)
-            technologies = await Technology.find({
-                'project_id': project_uuid,
-                'enabled': True
-            }).to_list(None)
+            
+            graph = await ProjectManager.get_project_graph(
+                project_uuid,
+                include=("components", "connections", "technologies"),
+                enabled_technologies_only=True
+            )
+            if not graph:
+                logger.error(f"Project '{project_id}' not found")
+                return None
+            
+            project = graph['project']
+            components = graph['components']
+            connections = graph['connections']
+            technologies = graph['technologies']
             
             self.log_info(f"Found {len(components)} components")
             self.log_info(f"Found {len(connections)} connections")
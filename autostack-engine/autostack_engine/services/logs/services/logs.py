@@ -2,8 +2,8 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from uuid import uuid4
 
-from autostack_engine.services.orchestration import BaseService
-from autostack_engine.utils.database.mongo_client import DatabaseManager
+from autostack_engine.utils.database.pagination import Page, paginate
+from autostack_engine.utils.orchestration.models import BaseService
 from autostack_engine.utils.logging.models import LogCategory, LogLevel
 from autostack_engine.utils.logging.services import ServiceLog
 
@@ -35,8 +35,7 @@ class LogManagementService(BaseService):
             List of ServiceLog documents
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ServiceLog])
+            await self.db.connect([ServiceLog])
             
             query = {}
             
@@ -58,6 +57,65 @@ class LogManagementService(BaseService):
             self.log_error(f"Error retrieving logs: {e}", operation="get_recent_logs", error=e)
             return []
     
+    async def get_logs_page(
+        self,
+        first: int = 100,
+        after: Optional[str] = None,
+        service_name: Optional[str] = None,
+        log_level: Optional[LogLevel] = None,
+        project_id: Optional[str] = None,
+        category: Optional[LogCategory] = None,
+        with_total: bool = False
+    ) -> tuple[bool, Optional[Page], Optional[str]]:
+        """
+        Get logs newest first, one page at a time, with the filters of
+        get_recent_logs.
+        
+        Args:
+            first: Number of logs to return
+            after: end_cursor of the previous page
+            service_name: Filter by service (e.g., "PROJECT", "COMPONENT")
+            log_level: Filter by log level (INFO, ERROR, etc.)
+            project_id: Filter by project ID
+            category: Filter by category
+            with_total: Also count all matching logs
+            
+        Returns:
+            tuple: (success: bool, page with ServiceLog items: Optional[Page], error_message: Optional[str])
+        """
+        try:
+            await self.db.connect([ServiceLog])
+            
+            query = {}
+            
+            if service_name:
+                query["service_name"] = service_name.upper()
+            if log_level:
+                query["log_level"] = log_level.value
+            if project_id:
+                query["project_id"] = project_id
+            if category:
+                query["category"] = category.value
+            
+            page = await paginate(
+                ServiceLog,
+                query,
+                sort_field="timestamp",
+                first=first,
+                after=after,
+                with_total=with_total
+            )
+            page.items = [ServiceLog.model_validate(document) for document in page.items]
+            
+            self.log_info(f"Retrieved {len(page.items)} logs", operation="get_logs_page")
+            return True, page, None
+            
+        except ValueError as e:
+            return False, None, str(e)
+        except Exception as e:
+            self.log_error(f"Error retrieving logs: {e}", operation="get_logs_page", error=e)
+            return False, None, str(e)
+    
     async def get_error_logs(
         self,
         limit: int = 50,
@@ -76,8 +134,7 @@ class LogManagementService(BaseService):
             List of error logs
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ServiceLog])
+            await self.db.connect([ServiceLog])
             
             cutoff_time = datetime.now() - timedelta(hours=hours)
             
@@ -110,8 +167,7 @@ class LogManagementService(BaseService):
             List of logs in chronological order
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ServiceLog])
+            await self.db.connect([ServiceLog])
             
             logs = await ServiceLog.find({"request_id": request_id}).sort("timestamp").to_list()
             
@@ -144,8 +200,7 @@ class LogManagementService(BaseService):
             List of project logs
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ServiceLog])
+            await self.db.connect([ServiceLog])
             
             query = {"project_id": project_id}
             if log_level:
@@ -180,8 +235,7 @@ class LogManagementService(BaseService):
             Dictionary with statistics
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ServiceLog])
+            await self.db.connect([ServiceLog])
             
             cutoff_date = datetime.now() - timedelta(days=days)
             
@@ -252,8 +306,7 @@ class LogManagementService(BaseService):
             Number of logs deleted
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ServiceLog])
+            await self.db.connect([ServiceLog])
             
             deleted_count = await ServiceLog.delete_old_logs(days)
             
@@ -290,8 +343,7 @@ class LogManagementService(BaseService):
             List of matching logs
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ServiceLog])
+            await self.db.connect([ServiceLog])
             
             query = {
                 "message": {"$regex": search_term, "$options": "i"}  # Case-insensitive search
@@ -339,8 +391,7 @@ class LogManagementService(BaseService):
             List of logs for the operation
         """
         try:
-            db = DatabaseManager()
-            await db.connect([ServiceLog])
+            await self.db.connect([ServiceLog])
             
             logs = await ServiceLog.find({
                 "project_id": project_id,
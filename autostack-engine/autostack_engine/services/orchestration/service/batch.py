@@ -0,0 +1,376 @@
+import asyncio
+import os
+import shutil
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from autostack_engine.services.orchestration.service.orchestration import OrchestrationService
+from autostack_engine.utils.database.models.activities.models import ActivityLog
+from autostack_engine.utils.database.models.components.models import Component, Connection
+from autostack_engine.utils.database.models.orchestration.models import OperationCheckpoint
+from autostack_engine.utils.database.models.project.models import Project, ProjectAvatar, ProjectManager
+from autostack_engine.utils.database.models.technologies.models import Technology
+from autostack_engine.utils.orchestration.admission import get_admission_controller
+from autostack_engine.utils.orchestration.checkpoints import completed_checkpoint, inputs_hash
+from autostack_engine.utils.orchestration.models import user_id_var
+from autostack_engine.utils.project.subscription import ProjectCreationStatus, TERMINAL_STATUSES
+
+
+MANIFEST_MAX_PROJECTS = int(os.getenv("MANIFEST_MAX_PROJECTS", "100"))
+
+# Tasks provisioning the projects of running batches in this process, by
+# their operation ID; these operations are not jobs of their own
+_project_tasks: Dict[str, asyncio.Task] = {}
+
+
+def cancel_batch_project(operation_id: str) -> bool:
+    """
+    Cancel one project of a running batch, leaving the others running.
+
+    Returns:
+        bool: True if the operation is a batch project running in this process
+    """
+    task = _project_tasks.get(operation_id)
+    if task is None or task.done():
+        return False
+    task.cancel()
+    return True
+
+
+@dataclass
+class PreparedProject:
+    """A manifest entry validated and turned into unsaved documents"""
+    input_data: Dict[str, Any]
+    project: Project
+    activity: ActivityLog
+    avatar: ProjectAvatar
+    technologies: List[Technology] = field(default_factory=list)
+    components: List[Component] = field(default_factory=list)
+    connections: List[Connection] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        return self.project.name
+
+
+class BatchProgress:
+    """
+    Operation store wrapper that forwards every update of a batch's project
+    operations and rolls them up into one update of the batch operation:
+    the mean progress of its projects and how many finished or failed.
+    """
+
+    def __init__(self, operation_store, operation_id: str, project_operation_ids: List[str]):
+        self.operation_store = operation_store
+        self.operation_id = operation_id
+        self.progress = {child_id: 0 for child_id in project_operation_ids}
+        self.finished: Dict[str, bool] = {}
+
+    def __getattr__(self, name):
+        return getattr(self.operation_store, name)
+
+    async def update_operation(self, operation_id: str, status: ProjectCreationStatus, message: str, progress: int, **kwargs):
+        event_id = await self.operation_store.update_operation(operation_id, status, message, progress, **kwargs)
+        if operation_id in self.progress:
+            self.progress[operation_id] = progress
+            if status.value in TERMINAL_STATUSES:
+                self.finished[operation_id] = status == ProjectCreationStatus.COMPLETED
+            await self.report()
+        return event_id
+
+    async def report(self):
+        total = len(self.progress)
+        failed = sum(1 for succeeded in self.finished.values() if not succeeded)
+        mean = sum(self.progress.values()) / total
+        await self.operation_store.update_operation(
+            self.operation_id,
+            ProjectCreationStatus.PROCESSING,
+            f"{len(self.finished)} of {total} projects finished ({failed} failed)",
+            15 + int(mean * 0.8)
+        )
+
+
+class ManifestService(OrchestrationService):
+    """
+    Provisions many projects from one manifest (see parse_manifest).
+
+    Every entry is validated and turned into documents before anything is
+    written, so a manifest with an error creates nothing. The records of all
+    projects are then inserted with one insert_many per collection, each
+    project gets a checkpoint marking those steps completed, and the
+    projects are provisioned concurrently as resumed operations, sharing
+    the admission controller's slots with single project creations.
+    """
+
+    service_name = "MANIFEST"
+
+    def _prepare_documents(self, input_data: Dict[str, Any]) -> PreparedProject:
+        project_data = self.transform_project_data(input_data)
+        project_id = project_data['id']
+
+        project, activity, avatar = self.project_service.prepare_project(project_data)
+        technologies = self.technology_service.prepare_technologies(
+            project_id, self.transform_technologies_data(input_data, project_id)
+        )
+        components, connections = self.component_service.prepare_components(
+            *self.transform_components_data(input_data, project_id)
+        )
+
+        component_ids = [comp.component_id for comp in components]
+        duplicates = sorted({cid for cid in component_ids if component_ids.count(cid) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate component IDs: {', '.join(duplicates)}")
+        for conn in connections:
+            unknown = [end for end in (conn.source, conn.target) if end not in component_ids]
+            if unknown:
+                raise ValueError(f"Connection {conn.source} -> {conn.target} references unknown component '{unknown[0]}'")
+
+        return PreparedProject(input_data, project, activity, avatar, technologies, components, connections)
+
+    async def prepare_manifest(self, projects: List[Dict[str, Any]]) -> tuple[List[PreparedProject], List[str]]:
+        """
+        Validate every manifest entry and build its documents without saving
+        anything.
+
+        Returns:
+            tuple: (prepared projects, error messages - empty if all are valid)
+        """
+        if len(projects) > MANIFEST_MAX_PROJECTS:
+            return [], [f"Manifest has {len(projects)} projects, at most {MANIFEST_MAX_PROJECTS} are allowed"]
+
+        await self.db.connect([Project])
+        names = [entry.get('project', {}).get('name') for entry in projects]
+        existing = {project.name for project in await Project.find({"name": {"$in": [n for n in names if n]}}).to_list()}
+
+        prepared = []
+        errors = []
+        directories: Dict[str, str] = {}
+
+        for index, input_data in enumerate(projects):
+            label = f"projects[{index}]" + (f" ('{names[index]}')" if names[index] else "")
+
+            is_valid, error = self.validate_input(input_data)
+            if not is_valid:
+                errors.append(f"{label}: {error}")
+                continue
+
+            name = names[index]
+            if name in existing:
+                errors.append(f"{label}: project already exists")
+                continue
+
+            directory = str(self.project_service.project_directory_path(name))
+            if directory in directories:
+                errors.append(f"{label}: same project directory as {directories[directory]}")
+                continue
+            directories[directory] = label
+
+            input_data = {**input_data, 'project': {**input_data['project'], 'id': str(uuid4())}}
+            try:
+                prepared.append(self._prepare_documents(input_data))
+            except Exception as e:
+                errors.append(f"{label}: {e}")
+
+        return prepared, errors
+
+    def _seed_checkpoint(self, prepared: PreparedProject, operation_id: str) -> OperationCheckpoint:
+        """Checkpoint with the record steps done, hashed exactly as the step graph will hash them"""
+        values = {
+            "project": str(prepared.project.id),
+            "technologies": [str(tech.id) for tech in prepared.technologies],
+            "components": [comp.component_id for comp in prepared.components],
+        }
+        steps, _ = self.build_project_steps(prepared.input_data)
+        seeded = {
+            step.name: (
+                inputs_hash(step.name, {dep: values[dep] for dep in step.depends_on}, step.key),
+                values[step.name]
+            )
+            for step in steps if step.name in values
+        }
+        return completed_checkpoint(operation_id, prepared.input_data, seeded, values["project"])
+
+    async def insert_manifest(
+        self,
+        prepared: List[PreparedProject],
+        operation_ids: List[str]
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Create the directories and insert the records and checkpoints of all
+        prepared projects; everything is removed again if any insert fails.
+
+        Returns:
+            tuple: (success: bool, error_message: Optional[str])
+        """
+        await self.db.connect([Project, ProjectAvatar, Technology, Component, Connection, ActivityLog, OperationCheckpoint])
+
+        created_directories = []
+        try:
+            for item in prepared:
+                directory = item.project.metadata.directory
+                if not os.path.exists(directory):
+                    created_directories.append(directory)
+                if not self.project_service.create_project_directory(item.name):
+                    raise OSError(f"Failed to create directory for project '{item.name}'")
+
+            for item in prepared:
+                await ProjectManager.save_avatar(item.avatar)
+            await Project.insert_many([item.project for item in prepared])
+            technologies = [tech for item in prepared for tech in item.technologies]
+            if technologies:
+                await Technology.insert_many(technologies)
+            components = [comp for item in prepared for comp in item.components]
+            if components:
+                await Component.insert_many(components)
+            connections = [conn for item in prepared for conn in item.connections]
+            if connections:
+                await Connection.insert_many(connections)
+            await ActivityLog.insert_many([item.activity for item in prepared])
+            await OperationCheckpoint.insert_many([
+                self._seed_checkpoint(item, operation_id)
+                for item, operation_id in zip(prepared, operation_ids)
+            ])
+
+            self.log_info(
+                f"Inserted {len(prepared)} projects, {len(technologies)} technologies, "
+                f"{len(components)} components and {len(connections)} connections"
+            )
+            return True, None
+
+        except Exception as e:
+            self.log_error(f"Bulk insert failed, removing partial records: {e}")
+            for item in prepared:
+                await ProjectManager.delete_project_cascade(item.project.id)
+            await OperationCheckpoint.find({"operation_id": {"$in": operation_ids}}).delete()
+            for directory in created_directories:
+                await asyncio.to_thread(shutil.rmtree, directory, True)
+            return False, str(e)
+
+    async def provision_manifest(
+        self,
+        projects: List[Dict[str, Any]],
+        operation_store=None,
+        operation_id: Optional[str] = None,
+        project_operation_ids: Optional[List[str]] = None
+    ) -> tuple[bool, List[Dict[str, Any]], Optional[str]]:
+        """
+        Validate, insert and provision every project of a parsed manifest.
+
+        Each project is provisioned under its own operation ID (resumable with
+        resume_operation); the batch operation reports their aggregate
+        progress and, when done, the per-project outcome as its result.
+        Cancelling the batch stops unfinished projects and marks them
+        cancelled; their records stay so they can be resumed.
+
+        Returns:
+            tuple: (success: bool, per-project results, error_message: Optional[str])
+        """
+        project_operation_ids = project_operation_ids or [str(uuid4()) for _ in projects]
+
+        async def report(status: ProjectCreationStatus, message: str, progress: int, **kwargs):
+            if operation_store and operation_id:
+                await operation_store.update_operation(operation_id, status, message, progress, **kwargs)
+
+        await report(ProjectCreationStatus.VALIDATING, f"Validating {len(projects)} projects", 5)
+        prepared, errors = await self.prepare_manifest(projects)
+        if errors:
+            error = "; ".join(errors)
+            self.log_error(f"Manifest validation failed: {error}")
+            await report(ProjectCreationStatus.FAILED, f"Manifest has {len(errors)} invalid projects", 100, error=error)
+            return False, [], error
+
+        await report(ProjectCreationStatus.CREATING_PROJECT, f"Creating records for {len(prepared)} projects", 10)
+        success, error = await self.insert_manifest(prepared, project_operation_ids)
+        if not success:
+            await report(ProjectCreationStatus.FAILED, "Failed to create project records", 100, error=error)
+            return False, [], error
+
+        store = operation_store
+        if operation_store and operation_id:
+            store = BatchProgress(operation_store, operation_id, project_operation_ids)
+            await store.report()
+
+        admission = get_admission_controller()
+        user_id = user_id_var.get()
+
+        async def provision_project(item: PreparedProject, child_id: str) -> tuple[bool, Optional[str], Optional[str]]:
+            async with admission.admit(child_id, user_id, store):
+                return await self.orchestrate_full_project(
+                    item.input_data,
+                    operation_store=store,
+                    operation_id=child_id,
+                    resume=True
+                )
+        
+        async def provision(item: PreparedProject, child_id: str) -> Dict[str, Any]:
+            result = {"name": item.name, "operation_id": child_id, "project_id": None}
+            
+            async def cancelled() -> Dict[str, Any]:
+                # Only this project was cancelled (cancel_batch_project), the batch goes on
+                self.log_info(f"Batch project {item.name} ({child_id}) cancelled")
+                if store:
+                    await store.update_operation(child_id, ProjectCreationStatus.CANCELLED, "Operation cancelled", 100)
+                return {**result, "success": False, "error": "Cancelled"}
+            
+            if operation_store and await operation_store.cancel_requested(child_id):
+                return await cancelled()
+            
+            task = asyncio.create_task(provision_project(item, child_id))
+            _project_tasks[child_id] = task
+            try:
+                success, project_id, error = await task
+            except asyncio.CancelledError:
+                if not asyncio.current_task().cancelling():
+                    return await cancelled()
+                # The whole batch is being cancelled: stop the project and wait for it
+                # to unwind. It is not rolled back (only cancelling the project itself
+                # does that), so its records stay and the manifest can be resumed
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                raise
+            finally:
+                _project_tasks.pop(child_id, None)
+            return {**result, "project_id": project_id, "success": success, "error": error}
+
+        try:
+            results = await asyncio.gather(*(
+                provision(item, child_id) for item, child_id in zip(prepared, project_operation_ids)
+            ))
+        except asyncio.CancelledError:
+            if operation_store:
+                pending = [
+                    child_id for child_id in project_operation_ids
+                    if not isinstance(store, BatchProgress) or child_id not in store.finished
+                ]
+                await asyncio.shield(operation_store.update_operations([
+                    {
+                        "operation_id": child_id,
+                        "status": ProjectCreationStatus.CANCELLED,
+                        "message": "Batch cancelled",
+                        "progress": 100
+                    }
+                    for child_id in pending
+                ]))
+            raise
+
+        failed = [result for result in results if not result["success"]]
+        self.log_info(f"Provisioned {len(results) - len(failed)} of {len(results)} manifest projects")
+        if failed:
+            error = "; ".join(f"{result['name']}: {result['error']}" for result in failed)
+            await report(
+                ProjectCreationStatus.FAILED,
+                f"{len(failed)} of {len(results)} projects failed",
+                100,
+                error=error,
+                result=results
+            )
+            return False, results, error
+
+        await report(
+            ProjectCreationStatus.COMPLETED,
+            f"Successfully provisioned {len(results)} projects",
+            100,
+            result=results
+        )
+        return True, results, None
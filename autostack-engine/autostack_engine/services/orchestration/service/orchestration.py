@@ -1,6 +1,8 @@
+import asyncio
+import shutil
 import traceback
 from typing import Any, Dict, Optional
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import better_exceptions
 import structlog
@@ -9,7 +11,13 @@ from autostack_engine.services.environment.services.technologies import Technolo
 from autostack_engine.services.project.services.project import ProjectService
 from autostack_engine.services.component.services.components import ComponentService
 from autostack_engine.services.environment.services.production import ProductionService
+from autostack_engine.utils.database.models.project.models import ProjectManager
+from autostack_engine.utils.database.mongo_client import DatabaseManager
+from autostack_engine.utils.orchestration.checkpoints import CheckpointStore
 from autostack_engine.utils.orchestration.models import BaseService
+from autostack_engine.utils.orchestration.step_graph import Step, StepGraph
+from autostack_engine.utils.orchestration.timings import TimingHistory, project_shape
+from autostack_engine.utils.process.runner import reset_operation_context, set_operation_context
 from autostack_engine.utils.project.subscription import ProjectCreationStatus
 
 
@@ -25,12 +33,21 @@ class OrchestrationService(BaseService):
     
     service_name = "ORCHESTRATION"
     
-    def __init__(self):
-        super().__init__()
-        self.project_service = ProjectService()
-        self.technology_service = TechnologyService()
-        self.component_service = ComponentService()
-        self.production_service = ProductionService()
+    STEP_FAILURE_LABELS = {
+        "project": "Project creation",
+        "technologies": "Technology setup",
+        "components": "Component creation",
+        "devbox": "Development environment setup",
+        "scaffold": "Component initialization",
+        "compose": "Production config generation",
+    }
+    
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        super().__init__(db)
+        self.project_service = ProjectService(self.db)
+        self.technology_service = TechnologyService(self.db)
+        self.component_service = ComponentService(self.db)
+        self.production_service = ProductionService(self.db)
     
     def validate_input(self, data: Dict[str, Any]) -> tuple[bool, Optional[str]]:
         """Validate input data structure"""
@@ -119,30 +136,160 @@ class OrchestrationService(BaseService):
         
         return transformed_components, transformed_connections
     
+    def build_project_steps(self, input_data: Dict[str, Any]) -> tuple[list[Step], Dict[str, Any]]:
+        """
+        Build the provisioning step graph for a full project.
+        
+        project -> [technologies, components] -> devbox -> scaffold -> compose
+        
+        Technology and component records only need the project, so they are
+        created concurrently. The devbox step then installs every package the
+        project needs with a single `devbox add` (see DevboxPlanner), and
+        components are scaffolded once their toolchains are in place. Each step
+        receives the results of the steps it depends on (e.g. inputs['project']
+        is the created project's ID).
+        
+        Returns:
+            tuple: (steps, project_data)
+        """
+        project_data = self.transform_project_data(input_data)
+        project_id = project_data['id']
+        has_technologies = bool(input_data.get('technologies'))
+        has_components = bool(input_data.get('components'))
+        
+        async def create_project(_):
+            return await self.project_service.create_project(project_data)
+        
+        async def create_technologies(inputs):
+            project_id = inputs['project']
+            tech_data = self.transform_technologies_data(input_data, project_id)
+            return await self.technology_service.create_technologies(
+                project_id, tech_data, initialize_devbox=False
+            )
+        
+        async def create_components(inputs):
+            project_id = inputs['project']
+            comp_data, conn_data = self.transform_components_data(input_data, project_id)
+            return await self.component_service.create_components(
+                project_id, comp_data, conn_data, initialize_locally=False
+            )
+        
+        async def setup_devbox(inputs):
+            return await self.technology_service.setup_devbox_environment(inputs['project'])
+        
+        async def initialize_components(inputs):
+            # Components scaffolded by an earlier attempt are left alone
+            return await self.component_service.initialize_components(
+                inputs['project'], inputs['components'], skip_scaffolded=True
+            )
+        
+        async def generate_compose(_):
+            return await self.production_service.generate_docker_compose(project_id)
+        
+        steps = [
+            Step(
+                name="project",
+                func=create_project,
+                status=ProjectCreationStatus.CREATING_PROJECT,
+                message=f"Creating project structure for '{project_data['name']}'"
+            )
+        ]
+        records = []
+        
+        if has_technologies:
+            records.append("technologies")
+            steps.append(Step(
+                name="technologies",
+                func=create_technologies,
+                depends_on=["project"],
+                key=input_data['technologies'],
+                status=ProjectCreationStatus.CREATING_TECHNOLOGIES,
+                message=f"Registering {len(input_data['technologies'])} technologies"
+            ))
+        
+        if has_components:
+            records.append("components")
+            conn_count = len(input_data.get('connections') or [])
+            steps.append(Step(
+                name="components",
+                func=create_components,
+                depends_on=["project"],
+                key=[input_data['components'], input_data.get('connections')],
+                status=ProjectCreationStatus.CREATING_COMPONENTS,
+                message=f"Creating {len(input_data['components'])} components with {conn_count} connections"
+            ))
+        
+        if records:
+            steps.append(Step(
+                name="devbox",
+                func=setup_devbox,
+                depends_on=["project"] + records,
+                status=ProjectCreationStatus.CREATING_TECHNOLOGIES,
+                message="Installing development environment packages",
+                weight=2
+            ))
+        
+        if has_components:
+            steps.append(Step(
+                name="scaffold",
+                func=initialize_components,
+                depends_on=["project", "components", "devbox"],
+                status=ProjectCreationStatus.CREATING_COMPONENTS,
+                message=f"Scaffolding {len(input_data['components'])} components",
+                weight=max(2, len(input_data['components']))
+            ))
+        
+        if has_technologies and has_components:
+            steps.append(Step(
+                name="compose",
+                func=generate_compose,
+                depends_on=["technologies", "scaffold"],
+                status=ProjectCreationStatus.FINALIZING,
+                message="Generating production configuration"
+            ))
+        
+        return steps, project_data
+    
     async def orchestrate_full_project(
         self, 
         input_data: Dict[str, Any],
         operation_store=None,
-        operation_id: Optional[str] = None
+        operation_id: Optional[str] = None,
+        resume: bool = False
     ) -> tuple[bool, Optional[str], Optional[str]]:
         """
         Execute the complete project creation workflow.
         
-        Steps:
-        1. Create project directory and database record (30%)
-        2. Setup development environment with technologies (50%)
-        3. Create components and connections (70%)
-        4. Generate production docker-compose configuration (90-100%)
+        Steps run as a dependency graph (see build_project_steps):
+        1. Create project directory and database record
+        2. Create technology records                 } concurrently
+        3. Create component and connection records   }
+        4. Install all devbox packages in one pass
+        5. Scaffold components locally
+        6. Generate production docker-compose configuration
+        
+        With an operation ID, each step is checkpointed (see CheckpointStore)
+        and resuming the operation skips the steps that already completed.
+        Step durations are kept per project shape (see TimingHistory) and
+        turned into an estimated time remaining on every progress update.
         
         Args:
             input_data: Complete project specification
             operation_store: Redis operation store for progress tracking (optional)
             operation_id: Operation ID for progress updates (optional)
+            resume: Continue the operation's checkpointed run (optional)
             
         Returns:
             tuple: (success: bool, project_id: Optional[str], error_message: Optional[str])
         """
         project_id = None
+        project_data = None
+        checkpoints = None
+        
+        # Commands run by any step stream their output to this operation
+        context_token = None
+        if operation_store and operation_id:
+            context_token = set_operation_context(operation_store, operation_id)
         
         try:
             # Validate input
@@ -155,138 +302,63 @@ class OrchestrationService(BaseService):
             self.log_info(f"Beginning orchestration for: {input_data['project']['name']}")
             self.log_info("========================================")
             
-            # Step 2: Creating Project (30%)
-            if operation_store and operation_id:
-                await operation_store.update_operation(
+            if operation_id:
+                checkpoints = CheckpointStore(operation_id)
+                if not resume:
+                    # Pin the project ID so a resumed run builds the same steps
+                    input_data = {**input_data, 'project': {**input_data['project']}}
+                    input_data['project'].setdefault('id', str(uuid4()))
+                await checkpoints.start(input_data)
+            
+            steps, project_data = self.build_project_steps(input_data)
+            timings = TimingHistory()
+            shape = project_shape(input_data)
+            graph = StepGraph(
+                steps,
+                operation_store=operation_store,
+                operation_id=operation_id,
+                progress_start=10,
+                progress_end=95,
+                checkpoints=checkpoints,
+                estimates=await timings.estimate(shape) if operation_id else None
+            )
+            
+            success, results, error, failed_step = await graph.run()
+            
+            if operation_id:
+                await timings.record(
                     operation_id,
-                    ProjectCreationStatus.CREATING_PROJECT,
-                    f"Creating project structure for '{input_data['project']['name']}'",
-                    30
+                    shape,
+                    {name: result.duration_ms for name, result in results.items() if not result.skipped},
+                    success
                 )
             
-            self.log_info("Step 1/4: Creating project...")
-            project_data = self.transform_project_data(input_data)
+            for name, result in results.items():
+                if result.skipped:
+                    self.log_info(f"↷ Step '{name}' already completed")
+                else:
+                    self.log_info(f"✓ Step '{name}' finished in {result.duration_ms:.0f}ms")
+            
+            if 'project' in results:
+                project_id = results['project'].value
+            
+            if checkpoints:
+                await checkpoints.finish(success, project_id, failed_step, error)
             
-            success, project_id, error = await self.project_service.create_project(project_data)
             if not success:
-                self.log_error(f"Failed to create project: {error}")
+                label = self.STEP_FAILURE_LABELS.get(failed_step, "Orchestration")
+                self.log_error(f"{label} failed: {error}")
                 if operation_store and operation_id:
                     await operation_store.update_operation(
                         operation_id,
                         ProjectCreationStatus.FAILED,
-                        f"Project creation failed: {error}",
+                        f"{label} failed: {error}",
                         100,
                         error=error
                     )
-                return False, None, error
+                return False, project_id, error
             
-            self.log_info(f"✓ Project '{project_data['name']}' created with ID: {project_id}")
-            
-            # Step 3: Setup Development Environment - Technologies (50%)
-            if input_data.get('technologies'):
-                if operation_store and operation_id:
-                    await operation_store.update_operation(
-                        operation_id,
-                        ProjectCreationStatus.CREATING_TECHNOLOGIES,
-                        f"Setting up {len(input_data['technologies'])} technologies",
-                        50
-                    )
-                
-                self.log_info("Step 2/4: Setting up development environment...")
-                tech_data = self.transform_technologies_data(input_data, project_id)
-                
-                success, tech_ids, error = await self.technology_service.create_technologies(
-                    project_id, tech_data, initialize_devbox=True
-                )
-                if not success:
-                    self.log_error(f"Failed to create technologies: {error}")
-                    if operation_store and operation_id:
-                        await operation_store.update_operation(
-                            operation_id,
-                            ProjectCreationStatus.FAILED,
-                            f"Technology setup failed: {error}",
-                            100,
-                            error=error
-                        )
-                    return False, project_id, error
-                
-                self.log_info(f"✓ Development environment configured with {len(tech_ids)} technologies")
-            else:
-                self.log_info("Step 2/4: Skipped (no technologies specified)")
-            
-            # Step 4: Create Components and Connections (70%)
-            if input_data.get('components'):
-                if operation_store and operation_id:
-                    await operation_store.update_operation(
-                        operation_id,
-                        ProjectCreationStatus.CREATING_COMPONENTS,
-                        f"Creating {len(input_data['components'])} components",
-                        70
-                    )
-                
-                self.log_info("Step 3/4: Creating components and connections...")
-                comp_data, conn_data = self.transform_components_data(input_data, project_id)
-                
-                success, comp_ids, error = await self.component_service.create_components(
-                    project_id, comp_data, conn_data, initialize_locally=True
-                )
-                if not success:
-                    self.log_error(f"Failed to create components: {error}")
-                    if operation_store and operation_id:
-                        await operation_store.update_operation(
-                            operation_id,
-                            ProjectCreationStatus.FAILED,
-                            f"Component creation failed: {error}",
-                            100,
-                            error=error
-                        )
-                    return False, project_id, error
-                
-                conn_count = len(conn_data) if conn_data else 0
-                self.log_info(f"✓ Created {len(comp_ids)} components with {conn_count} connections")
-            else:
-                self.log_info("Step 3/4: Skipped (no components specified)")
-            
-            # Step 5: Creating Connections (80%)
-            if input_data.get('connections'):
-                if operation_store and operation_id:
-                    await operation_store.update_operation(
-                        operation_id,
-                        ProjectCreationStatus.CREATING_CONNECTIONS,
-                        f"Establishing {len(input_data['connections'])} connections",
-                        80
-                    )
-            
-            # Step 6: Finalizing - Generate Production Configuration (90%)
-            if input_data.get('components') and input_data.get('technologies'):
-                if operation_store and operation_id:
-                    await operation_store.update_operation(
-                        operation_id,
-                        ProjectCreationStatus.FINALIZING,
-                        "Generating production configuration",
-                        90
-                    )
-                
-                self.log_info("Step 4/4: Generating production configuration...")
-                
-                success, compose_path, error = await self.production_service.generate_docker_compose(project_id)
-                if not success:
-                    self.log_error(f"Failed to generate docker-compose: {error}")
-                    if operation_store and operation_id:
-                        await operation_store.update_operation(
-                            operation_id,
-                            ProjectCreationStatus.FAILED,
-                            f"Production config generation failed: {error}",
-                            100,
-                            error=error
-                        )
-                    return False, project_id, error
-                
-                self.log_info(f"✓ Production docker-compose.yml generated at {compose_path}")
-            else:
-                self.log_info("Step 4/4: Skipped (requires both components and technologies)")
-            
-            # Step 7: Completed (100%)
+            # Completed (100%)
             if operation_store and operation_id:
                 await operation_store.update_operation(
                     operation_id,
@@ -302,6 +374,14 @@ class OrchestrationService(BaseService):
             
             return True, project_id, None
             
+        except asyncio.CancelledError:
+            # Only an explicit cancel_operation rolls back; a worker shutting
+            # down leaves the checkpoints so the operation can be resumed
+            if checkpoints and project_data and operation_store:
+                if await asyncio.shield(operation_store.cancel_requested(operation_id)):
+                    await asyncio.shield(self._rollback_project(project_data['id'], checkpoints))
+            raise
+            
         except Exception as e:
             error_msg = f"Orchestration failed at project_id={project_id}: {str(e)}"
             self.log_error(error_msg)
@@ -317,6 +397,56 @@ class OrchestrationService(BaseService):
                 )
             
             return False, project_id, error_msg
+        
+        finally:
+            if context_token is not None:
+                reset_operation_context(context_token)
+    
+    async def _rollback_project(self, project_id: str, checkpoints: CheckpointStore):
+        """Remove everything a cancelled run created: records, project directory and checkpoints"""
+        self.log_info(f"Rolling back cancelled project {project_id}")
+        try:
+            project = await self.project_service.get_project(project_id)
+            await ProjectManager.delete_project_cascade(UUID(project_id))
+            if project and project.metadata.directory:
+                await asyncio.to_thread(shutil.rmtree, project.metadata.directory, True)
+            await checkpoints.delete()
+        except Exception as e:
+            self.log_error(f"Rollback of project {project_id} failed: {e}", error=e)
+    
+    async def resume_project(
+        self,
+        operation_id: str,
+        operation_store=None
+    ) -> tuple[bool, Optional[str], Optional[str]]:
+        """
+        Resume a failed orchestration run, re-running only the steps that
+        failed or never ran.
+        
+        Returns:
+            tuple: (success: bool, project_id: Optional[str], error_message: Optional[str])
+        """
+        checkpoint = await CheckpointStore(operation_id).load()
+        if not checkpoint or checkpoint.completed:
+            error = None if checkpoint else f"No checkpoints found for operation '{operation_id}'"
+            if operation_store:
+                await operation_store.update_operation(
+                    operation_id,
+                    ProjectCreationStatus.COMPLETED if checkpoint else ProjectCreationStatus.FAILED,
+                    "Operation already completed" if checkpoint else "Nothing to resume",
+                    100,
+                    project_id=checkpoint.project_id if checkpoint else None,
+                    error=error
+                )
+            return bool(checkpoint), checkpoint.project_id if checkpoint else None, error
+        
+        self.log_info(f"Resuming operation {operation_id} from step '{checkpoint.failed_step}'")
+        return await self.orchestrate_full_project(
+            checkpoint.input,
+            operation_store=operation_store,
+            operation_id=operation_id,
+            resume=True
+        )
     
     async def orchestrate_project_only(self, project_data: Dict[str, Any]) -> tuple[bool, Optional[str], Optional[str]]:
         """Create only the project (for GraphQL project.create mutation)"""
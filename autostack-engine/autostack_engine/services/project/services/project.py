@@ -8,10 +8,14 @@ from uuid import UUID
 
 from autostack_engine.utils.database.models.activities.models import ActivityLog, ActivityType, CreateDetails, FieldChange, ProjectUpdateDetails
 from autostack_engine.utils.database.models.ai.models import ProjectChat
-from autostack_engine.utils.database.models.project.models import Project, ProjectMetadata
-from autostack_engine.utils.database.mongo_client import DatabaseManager
+from autostack_engine.utils.database.models.project.models import Project, ProjectAvatar, ProjectManager, ProjectMetadata
+from autostack_engine.utils.database.pagination import Page, paginate
 from autostack_engine.utils.orchestration.models import BaseService
-from autostack_engine.utils.project.icon_generator import IdenticonGenerator
+from autostack_engine.utils.project.avatars import create_avatar
+
+
+# Project fields list views show
+PROJECT_LIST_FIELDS = ("name", "author", "description", "version", "status", "metadata", "avatar_hash", "created_at")
 
 
 class ProjectService(BaseService):
@@ -34,11 +38,14 @@ class ProjectService(BaseService):
         
         return Path.home() / "Documents"
     
+    def project_directory_path(self, project_name: str) -> Path:
+        """Where a project's files live"""
+        return self.get_documents_path() / "projects" / "autostack" / "created" / project_name.replace(" ", "_").lower()
+    
     def create_project_directory(self, project_name: str) -> Optional[str]:
         """Create the project directory structure."""
         try:
-            documents_path = self.get_documents_path()
-            project_dir = documents_path / "projects" / "autostack" / "created" / project_name.replace(" ", "_").lower()
+            project_dir = self.project_directory_path(project_name)
             project_dir.mkdir(parents=True, exist_ok=True)
             
             self.log_info(f"Created directory: {project_dir}")
@@ -47,6 +54,53 @@ class ProjectService(BaseService):
             self.log_error(f"Error creating directory for project '{project_name}': {e}")
             return None
     
+    def prepare_project(self, project_data: Dict[str, Any]) -> tuple[Project, ActivityLog, ProjectAvatar]:
+        """
+        Build the Project document and its creation activity without touching
+        the database or the filesystem.
+        
+        Args:
+            project_data: Dict containing project information (see create_project)
+            
+        Returns:
+            tuple: (project, activity, avatar)
+        """
+        project_name = project_data["name"]
+        
+        metadata = ProjectMetadata(
+            created_date=datetime.now().isoformat(),
+            directory=str(self.project_directory_path(project_name)),
+            last_modified=datetime.now().isoformat(),
+            tags=project_data.get("metadata", {}).get("tags", []),
+            environment=project_data.get("metadata", {}).get("environment", "development")
+        )
+        
+        avatar = create_avatar(project_name)
+        
+        project = Project(
+            id=project_data.get("id"),
+            name=project_name,
+            author=project_data.get("author", "Unknown"),
+            description=project_data.get("description", ""),
+            version=project_data.get("version", "1.0.0"),
+            avatar_hash=avatar.hash,
+            metadata=metadata,
+            chat_id=project_data.get('chat_id') or None
+        )
+        
+        activity = ActivityLog(
+            activity_type=ActivityType.CREATE_PROJECT,
+            project_id=project_data.get("id"),
+            project_name=project_name,
+            details=CreateDetails(
+                target_id=project_data.get("id"),
+                target_name=project_name,
+                target_type="project",
+            ).model_dump()
+        )
+        
+        return project, activity, avatar
+    
     async def create_project(self, project_data: Dict[str, Any]) -> tuple[bool, Optional[str], Optional[str]]:
         """
         Create a new project.
@@ -58,8 +112,7 @@ class ProjectService(BaseService):
             tuple: (success: bool, project_id: Optional[str], error_message: Optional[str])
         """
         try:
-            db = DatabaseManager()
-            await db.connect([Project, ProjectChat, ActivityLog])
+            await self.db.connect([Project, ProjectAvatar, ProjectChat, ActivityLog])
             
             project_name = project_data.get("name")
             if not project_name:
@@ -72,54 +125,19 @@ class ProjectService(BaseService):
                 self.log_error(error_msg)
                 return False, None, error_msg
             
+            project, activity, avatar = self.prepare_project(project_data)
+            
             # Create project directory
-            project_directory = self.create_project_directory(project_name)
-            if not project_directory:
+            if not self.create_project_directory(project_name):
                 return False, None, f"Failed to create directory for project '{project_name}'"
             
-            # Create metadata
-            metadata = ProjectMetadata(
-                created_date=datetime.now().isoformat(),
-                directory=project_directory,
-                last_modified=datetime.now().isoformat(),
-                tags=project_data.get("metadata", {}).get("tags", []),
-                environment=project_data.get("metadata", {}).get("environment", "development")
-            )
-            
-            generator = IdenticonGenerator()
-            img, hash_hex = generator.generate_identicon(project_name)
-            avatar_base64 = generator.image_to_base64(img)
-            
-            # Create project
-            project = Project(
-                id=project_data.get("id"),
-                name=project_name,
-                author=project_data.get("author", "Unknown"),
-                description=project_data.get("description", ""),
-                version=project_data.get("version", "1.0.0"),
-                avatar_data=avatar_base64,
-                avatar_hash=hash_hex,
-                metadata=metadata,
-                chat_id=project_data.get('chat_id', '')
-            )
-            
-            
+            # Avatar first, so the project never points at a missing image
+            await ProjectManager.save_avatar(avatar)
             await project.insert()
             if project_data.get('chat_id', ''):
                 project_chat = await ProjectChat.get(project_data.get('chat_id', ''))
                 project_chat.chat_title = f'{project_name} schema generation'
                 await project_chat.save()
-                
-            activity = ActivityLog(
-                activity_type=ActivityType.CREATE_PROJECT,
-                project_id=project_data.get("id"),
-                project_name=project_name,
-                details=CreateDetails(
-                    target_id=project_data.get("id"),
-                    target_name=project_name,
-                    target_type="project",
-                ).model_dump()
-            )
             
             await activity.insert()
             
@@ -161,8 +179,7 @@ class ProjectService(BaseService):
             tuple: (success: bool, error_message: Optional[str])
         """
         try:
-            db = DatabaseManager()
-            await db.connect([Project, ActivityLog])
+            await self.db.connect([Project, ActivityLog])
             
             project = await Project.get(project_id)
             if not project:
@@ -249,8 +266,7 @@ class ProjectService(BaseService):
             tuple: (success: bool, error_message: Optional[str])
         """
         try:
-            db = DatabaseManager()
-            await db.connect([Project, ActivityLog])
+            await self.db.connect([Project, ProjectAvatar, ActivityLog])
             
             project = await Project.get(project_id)
             if not project:
@@ -261,6 +277,7 @@ class ProjectService(BaseService):
             
             # Delete from database
             await project.delete()
+            await ProjectManager.delete_avatar(project.avatar_hash)
             activity = ActivityLog(
                 activity_type=ActivityType.DELETE_PROJECT,
                 project_id=project_id,
@@ -290,8 +307,7 @@ class ProjectService(BaseService):
     async def get_project(self, project_id: str) -> Optional[Project]:
         """Get a project by ID"""
         try:
-            db = DatabaseManager()
-            await db.connect([Project])
+            await self.db.connect([Project])
             return await Project.get(project_id)
         except Exception as e:
             self.log_error(f"Error fetching project: {e}")
@@ -300,8 +316,7 @@ class ProjectService(BaseService):
     async def get_project_by_chat(self, chat_id: str) -> Optional[Project]:
         """Get a project by its associated chat ID"""
         try:
-            db = DatabaseManager()
-            await db.connect([Project])
+            await self.db.connect([Project])
             
             project = await Project.find_one({"chat_id": UUID(chat_id)})
             if project:
@@ -314,12 +329,36 @@ class ProjectService(BaseService):
             self.log_error(f"Error fetching project by chat: {e}")
             return None
     
-    async def list_projects(self) -> list[Project]:
-        """List all projects"""
+    async def list_projects_page(
+        self,
+        first: int = 20,
+        after: Optional[str] = None,
+        with_total: bool = False
+    ) -> tuple[bool, Optional[Page], Optional[str]]:
+        """
+        List projects newest first, one page at a time.
+        
+        Args:
+            first: Number of projects to return
+            after: end_cursor of the previous page
+            with_total: Also count all projects
+            
+        Returns:
+            tuple: (success: bool, page with Project items: Optional[Page], error_message: Optional[str])
+        """
         try:
-            db = DatabaseManager()
-            await db.connect([Project])
-            return await Project.find_all().to_list()
+            await self.db.connect([Project])
+            page = await paginate(
+                Project,
+                first=first,
+                after=after,
+                projection={field: 1 for field in PROJECT_LIST_FIELDS},
+                with_total=with_total
+            )
+            page.items = [Project.model_validate(document) for document in page.items]
+            return True, page, None
+        except ValueError as e:
+            return False, None, str(e)
         except Exception as e:
             self.log_error(f"Error listing projects: {e}")
-            return []
+            return False, None, str(e)
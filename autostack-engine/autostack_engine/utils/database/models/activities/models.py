@@ -98,6 +98,8 @@ class ActivityLog(Document):
             IndexModel([("created_at", -1)]),
             IndexModel([("project_id", 1)]),
             IndexModel([("chat_id", 1)]),
+            IndexModel([("created_at", -1), ("_id", -1)]),
+            IndexModel([("project_id", 1), ("created_at", -1), ("_id", -1)]),
         ]
     
     def __repr__(self) -> str:
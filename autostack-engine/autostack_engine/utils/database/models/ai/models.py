@@ -24,6 +24,7 @@ class ProjectChat(Document):
         name = "project_chat"
         indexes = [
             IndexModel([("created_at", -1)]),
+            IndexModel([("created_at", -1), ("_id", -1)]),
         ]
         
 
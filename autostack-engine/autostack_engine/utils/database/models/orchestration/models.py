@@ -0,0 +1,74 @@
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from beanie import Document
+from pydantic import BaseModel, Field
+from pymongo import IndexModel
+
+
+class CheckpointStatus(str, Enum):
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class StepCheckpoint(BaseModel):
+    """Outcome of one orchestration step"""
+    status: CheckpointStatus
+    inputs_hash: str
+    value: Optional[Any] = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+    attempts: int = 1
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+
+class OperationCheckpoint(Document):
+    """
+    Per-step progress of an orchestration run, so a failed run can be
+    resumed from the steps that did not complete.
+    """
+    operation_id: str
+    input: Dict[str, Any]
+    steps: Dict[str, StepCheckpoint] = Field(default_factory=dict)
+    project_id: Optional[str] = None
+    failed_step: Optional[str] = None
+    error: Optional[str] = None
+    completed: bool = False
+
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "operation_checkpoints"
+        indexes = [
+            IndexModel([("operation_id", 1)], unique=True),
+            IndexModel([("project_id", 1)]),
+            IndexModel([("updated_at", -1)]),
+        ]
+
+
+class OperationTiming(Document):
+    """
+    Step durations of one orchestration run, keyed by the shape of the
+    project it provisioned. Feeds ETA estimates and the provisioning time
+    report long after the operation itself has expired.
+    """
+    operation_id: str
+    shape: str
+    frameworks: List[str] = Field(default_factory=list)
+    technology_count: int = 0
+    component_count: int = 0
+    # Step name -> duration in ms, only for steps that ran (not skipped)
+    steps: Dict[str, float] = Field(default_factory=dict)
+    total_ms: float = 0.0
+    success: bool = True
+
+    created_at: datetime = Field(default_factory=datetime.now)
+
+    class Settings:
+        name = "operation_timings"
+        indexes = [
+            IndexModel([("shape", 1), ("created_at", -1)]),
+            IndexModel([("frameworks", 1), ("created_at", -1)]),
+            IndexModel([("created_at", -1)]),
+        ]
@@ -1,16 +1,19 @@
 from uuid import UUID
 import uuid
 from beanie import Document
+from bson import Binary
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
 from datetime import datetime
 from pymongo import IndexModel
+from pymongo.errors import DuplicateKeyError
 from enum import Enum
 import logging
 
 from autostack_engine.utils.constants import TECHNOLOGY_CATALOG
 from autostack_engine.utils.database.models.components.models import Component, Connection, Environment
 from autostack_engine.utils.database.models.technologies.models import Technology
+from autostack_engine.utils.database.serialization import document_to_json
 
 
 logging.basicConfig(level=logging.INFO)
@@ -48,8 +51,7 @@ class Project(Document):
     author: Optional[str] = None
     description: Optional[str] = None
     version: str = "1.0.0"
-    avatar_data: Optional[str] = None
-    avatar_hash: Optional[str] = None
+    avatar_hash: Optional[str] = None  # Image stored as ProjectAvatar, served at /avatars/{avatar_hash}.png
     status: ProjectStatus = ProjectStatus.CREATED
     metadata: Optional[ProjectMetadata] = None
     
@@ -65,34 +67,137 @@ class Project(Document):
             IndexModel([("chat_id", 1)]),
             IndexModel([("created_at", -1)]),
             IndexModel([("updated_at", -1)]),
+            IndexModel([("created_at", -1), ("_id", -1)]),
         ]
     
     def __repr__(self) -> str:
         return f"<Project {self.name} v{self.version}>"
 
+class ProjectAvatar(Document):
+    """A project's identicon PNG, stored once per avatar_hash"""
+    id: UUID = Field(default_factory=uuid.uuid4, alias="_id")
+    hash: str
+    data: bytes
+    content_type: str = "image/png"
+    etag: str  # Digest of data, the HTTP ETag
+    created_at: datetime = Field(default_factory=datetime.now)
+    
+    class Settings:
+        name = "project_avatars"
+        indexes = [
+            IndexModel([("hash", 1)], unique=True),
+        ]
+
+
+# Documents that belong to a project, by the key get_project_graph returns them under
+PROJECT_GRAPH_MODELS = {
+    "technologies": Technology,
+    "environments": Environment,
+    "components": Component,
+    "connections": Connection,
+}
+
+
 # Helper class for managing project relationships
 class ProjectManager:
     
     @staticmethod
-    async def get_full_project(project_id: UUID) -> Dict[str, Any]:
-        """Get project with all related documents"""
-        project = await Project.get(project_id)
-        if not project:
+    def _project_graph_pipeline(
+        project_id: UUID,
+        include: Sequence[str],
+        enabled_technologies_only: bool,
+        exclude_project_fields: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        project_uuid = project_id if isinstance(project_id, UUID) else UUID(str(project_id))
+        
+        pipeline: List[Dict[str, Any]] = [{"$match": {"_id": Binary.from_uuid(project_uuid)}}]
+        if exclude_project_fields:
+            pipeline.append({"$project": {field: 0 for field in exclude_project_fields}})
+        
+        for name in include:
+            lookup = {
+                "from": PROJECT_GRAPH_MODELS[name].Settings.name,
+                "localField": "_id",
+                "foreignField": "project_id",
+                "as": name
+            }
+            if name == "technologies" and enabled_technologies_only:
+                lookup["pipeline"] = [{"$match": {"enabled": True}}]
+            pipeline.append({"$lookup": lookup})
+        return pipeline
+    
+    @staticmethod
+    async def get_project_graph(
+        project_id: UUID,
+        include: Sequence[str] = tuple(PROJECT_GRAPH_MODELS),
+        enabled_technologies_only: bool = False,
+        exclude_project_fields: Sequence[str] = ()
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a project and its related documents in a single round trip.
+        
+        One aggregation on the project joins each related collection with a
+        $lookup on its indexed project_id.
+        
+        Args:
+            project_id: The project ID
+            include: Related collections to join (keys of PROJECT_GRAPH_MODELS)
+            enabled_technologies_only: Only join technologies that are enabled
+            exclude_project_fields: Project fields not to load
+            
+        Returns:
+            dict: {"project": Project, <collection>: [documents]}, None if the project does not exist
+        """
+        pipeline = ProjectManager._project_graph_pipeline(
+            project_id, include, enabled_technologies_only, exclude_project_fields
+        )
+        documents = await Project.aggregate(pipeline).to_list()
+        if not documents:
             return None
         
-        # Get all related documents in parallel
-        technologies = await Technology.find({"project_id": project_id}).to_list()
-        environments = await Environment.find({"project_id": project_id}).to_list()
-        components = await Component.find({"project_id": project_id}).to_list()
-        connections = await Connection.find({"project_id": project_id}).to_list()
+        document = documents[0]
+        graph = {
+            name: [PROJECT_GRAPH_MODELS[name].model_validate(related) for related in document.pop(name)]
+            for name in include
+        }
+        graph["project"] = Project.model_validate(document)
+        return graph
+    
+    @staticmethod
+    async def get_project_graph_raw(
+        project_id: UUID,
+        include: Sequence[str] = tuple(PROJECT_GRAPH_MODELS),
+        enabled_technologies_only: bool = False,
+        exclude_project_fields: Sequence[str] = ()
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Same aggregation as get_project_graph, for read-only views: documents
+        come back as JSON-ready dicts (see to_json) instead of validated
+        models. Fields missing from a stored document are missing here too,
+        model defaults are not applied.
         
-        return {
-            "project": project,
-            "technologies": technologies,
-            "environments": environments,
-            "components": components,
-            "connections": connections,
+        Returns:
+            dict: {"project": dict, <collection>: [dicts]}, None if the project does not exist
+        """
+        pipeline = ProjectManager._project_graph_pipeline(
+            project_id, include, enabled_technologies_only, exclude_project_fields
+        )
+        documents = await Project.aggregate(pipeline).to_list()
+        if not documents:
+            return None
+        
+        document = documents[0]
+        graph = {
+            name: [document_to_json(related) for related in document.pop(name)]
+            for name in include
         }
+        graph["project"] = document_to_json(document)
+        return graph
+    
+    @staticmethod
+    async def get_full_project(project_id: UUID) -> Dict[str, Any]:
+        """Get project with all related documents"""
+        return await ProjectManager.get_project_graph(project_id)
         
         
     @staticmethod
@@ -104,12 +209,28 @@ class ProjectManager:
             await Component.find({"project_id": project_id}).delete()
             await Environment.find({"project_id": project_id}).delete()
             await Technology.find({"project_id": project_id}).delete()
-            await Project.get(project_id).delete()
+            project = await Project.get(project_id)
+            if project:
+                await ProjectManager.delete_avatar(project.avatar_hash)
+                await project.delete()
             return True
         except Exception as e:
             logger.error(f"Error deleting project {project_id}: {e}")
             return False
         
+    @staticmethod
+    async def save_avatar(avatar: ProjectAvatar):
+        """Store an avatar unless one with its hash exists (projects are deleted and recreated under the same name)"""
+        try:
+            await avatar.insert()
+        except DuplicateKeyError:
+            pass
+    
+    @staticmethod
+    async def delete_avatar(avatar_hash: Optional[str]):
+        if avatar_hash:
+            await ProjectAvatar.find_one(ProjectAvatar.hash == avatar_hash).delete()
+    
     @staticmethod
     async def get_project_technologies(project_id: UUID) -> List[Technology]:
         """Get all technologies for a project"""
@@ -1,110 +1,284 @@
+import asyncio
 from beanie import init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+from pymongo.monitoring import ConnectionCheckOutFailedReason
 import os
-from typing import List, Type, Optional, Set
+import threading
+from typing import Any, Dict, List, Type, Optional, Set
 from beanie import Document
 from autostack_engine.utils.database.models.beanie import Migration
 
 
+def get_document_models() -> List[Type[Document]]:
+    """
+    Return every Beanie document model used by the engine.
+
+    Imported lazily so the model modules (which import this module indirectly
+    through the services) don't create an import cycle.
+    """
+    from autostack_engine.utils.database.models.activities.models import ActivityLog
+    from autostack_engine.utils.database.models.ai.models import ProjectChat, SchemaRating
+    from autostack_engine.utils.database.models.components.models import Component, Connection, Environment
+    from autostack_engine.utils.database.models.jobs.models import Job
+    from autostack_engine.utils.database.models.orchestration.models import OperationCheckpoint, OperationTiming
+    from autostack_engine.utils.database.models.project.models import Project, ProjectAvatar
+    from autostack_engine.utils.database.models.technologies.models import Technology
+    from autostack_engine.utils.logging.services import LogStatistics, ServiceLog
+
+    return [
+        Migration,
+        Project,
+        ProjectAvatar,
+        Technology,
+        Component,
+        Connection,
+        Environment,
+        ProjectChat,
+        SchemaRating,
+        ActivityLog,
+        ServiceLog,
+        LogStatistics,
+        Job,
+        OperationCheckpoint,
+        OperationTiming,
+    ]
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """
+    Counts connection pool activity reported by the driver.
+
+    A checkout is counted as a wait when it starts while every pooled
+    connection is already checked out, and as an exhaustion when the driver
+    gives up because the wait queue timed out.
+    """
+
+    def __init__(self, max_pool_size: int):
+        self.max_pool_size = max_pool_size
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.checkout_waits = 0
+        self.checkout_failures = 0
+        self.pool_exhausted = 0
+        self.connections_created = 0
+        self.connections_closed = 0
+        self.in_use = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_pool_size": self.max_pool_size,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "checkout_waits": self.checkout_waits,
+                "checkout_failures": self.checkout_failures,
+                "pool_exhausted": self.pool_exhausted,
+                "connections_created": self.connections_created,
+                "connections_closed": self.connections_closed,
+                "in_use": self.in_use,
+            }
+
+    def connection_check_out_started(self, event):
+        with self._lock:
+            if self.in_use >= self.max_pool_size:
+                self.checkout_waits += 1
+
+    def connection_checked_out(self, event):
+        with self._lock:
+            self.checkouts += 1
+            self.in_use += 1
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.checkout_failures += 1
+            if event.reason == ConnectionCheckOutFailedReason.TIMEOUT:
+                self.pool_exhausted += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self.checkins += 1
+            self.in_use = max(0, self.in_use - 1)
+
+    def connection_created(self, event):
+        with self._lock:
+            self.connections_created += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self.connections_closed += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.in_use = 0
+
+    def pool_closed(self, event):
+        pass
+
+
 class DatabaseManager:
     """Manages MongoDB connections and Beanie document model initialization."""
-    
+
     def __init__(self):
         self._client: Optional[AsyncIOMotorClient] = None
         self._initialized_models: Set[str] = set()
         self._mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
         self._database_name = os.getenv("DATABASE_NAME", "autostack")
-    
+        self._connect_lock: Optional[asyncio.Lock] = None
+
+        # Pool settings
+        self._max_pool_size = int(os.getenv("MONGODB_MAX_POOL_SIZE", "100"))
+        self._min_pool_size = int(os.getenv("MONGODB_MIN_POOL_SIZE", "0"))
+        self._max_idle_time_ms = int(os.getenv("MONGODB_MAX_IDLE_TIME_MS", "300000"))
+        self._wait_queue_timeout_ms = int(os.getenv("MONGODB_WAIT_QUEUE_TIMEOUT_MS", "10000"))
+        self._server_selection_timeout_ms = int(os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+        self._connect_timeout_ms = int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", "10000"))
+
+        self._pool_metrics = PoolMetricsListener(self._max_pool_size)
+
     @property
     def client(self) -> Optional[AsyncIOMotorClient]:
         """Get the current database client."""
         return self._client
-    
+
     @property
     def is_connected(self) -> bool:
         """Check if database is connected."""
         return self._client is not None
-    
+
     @property
     def initialized_models(self) -> Set[str]:
         """Get the set of initialized model names."""
         return self._initialized_models.copy()
-    
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool settings and counters."""
+        return {
+            "connected": self.is_connected,
+            "min_pool_size": self._min_pool_size,
+            "wait_queue_timeout_ms": self._wait_queue_timeout_ms,
+            "initialized_models": len(self._initialized_models),
+            **self._pool_metrics.snapshot(),
+        }
+
+    def _create_client(self) -> AsyncIOMotorClient:
+        return AsyncIOMotorClient(
+            self._mongodb_url,
+            maxPoolSize=self._max_pool_size,
+            minPoolSize=self._min_pool_size,
+            maxIdleTimeMS=self._max_idle_time_ms,
+            waitQueueTimeoutMS=self._wait_queue_timeout_ms,
+            serverSelectionTimeoutMS=self._server_selection_timeout_ms,
+            connectTimeoutMS=self._connect_timeout_ms,
+            event_listeners=[self._pool_metrics],
+        )
+
     async def connect(self, document_models: Optional[List[Type[Document]]] = None) -> AsyncIOMotorClient:
         """
         Connect to the database with specified document models.
-        
+
+        Once a model has been registered the call is a cheap set lookup, so
+        services can keep calling this before each query.
+
         Args:
             document_models: List of Beanie document model classes to initialize.
                            If None, defaults to [Migration].
-        
+
         Returns:
             AsyncIOMotorClient: The MongoDB client instance
         """
         # Set default models if none provided
         if document_models is None:
             document_models = [Migration]
-        
-        # Create client if it doesn't exist
-        if self._client is None:
-            self._client = AsyncIOMotorClient(self._mongodb_url)
-        
-        # Filter out models that are already initialized
-        new_models = [model for model in document_models 
-                      if model.__name__ not in self._initialized_models]
-        
-        # Only initialize if there are new models
-        if new_models:
-            # Initialize with all requested models (Beanie handles duplicates)
-            await init_beanie(
-                database=self._client[self._database_name],
-                document_models=document_models
-            )
-            
-            # Update our tracking set
-            self._initialized_models.update(model.__name__ for model in document_models)
-        
+
+        # Fast path: client exists and every model is already registered
+        if self._client is not None and all(
+            model.__name__ in self._initialized_models for model in document_models
+        ):
+            return self._client
+
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+
+        async with self._connect_lock:
+            # Create client if it doesn't exist
+            if self._client is None:
+                self._client = self._create_client()
+
+            # Filter out models that are already initialized
+            new_models = [model for model in document_models
+                          if model.__name__ not in self._initialized_models]
+
+            # Only initialize if there are new models
+            if new_models:
+                await init_beanie(
+                    database=self._client[self._database_name],
+                    document_models=new_models
+                )
+
+                # Update our tracking set
+                self._initialized_models.update(model.__name__ for model in new_models)
+
         return self._client
-    
+
+    async def connect_all(self) -> AsyncIOMotorClient:
+        """Connect and register every document model in one init_beanie call."""
+        return await self.connect(get_document_models())
+
     async def add_models(self, document_models: List[Type[Document]]) -> None:
         """
         Add new document models to an existing connection.
-        
+
         Args:
             document_models: List of Beanie document model classes to add.
         """
         if not self.is_connected:
             raise RuntimeError("Database not connected. Call connect() first.")
-        
+
         await self.connect(document_models)
-    
+
     async def disconnect(self) -> None:
         """Close the database connection and reset state."""
         if self._client:
             self._client.close()
             self._client = None
             self._initialized_models.clear()
-    
+
     def get_database(self, name: Optional[str] = None):
         """
         Get a database instance.
-        
+
         Args:
             name: Database name. If None, uses default database name.
-        
+
         Returns:
             Database instance
         """
         if not self.is_connected:
             raise RuntimeError("Database not connected. Call connect() first.")
-        
+
         db_name = name or self._database_name
         return self._client[db_name]
 
 
-# Global instance for backward compatibility
+# Process-wide shared instance
 _db_manager = DatabaseManager()
 
+
+def get_database_manager() -> DatabaseManager:
+    """Get the process-wide shared database manager."""
+    return _db_manager
+
 # Convenience functions for backward compatibility
 async def connect_to_database(document_models: Optional[List[Type[Document]]] = None) -> AsyncIOMotorClient:
     """Connect to the database (backward compatibility function)."""
@@ -116,4 +290,4 @@ async def get_client() -> Optional[AsyncIOMotorClient]:
 
 async def disconnect_from_database() -> None:
     """Disconnect from database (backward compatibility function)."""
-    await _db_manager.disconnect()
\ No newline at end of file
+    await _db_manager.disconnect()
@@ -0,0 +1,133 @@
+import base64
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from beanie import Document
+from bson import json_util
+
+from autostack_engine.utils.database.serialization import to_bson
+
+# Largest page a client can ask for, and how long a total count is reused
+PAGE_MAX_SIZE = int(os.getenv("PAGE_MAX_SIZE", "100"))
+PAGE_COUNT_TTL_SECONDS = float(os.getenv("PAGE_COUNT_TTL_SECONDS", "30"))
+
+
+def encode_cursor(sort_value: Any, document_id: Any) -> str:
+    """Opaque cursor for the position right after a document"""
+    return base64.urlsafe_b64encode(json_util.dumps([sort_value, document_id]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    """(sort value, _id) of a cursor; raises ValueError if it is not one of ours"""
+    try:
+        sort_value, document_id = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return sort_value, document_id
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+@dataclass
+class Page:
+    """One page of raw documents and where the next one starts"""
+    items: List[Dict[str, Any]] = field(default_factory=list)
+    end_cursor: Optional[str] = None
+    has_next_page: bool = False
+    total_count: Optional[int] = None
+
+
+class CountCache:
+    """
+    Total document counts per collection and filter, reused for
+    PAGE_COUNT_TTL_SECONDS so paging through a list does not count the
+    collection again for every page. Unfiltered counts come from the
+    collection metadata instead of a scan.
+    """
+
+    def __init__(self, ttl: float = PAGE_COUNT_TTL_SECONDS):
+        self.ttl = ttl
+        self._counts: Dict[str, Tuple[float, int]] = {}
+
+    async def count(self, model: Type[Document], query: Dict[str, Any]) -> int:
+        key = f"{model.Settings.name}:{json_util.dumps(query, sort_keys=True)}"
+        cached = self._counts.get(key)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        if query:
+            total = await model.find(query).count()
+        else:
+            total = await model.get_pymongo_collection().estimated_document_count()
+        self._counts[key] = (time.monotonic(), total)
+        return total
+
+
+_count_cache: Optional[CountCache] = None
+
+
+def get_count_cache() -> CountCache:
+    global _count_cache
+    if _count_cache is None:
+        _count_cache = CountCache()
+    return _count_cache
+
+
+async def paginate(
+    model: Type[Document],
+    query: Optional[Dict[str, Any]] = None,
+    sort_field: str = "created_at",
+    first: int = 20,
+    after: Optional[str] = None,
+    projection: Optional[Dict[str, Any]] = None,
+    with_total: bool = False
+) -> Page:
+    """
+    Newest-first keyset pagination over (sort_field, _id).
+
+    Instead of skipping, each page starts right after the cursor's
+    (sort_field, _id) pair, so with an index on query fields + sort_field +
+    _id every page costs the same however deep it is. The page is read
+    with `first + 1` documents to know whether another one follows.
+    Documents whose sort_field is null or missing sort after all others
+    (ordered by _id alone), so they are paged through last rather than
+    skipped. Items are raw documents; sort_field and _id are always included.
+
+    Raises:
+        ValueError: If `after` is not a valid cursor
+    """
+    first = max(1, min(first, PAGE_MAX_SIZE))
+    query = to_bson(query or {})
+
+    match = query
+    if after:
+        sort_value, document_id = decode_cursor(after)
+        if sort_value is None:
+            # Already among the documents without a sort value, only _id orders them
+            keyset = {sort_field: None, "_id": {"$lt": document_id}}
+        else:
+            keyset = {"$or": [
+                {sort_field: {"$lt": sort_value}},
+                {sort_field: sort_value, "_id": {"$lt": document_id}},
+                {sort_field: None}
+            ]}
+        match = {"$and": [query, keyset]} if query else keyset
+
+    pipeline: List[Dict[str, Any]] = [
+        {"$match": match},
+        {"$sort": {sort_field: -1, "_id": -1}},
+        {"$limit": first + 1}
+    ]
+    if projection:
+        if all(value for value in projection.values()):
+            projection = {**projection, sort_field: 1}
+        pipeline.append({"$project": projection})
+
+    documents = await model.aggregate(pipeline).to_list()
+    page = Page(items=documents[:first], has_next_page=len(documents) > first)
+    if page.items:
+        last = page.items[-1]
+        page.end_cursor = encode_cursor(last.get(sort_field), last["_id"])
+    if with_total:
+        page.total_count = await get_count_cache().count(model, query)
+    return page
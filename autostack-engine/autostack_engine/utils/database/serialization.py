@@ -0,0 +1,87 @@
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Type
+from uuid import UUID
+
+from beanie import Document
+from bson import Binary, Decimal128, ObjectId
+
+
+def _binary(value: Binary) -> Any:
+    # UUIDs come back as Binary, the client has no UUID representation configured
+    if value.subtype in (3, 4) and len(value) == 16:
+        return str(UUID(bytes=bytes(value)))
+    return value.hex()
+
+
+# Exact type -> converter, looked up once per value; containers are handled
+# in to_json, and anything else is already JSON-compatible
+_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    UUID: str,
+    Binary: _binary,
+    ObjectId: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Decimal128: lambda value: str(value.to_decimal()),
+    Decimal: str,
+}
+
+
+def to_json(value: Any) -> Any:
+    """
+    Convert a raw BSON value (as returned by the driver) to what
+    model_dump(mode='json') would produce, without building a model.
+    """
+    converter = _CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_json(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def document_to_json(document: Dict[str, Any]) -> Dict[str, Any]:
+    """A raw document as JSON, with `_id` renamed to `id` like the models' field"""
+    data = to_json(document)
+    if "_id" in data:
+        data["id"] = data.pop("_id")
+    return data
+
+
+def to_bson(value: Any) -> Any:
+    """Encode UUIDs in a query or pipeline the way Beanie stores them"""
+    if isinstance(value, UUID):
+        return Binary.from_uuid(value)
+    if isinstance(value, dict):
+        return {key: to_bson(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_bson(item) for item in value]
+    return value
+
+
+async def find_raw(
+    model: Type[Document],
+    query: Dict[str, Any],
+    projection: Optional[Dict[str, Any]] = None,
+    sort: Optional[Dict[str, int]] = None,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Read-only fast path: matching documents as JSON-ready dicts, fetched with
+    a projection and converted by to_json instead of being validated into
+    models. Use it where results go straight out to GraphQL.
+    """
+    pipeline: List[Dict[str, Any]] = [{"$match": to_bson(query)}]
+    if sort:
+        pipeline.append({"$sort": sort})
+    if limit:
+        pipeline.append({"$limit": limit})
+    if projection:
+        pipeline.append({"$project": projection})
+
+    return [document_to_json(document) for document in await model.aggregate(pipeline).to_list()]
@@ -0,0 +1,228 @@
+import asyncio
+import fcntl
+import json
+import os
+import shutil
+import weakref
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import structlog
+
+from autostack_engine.utils.process.runner import run_command
+
+logger = structlog.get_logger()
+
+LATEST = "latest"
+LOCK_POLL_INTERVAL = 0.2
+
+
+def split_package(spec: str) -> tuple[str, str]:
+    """Split a devbox package spec ("nodejs@20", "python") into (name, version)"""
+    name, sep, version = spec.partition("@")
+    return name.strip(), (version.strip() if sep and version.strip() else LATEST)
+
+
+def read_devbox_packages(project_directory: Path) -> Dict[str, str]:
+    """Packages already declared in devbox.json, as {name: version}"""
+    try:
+        with open(project_directory / "devbox.json") as f:
+            config = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    packages = config.get("packages") or []
+    declared = {}
+    if isinstance(packages, dict):
+        for name, value in packages.items():
+            version = value.get("version") if isinstance(value, dict) else value
+            declared[name] = version or LATEST
+    else:
+        for spec in packages:
+            name, version = split_package(spec)
+            declared[name] = version
+    return declared
+
+
+class DevboxPlanner:
+    """
+    Collects every devbox package a project needs and installs them together.
+
+    Services register packages with add(); apply() then runs a single
+    `devbox add` for everything not yet in devbox.json, so Nix resolves the
+    whole set once. Applies are serialized per project with an asyncio lock
+    (within the process) and a file lock (across processes), since each one
+    rewrites devbox.json and devbox.lock.
+
+    Unpinned packages are pinned to @latest and the first explicit version
+    requested for a package wins. Steps that need the environment call wait(),
+    which returns once every registered package has been applied.
+    """
+
+    def __init__(self, project_directory: str):
+        self.project_directory = Path(project_directory).resolve()
+        self.lock_path = self.project_directory / ".autostack" / "devbox-planner.lock"
+        self._requested: Dict[str, str] = {}
+        self._applied: Dict[str, str] = {}
+        self._lock = asyncio.Lock()
+        self._error: Optional[str] = None
+
+    def add(self, packages: Iterable[str]) -> List[str]:
+        """
+        Register packages for the next apply.
+
+        Returns:
+            list: Conflicting specs that were ignored in favour of an earlier pin
+        """
+        conflicts = []
+        for spec in packages:
+            name, version = split_package(spec)
+            if not name:
+                continue
+            current = self._requested.get(name)
+            if current is None or current == LATEST:
+                self._requested[name] = version
+                self._error = None  # New packages get a fresh attempt
+            elif version not in (LATEST, current):
+                conflicts.append(spec)
+                logger.warning(f"Ignoring {spec}: {name}@{current} was already requested")
+        return conflicts
+
+    @property
+    def packages(self) -> List[str]:
+        """Every registered package as a pinned spec"""
+        return [f"{name}@{version}" for name, version in sorted(self._requested.items())]
+
+    @property
+    def ready(self) -> bool:
+        """Whether every registered package has been applied"""
+        return not self.pending
+
+    @property
+    def pending(self) -> List[str]:
+        """Registered packages that have not been applied yet"""
+        return [
+            f"{name}@{version}"
+            for name, version in sorted(self._requested.items())
+            if self._applied.get(name) != version
+        ]
+
+    async def _acquire_file_lock(self) -> int:
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            # Poll rather than block in a thread, so a cancelled operation
+            # stops waiting without leaving a thread to take the lock later
+            while True:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    return fd
+                except BlockingIOError:
+                    await asyncio.sleep(LOCK_POLL_INTERVAL)
+        except BaseException:
+            os.close(fd)
+            raise
+
+    @staticmethod
+    def _release_file_lock(fd: int):
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    async def apply(self) -> tuple[bool, Optional[str]]:
+        """
+        Install every pending package with one `devbox add`.
+
+        Returns:
+            tuple: (success: bool, error_message: Optional[str])
+        """
+        async with self._lock:
+            if self._error:
+                return False, self._error
+
+            pending = self.pending
+            if not pending:
+                return True, None
+
+            if not shutil.which("devbox"):
+                logger.warning("devbox command not found. Skipping devbox package installation.")
+                self._mark_applied(pending)
+                return True, None
+
+            fd = await self._acquire_file_lock()
+            try:
+                success, error = await self._apply_locked(pending)
+            finally:
+                self._release_file_lock(fd)
+
+            if success:
+                self._mark_applied(pending)
+            else:
+                self._error = error
+            return success, error
+
+    async def _apply_locked(self, pending: List[str]) -> tuple[bool, Optional[str]]:
+        cwd = str(self.project_directory)
+
+        if not (self.project_directory / "devbox.json").exists():
+            logger.info(f"Initializing devbox in {cwd}")
+            result = await run_command(["devbox", "init"], cwd=cwd, label="devbox")
+            if not result.ok:
+                return False, f"devbox init failed: {result.stderr.strip()}"
+
+        # devbox.json may have been updated by another process or by hand
+        declared = read_devbox_packages(self.project_directory)
+        to_add = []
+        for spec in pending:
+            name, version = split_package(spec)
+            if name not in declared:
+                to_add.append(spec)
+            elif version not in (LATEST, declared[name]):
+                logger.warning(f"Keeping {name}@{declared[name]} from devbox.json instead of {spec}")
+
+        if not to_add:
+            logger.info("All devbox packages already present")
+            return True, None
+
+        logger.info(f"Adding {len(to_add)} devbox packages: {', '.join(to_add)}")
+        result = await run_command(["devbox", "add"] + to_add, cwd=cwd, label="devbox")
+        if not result.ok:
+            return False, f"devbox add failed: {result.stderr.strip()}"
+
+        logger.info(f"Devbox packages installed in {result.duration_ms / 1000:.1f}s")
+        return True, None
+
+    def _mark_applied(self, specs: List[str]):
+        for spec in specs:
+            name, version = split_package(spec)
+            self._applied[name] = version
+
+    async def wait(self) -> tuple[bool, Optional[str]]:
+        """
+        Wait until every registered package is installed. Waits behind an
+        apply that is already running and applies whatever is still pending
+        after it; a failed apply is reported to every waiter until new
+        packages are added.
+        """
+        return await self.apply()
+
+    @property
+    def error(self) -> Optional[str]:
+        return self._error
+
+
+# Planners live as long as some service holds them, so concurrent steps of one
+# provisioning run share a planner without the registry growing per project.
+# A planner created later re-reads devbox.json and only adds what is missing.
+_planners: "weakref.WeakValueDictionary[str, DevboxPlanner]" = weakref.WeakValueDictionary()
+
+
+def get_devbox_planner(project_directory: str) -> DevboxPlanner:
+    """Get the planner for a project directory (shared by everyone using it)"""
+    key = str(Path(project_directory).resolve())
+    planner = _planners.get(key)
+    if planner is None:
+        planner = DevboxPlanner(key)
+        _planners[key] = planner
+    return planner
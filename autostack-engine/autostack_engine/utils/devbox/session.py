@@ -0,0 +1,229 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+import structlog
+
+from autostack_engine.utils.process.runner import CommandResult, run_command
+
+logger = structlog.get_logger()
+
+DEVBOX_FILES = ("devbox.json", "devbox.lock")
+
+# Variables that describe the evaluating shell rather than the environment
+VOLATILE_VARIABLES = {"PWD", "OLDPWD", "SHLVL", "_"}
+
+EVALUATION_TIMEOUT = float(os.getenv("DEVBOX_ENV_EVALUATION_TIMEOUT_SECONDS", "900"))
+
+
+def find_devbox_project(path: Path) -> Optional[Path]:
+    """Nearest directory at or above path that has a devbox.json (like devbox itself)"""
+    path = Path(path).resolve()
+    for candidate in (path, *path.parents):
+        if (candidate / "devbox.json").exists():
+            return candidate
+    return None
+
+
+def devbox_fingerprint(project_directory: Path) -> str:
+    """Hash of the files that determine a devbox environment"""
+    digest = hashlib.sha256()
+    for name in DEVBOX_FILES:
+        digest.update(name.encode())
+        try:
+            digest.update((project_directory / name).read_bytes())
+        except OSError:
+            digest.update(b"\0missing")
+    return digest.hexdigest()
+
+
+class DevboxSession:
+    """
+    An evaluated devbox environment for one project.
+
+    Holds only the variables devbox sets or changes (PATH, nix paths,
+    init_hook exports, ...); commands run with those on top of the current
+    environment, without going through `devbox run`.
+    """
+
+    def __init__(self, project_directory: Path, fingerprint: str, variables: Dict[str, str]):
+        self.project_directory = project_directory
+        self.fingerprint = fingerprint
+        self.variables = variables
+
+    def env(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        return {**os.environ, **self.variables, **(extra or {})}
+
+    async def run(
+        self,
+        cmd: Sequence[str],
+        cwd: Optional[str] = None,
+        extra_env: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        label: Optional[str] = None
+    ) -> CommandResult:
+        return await run_command(
+            cmd,
+            cwd=cwd or str(self.project_directory),
+            env=self.env(extra_env),
+            timeout=timeout,
+            label=label
+        )
+
+
+class DevboxSessionManager:
+    """
+    Evaluates each project's devbox environment once and reuses it.
+
+    An evaluation runs `devbox run -- env -0` and keeps the difference from
+    the current environment. Sessions are cached in memory and in
+    <project>/.autostack/devbox-env.json, keyed by a hash of devbox.json and
+    devbox.lock, so adding packages (which rewrites both) invalidates them.
+    Concurrent callers for the same project share one evaluation.
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv("DEVBOX_ENV_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+        self._sessions: Dict[str, DevboxSession] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        self.hits = 0
+        self.evaluations = 0
+
+    @staticmethod
+    def _cache_path(project_directory: Path) -> Path:
+        return project_directory / ".autostack" / "devbox-env.json"
+
+    def _load(self, project_directory: Path, fingerprint: str) -> Optional[DevboxSession]:
+        try:
+            with open(self._cache_path(project_directory)) as f:
+                cached = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if cached.get("fingerprint") != fingerprint:
+            return None
+        return DevboxSession(project_directory, fingerprint, cached.get("variables", {}))
+
+    def _save(self, session: DevboxSession):
+        path = self._cache_path(session.project_directory)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+        with open(tmp, "w") as f:
+            json.dump({"fingerprint": session.fingerprint, "variables": session.variables}, f)
+        os.chmod(tmp, 0o600)
+        os.replace(tmp, path)
+
+    async def _evaluate(self, project_directory: Path, fingerprint: str) -> Optional[DevboxSession]:
+        result = await run_command(
+            ["devbox", "run", "--", "env", "-0"],
+            cwd=str(project_directory),
+            timeout=EVALUATION_TIMEOUT,
+            label="devbox",
+            publish=False
+        )
+        if not result.ok:
+            logger.warning(f"Could not evaluate devbox environment in {project_directory}: {result.stderr.strip()}")
+            return None
+
+        variables = {}
+        for entry in result.stdout.split("\0"):
+            name, sep, value = entry.partition("=")
+            if not sep or name in VOLATILE_VARIABLES:
+                continue
+            if os.environ.get(name) != value:
+                variables[name] = value
+
+        self.evaluations += 1
+        logger.info(
+            f"Evaluated devbox environment for {project_directory} in {result.duration_ms / 1000:.1f}s",
+            variables=len(variables)
+        )
+        return DevboxSession(project_directory, fingerprint, variables)
+
+    async def get(self, project_directory: str) -> Optional[DevboxSession]:
+        """
+        Session for a project, evaluating the environment if devbox.json or
+        devbox.lock changed since the last evaluation. None when there is no
+        devbox project, devbox is not installed or evaluation fails.
+        """
+        if not self.enabled or not shutil.which("devbox"):
+            return None
+
+        path = Path(project_directory).resolve()
+        if not (path / "devbox.json").exists():
+            return None
+
+        key = str(path)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            fingerprint = await asyncio.to_thread(devbox_fingerprint, path)
+            session = self._sessions.get(key)
+            if session and session.fingerprint == fingerprint:
+                self.hits += 1
+                return session
+
+            session = self._load(path, fingerprint)
+            if session:
+                self.hits += 1
+            else:
+                session = await self._evaluate(path, fingerprint)
+                if not session:
+                    self._sessions.pop(key, None)
+                    return None
+                self._save(session)
+
+            self._sessions[key] = session
+            return session
+
+    def invalidate(self, project_directory: str):
+        """Drop a project's cached environment"""
+        path = Path(project_directory).resolve()
+        self._sessions.pop(str(path), None)
+        self._cache_path(path).unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, int]:
+        return {"sessions": len(self._sessions), "hits": self.hits, "evaluations": self.evaluations}
+
+
+_session_manager: Optional[DevboxSessionManager] = None
+
+
+def get_devbox_sessions() -> DevboxSessionManager:
+    """Get the process-wide devbox session manager"""
+    global _session_manager
+    if _session_manager is None:
+        _session_manager = DevboxSessionManager()
+    return _session_manager
+
+
+async def devbox_run(
+    cmd: Sequence[str],
+    cwd: str,
+    project_directory: Optional[str] = None,
+    extra_env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    label: Optional[str] = None
+) -> CommandResult:
+    """
+    Run a command inside a project's devbox environment.
+
+    Uses the cached session when there is one and falls back to
+    `devbox run -- <cmd>` otherwise. The project defaults to the nearest
+    devbox.json at or above cwd.
+    """
+    project = Path(project_directory) if project_directory else find_devbox_project(Path(cwd))
+    session = await get_devbox_sessions().get(str(project)) if project else None
+    if session:
+        return await session.run(cmd, cwd=cwd, extra_env=extra_env, timeout=timeout, label=label)
+
+    return await run_command(
+        ["devbox", "run", "--", *cmd],
+        cwd=cwd,
+        env={**os.environ, **extra_env} if extra_env else None,
+        timeout=timeout,
+        label=label
+    )
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import os
+import traceback
+from typing import Any, Dict, Optional
+
+from autostack_engine.utils.jobs.handlers import report_job_cancelled, report_job_failure, run_job
+from autostack_engine.utils.jobs.queue import DEFAULT_MAX_ATTEMPTS, Job, RedisJobQueue, parse_queues
+from autostack_engine.utils.orchestration.admission import get_admission_controller
+from autostack_engine.utils.orchestration.models import user_id_var
+
+
+logger = logging.getLogger(__name__)
+
+
+def job_execution_mode() -> str:
+    """
+    'queue' hands jobs to worker processes through Redis, 'inline' runs them
+    as tasks in the gateway. The in-memory operation store cannot be shared
+    with workers, so it always runs jobs inline.
+    """
+    if os.getenv("OPERATION_STORE_BACKEND", "redis").lower() == "memory":
+        return "inline"
+    return os.getenv("JOB_EXECUTION", "queue").lower()
+
+
+class JobDispatcher:
+    """Starts background work for resolvers, on a worker or in-process"""
+
+    def __init__(self, operation_store, job_queue: Optional[RedisJobQueue] = None):
+        self.operation_store = operation_store
+        self.job_queue = job_queue
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._watcher: Optional[asyncio.Task] = None
+        self._closing = False
+
+    async def start(self):
+        """Listen for cancellation requests aimed at inline jobs"""
+        if self.job_queue is None:
+            self._watcher = asyncio.create_task(self.operation_store.watch_cancellations(self._cancel))
+
+    def _cancel(self, operation_id: str):
+        from autostack_engine.services.orchestration.service.batch import cancel_batch_project
+
+        task = self._tasks.get(operation_id)
+        if task and not task.done():
+            logger.info(f"Cancelling inline job {operation_id}")
+            task.cancel()
+        elif cancel_batch_project(operation_id):
+            logger.info(f"Cancelling batch project {operation_id}")
+
+    async def dispatch(
+        self,
+        queue: str,
+        kind: str,
+        operation_id: str,
+        payload: Dict[str, Any],
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    ) -> str:
+        """Start a job for an operation created by the caller; returns the job ID"""
+        payload = {**payload, "operation_id": operation_id, "user_id": user_id_var.get()}
+
+        if self.job_queue is not None:
+            return await self.job_queue.enqueue(queue, kind, payload, job_id=operation_id, max_attempts=max_attempts)
+
+        job = Job(id=operation_id, queue=queue, kind=kind, payload=payload, attempts=1, max_attempts=1)
+        task = asyncio.create_task(self._run_inline(job))
+        self._tasks[job.id] = task
+        task.add_done_callback(lambda done: self._forget(job.id, done))
+        return job.id
+
+    def _forget(self, job_id: str, task: asyncio.Task):
+        if self._tasks.get(job_id) is task:
+            del self._tasks[job_id]
+
+    async def _run_inline(self, job: Job):
+        try:
+            await run_job(job, self.operation_store)
+        except asyncio.CancelledError:
+            if self._closing:
+                await report_job_failure(job, self.operation_store, "Interrupted by gateway shutdown")
+            else:
+                await report_job_cancelled(job, self.operation_store)
+        except Exception as e:
+            logger.error(f"Inline {job.kind} job {job.id} failed: {e}\n{traceback.format_exc()}")
+            await report_job_failure(job, self.operation_store, str(e))
+
+    async def close(self):
+        """Stop inline jobs and close the queue connection"""
+        self._closing = True
+        if self._watcher:
+            self._watcher.cancel()
+            await asyncio.gather(self._watcher, return_exceptions=True)
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            logger.warning(f"Cancelling {len(tasks)} inline jobs")
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if self.job_queue is not None:
+            await self.job_queue.close()
+
+    async def stats(self) -> Dict[str, Any]:
+        if self.job_queue is None:
+            return {"mode": "inline", "running": len(self._tasks), "admission": get_admission_controller().stats()}
+        return {
+            "mode": "queue",
+            "queues": {name: await self.job_queue.stats(name) for name in parse_queues()}
+        }
@@ -0,0 +1,208 @@
+import logging
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from autostack_engine.utils.jobs.queue import Job
+from autostack_engine.utils.orchestration.admission import get_admission_controller
+from autostack_engine.utils.orchestration.models import user_id_var
+from autostack_engine.utils.project.subscription import ProjectCreationStatus, ProjectDeletionStatus
+
+
+logger = logging.getLogger(__name__)
+
+# A handler reports progress and its outcome through the operation store.
+# Expected failures (a service returning success=False) are terminal and
+# reported by the handler; exceptions propagate so the worker can retry.
+JobHandler = Callable[[Job, Any], Awaitable[None]]
+
+_handlers: Dict[str, Tuple[JobHandler, str]] = {}
+
+
+def job_handler(kind: str, failure_message: str):
+    """Register a coroutine as the handler for a job kind"""
+    def register(func: JobHandler) -> JobHandler:
+        _handlers[kind] = (func, failure_message)
+        return func
+    return register
+
+
+async def run_job(job: Job, operation_store):
+    """Run a job's handler; raises whatever the handler raises"""
+    handler = _handlers.get(job.kind)
+    if handler is None:
+        raise KeyError(f"No handler registered for job kind '{job.kind}'")
+    user_id_var.set(job.payload.get("user_id"))
+    await handler[0](job, operation_store)
+
+
+async def report_job_failure(job: Job, operation_store, error: str, retrying: bool = False):
+    """Surface an unexpected job error on its operation"""
+    operation_id = job.payload["operation_id"]
+    if retrying:
+        await operation_store.update_operation(
+            operation_id,
+            ProjectCreationStatus.QUEUED,
+            f"Attempt {job.attempts} of {job.max_attempts} failed, retrying",
+            0,
+            error=error
+        )
+        return
+
+    _, failure_message = _handlers.get(job.kind, (None, "An unexpected error occurred"))
+    await operation_store.update_operation(
+        operation_id,
+        ProjectCreationStatus.FAILED,
+        failure_message,
+        100,
+        error=error
+    )
+
+
+async def report_job_cancelled(job: Job, operation_store):
+    await operation_store.update_operation(
+        job.payload["operation_id"],
+        ProjectCreationStatus.CANCELLED,
+        "Operation cancelled",
+        100
+    )
+
+
+@job_handler("project.create", "An unexpected error occurred during project creation")
+async def create_project(job: Job, operation_store):
+    """Provision a full project from a FullProjectInput dict"""
+    from autostack_engine.services.orchestration.service.orchestration import OrchestrationService
+
+    operation_id = job.payload["operation_id"]
+    input_dict = job.payload["input"]
+    project_name = input_dict["project"]["name"]
+
+    async with get_admission_controller().admit(operation_id, job.payload.get("user_id"), operation_store):
+        await operation_store.update_operation(
+            operation_id,
+            ProjectCreationStatus.VALIDATING,
+            "Validating input data and project configuration",
+            10
+        )
+        logger.info(f"Creating project '{project_name}' for operation {operation_id}")
+
+        orchestrator = OrchestrationService()
+        success, project_id, error = await orchestrator.orchestrate_full_project(
+            input_dict,
+            operation_store=operation_store,
+            operation_id=operation_id
+        )
+
+    if success:
+        logger.info(f"Project '{project_name}' created: {project_id}")
+    else:
+        logger.error(f"Project '{project_name}' creation failed: {error}")
+
+
+@job_handler("project.resume", "An unexpected error occurred while resuming project creation")
+async def resume_project(job: Job, operation_store):
+    """Continue a failed project creation from its checkpoints"""
+    from autostack_engine.services.orchestration.service.orchestration import OrchestrationService
+
+    operation_id = job.payload["operation_id"]
+
+    async with get_admission_controller().admit(operation_id, job.payload.get("user_id"), operation_store):
+        orchestrator = OrchestrationService()
+        success, project_id, error = await orchestrator.resume_project(operation_id, operation_store=operation_store)
+
+    if success:
+        logger.info(f"Resumed operation {operation_id} completed: {project_id}")
+    else:
+        logger.error(f"Resumed operation {operation_id} failed: {error}")
+
+
+@job_handler("project.batch", "An unexpected error occurred during batch provisioning")
+async def provision_manifest(job: Job, operation_store):
+    """Provision every project of a parsed manifest"""
+    from autostack_engine.services.orchestration.service.batch import ManifestService
+
+    operation_id = job.payload["operation_id"]
+    projects = job.payload["projects"]
+
+    service = ManifestService()
+    success, results, error = await service.provision_manifest(
+        projects,
+        operation_store=operation_store,
+        operation_id=operation_id,
+        project_operation_ids=job.payload["project_operation_ids"]
+    )
+
+    if success:
+        logger.info(f"Batch {operation_id} provisioned {len(results)} projects")
+    else:
+        logger.error(f"Batch {operation_id} failed: {error}")
+
+
+@job_handler("project.delete", "An unexpected error occurred during project deletion")
+async def delete_project(job: Job, operation_store):
+    """Delete a project and its files"""
+    from autostack_engine.services.project.services.project import ProjectService
+
+    operation_id = job.payload["operation_id"]
+    project_id = job.payload["project_id"]
+    project_name = job.payload["project_name"]
+
+    await operation_store.update_operation(
+        operation_id,
+        ProjectDeletionStatus.DELETING_PROJECT,
+        f"Searching for {project_name} to delete",
+        10
+    )
+
+    service = ProjectService()
+    success, error = await service.delete_project(project_id, True)
+
+    if success:
+        await operation_store.update_operation(
+            operation_id,
+            ProjectDeletionStatus.COMPLETED,
+            f"Successfully deleted project: {project_name}",
+            100
+        )
+    else:
+        await operation_store.update_operation(
+            operation_id,
+            ProjectDeletionStatus.FAILED,
+            f"Error deleting project: {project_name}",
+            100,
+            error=error
+        )
+
+
+@job_handler("ai.generate", "An internal error occurred during generation.")
+async def generate_project_config(job: Job, operation_store):
+    """Generate a project architecture from a description"""
+    from autostack_engine.services.ai.services.ai import AIService
+
+    operation_id = job.payload["operation_id"]
+
+    await operation_store.update_operation(
+        operation_id,
+        ProjectCreationStatus.PROCESSING,
+        "AI is generating your project architecture...",
+        30
+    )
+
+    ai_service = AIService()
+    success, result, chat_id, error = await ai_service.generate_project_config(job.payload["user_input"])
+
+    if success:
+        # Stored with the completion update so get_job can find it
+        await operation_store.update_operation(
+            operation_id,
+            ProjectCreationStatus.COMPLETED,
+            "Project architecture generated successfully!",
+            100,
+            result=result
+        )
+    else:
+        await operation_store.update_operation(
+            operation_id,
+            ProjectCreationStatus.FAILED,
+            error or "AI generation failed.",
+            100,
+            error=error
+        )
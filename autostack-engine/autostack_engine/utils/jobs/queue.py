@@ -0,0 +1,283 @@
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import redis.asyncio as redis
+from redis.asyncio.connection import ConnectionPool
+
+
+logger = logging.getLogger(__name__)
+
+ORCHESTRATION_QUEUE = "orchestration"
+AI_QUEUE = "ai"
+
+DEFAULT_VISIBILITY_TIMEOUT = int(os.getenv("JOB_VISIBILITY_TIMEOUT_SECONDS", "300"))
+DEFAULT_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.getenv("JOB_RETRY_BASE_DELAY_SECONDS", "5"))
+RETRY_MAX_DELAY = float(os.getenv("JOB_RETRY_MAX_DELAY_SECONDS", "300"))
+FINISHED_JOB_TTL = int(os.getenv("JOB_FINISHED_TTL_SECONDS", "86400"))
+# Orchestration jobs are reserved beyond what admission runs at once (ADMISSION_MAX_CONCURRENT)
+# so that reserved jobs can wait for a slot in fair order
+DEFAULT_QUEUES = f"{ORCHESTRATION_QUEUE}:4,{AI_QUEUE}:4"
+
+# Moves due retries and jobs whose visibility timeout expired back to the
+# ready list, then hands the oldest ready job to the caller. An ID whose
+# hash no longer exists is dropped rather than reserved.
+# KEYS: ready list, delayed zset, processing zset
+# ARGV: now, visibility deadline, job key prefix
+RESERVE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+for _, job_id in ipairs(due) do
+    redis.call('ZREM', KEYS[2], job_id)
+    redis.call('LPUSH', KEYS[1], job_id)
+end
+local expired = redis.call('ZRANGEBYSCORE', KEYS[3], '-inf', ARGV[1])
+for _, job_id in ipairs(expired) do
+    redis.call('ZREM', KEYS[3], job_id)
+    redis.call('RPUSH', KEYS[1], job_id)
+end
+local job_id = redis.call('RPOP', KEYS[1])
+if not job_id then
+    return nil
+end
+local key = ARGV[3] .. job_id
+if redis.call('HEXISTS', key, 'payload') == 0 then
+    -- The job's hash expired while its ID was still queued; drop the ID
+    return nil
+end
+redis.call('ZADD', KEYS[3], ARGV[2], job_id)
+redis.call('HINCRBY', key, 'attempts', 1)
+redis.call('HSET', key, 'status', 'running', 'reserved_at', ARGV[1])
+return redis.call('HGETALL', key)
+"""
+
+
+@dataclass
+class Job:
+    """A unit of work taken from a queue"""
+    id: str
+    queue: str
+    kind: str
+    payload: Dict[str, Any]
+    attempts: int = 0
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT
+    created_at: Optional[str] = None
+    last_error: Optional[str] = None
+    extra: Dict[str, str] = field(default_factory=dict, repr=False)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.attempts >= self.max_attempts
+
+
+def parse_queues(spec: Optional[str] = None) -> Dict[str, int]:
+    """Parse 'queue:concurrency,...' (JOB_QUEUES) into a dict; concurrency defaults to 1"""
+    spec = spec if spec is not None else os.getenv("JOB_QUEUES", DEFAULT_QUEUES)
+    queues = {}
+    for entry in spec.split(","):
+        name, _, concurrency = entry.strip().partition(":")
+        if name:
+            queues[name] = max(int(concurrency or 1), 1)
+    return queues
+
+
+def retry_delay(attempts: int) -> float:
+    """Exponential backoff for the given number of failed attempts"""
+    return min(RETRY_BASE_DELAY * 2 ** max(attempts - 1, 0), RETRY_MAX_DELAY)
+
+
+class RedisJobQueue:
+    """
+    Durable job queues in Redis, shared by the gateway (producer) and worker
+    processes (consumers).
+
+    Per queue:
+        jobs:{queue}:ready        LIST of job IDs waiting to run
+        jobs:{queue}:delayed      ZSET of job IDs waiting to be retried, by due time
+        jobs:{queue}:processing   ZSET of reserved job IDs, by visibility deadline
+        jobs:{queue}:dead         LIST of job IDs that ran out of attempts
+    and job:{id} holds each job's kind, payload and attempt count.
+
+    A reserved job that is neither acked nor failed before its visibility
+    deadline (the worker died or hung) goes back to the ready list and is
+    retried. Workers running long jobs extend the deadline with heartbeat().
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, max_connections: int = 50):
+        self.redis_url = redis_url or (
+            f'redis://{os.getenv("REDIS_USER")}:{os.getenv("REDIS_PASSWORD")}@{os.getenv("REDIS_HOST")}:6379/0'
+        )
+        self.pool = ConnectionPool.from_url(self.redis_url, max_connections=max_connections, decode_responses=True)
+        self.redis: Optional[redis.Redis] = None
+        self._reserve_script = None
+
+    async def initialize(self):
+        self.redis = redis.Redis(connection_pool=self.pool)
+        await self.redis.ping()
+        self._reserve_script = self.redis.register_script(RESERVE_SCRIPT)
+        logger.info("Job queue connection established")
+
+    async def close(self):
+        if self.redis:
+            await self.redis.aclose()
+        await self.pool.disconnect()
+
+    @staticmethod
+    def _keys(queue: str) -> Dict[str, str]:
+        return {
+            "ready": f"jobs:{queue}:ready",
+            "delayed": f"jobs:{queue}:delayed",
+            "processing": f"jobs:{queue}:processing",
+            "dead": f"jobs:{queue}:dead",
+        }
+
+    async def enqueue(
+        self,
+        queue: str,
+        kind: str,
+        payload: Dict[str, Any],
+        job_id: Optional[str] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT
+    ) -> str:
+        """
+        Add a job to a queue; returns its ID.
+
+        A job_id that names an earlier job (e.g. a resume reusing the
+        operation ID of a finished or dead-lettered create) starts over:
+        the old hash, with its expiry and last_error/finished_at, is replaced
+        and the ID is taken off the dead and delayed sets.
+        """
+        job_id = job_id or str(uuid.uuid4())
+        keys = self._keys(queue)
+        job_data = {
+            "id": job_id,
+            "queue": queue,
+            "kind": kind,
+            "payload": json.dumps(payload),
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "visibility_timeout": visibility_timeout,
+            "status": "queued",
+            "created_at": datetime.utcnow().isoformat()
+        }
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(f"job:{job_id}")
+            pipe.lrem(keys["dead"], 0, job_id)
+            pipe.zrem(keys["delayed"], job_id)
+            pipe.hset(f"job:{job_id}", mapping=job_data)
+            pipe.lpush(keys["ready"], job_id)
+            await pipe.execute()
+
+        logger.info(f"Enqueued {kind} job {job_id} on '{queue}'")
+        return job_id
+
+    async def reserve(self, queue: str, visibility_timeout: Optional[int] = None) -> Optional[Job]:
+        """Take the next job off a queue, hiding it from other workers until its deadline"""
+        keys = self._keys(queue)
+        now = time.time()
+        # The job's own timeout is applied right after reserving (see below)
+        deadline = now + (visibility_timeout or DEFAULT_VISIBILITY_TIMEOUT)
+        data = await self._reserve_script(
+            keys=[keys["ready"], keys["delayed"], keys["processing"]],
+            args=[now, deadline, "job:"]
+        )
+        if not data:
+            return None
+
+        fields = dict(zip(data[::2], data[1::2]))
+        job = Job(
+            id=fields["id"],
+            queue=fields["queue"],
+            kind=fields["kind"],
+            payload=json.loads(fields["payload"]),
+            attempts=int(fields.get("attempts", 1)),
+            max_attempts=int(fields.get("max_attempts", DEFAULT_MAX_ATTEMPTS)),
+            visibility_timeout=int(fields.get("visibility_timeout", DEFAULT_VISIBILITY_TIMEOUT)),
+            created_at=fields.get("created_at"),
+            last_error=fields.get("last_error") or None,
+            extra=fields
+        )
+        if visibility_timeout is None and job.visibility_timeout != DEFAULT_VISIBILITY_TIMEOUT:
+            await self.heartbeat(job)
+        return job
+
+    async def heartbeat(self, job: Job):
+        """Push a running job's visibility deadline forward"""
+        await self.redis.zadd(
+            self._keys(job.queue)["processing"],
+            {job.id: time.time() + job.visibility_timeout},
+            xx=True
+        )
+
+    async def ack(self, job: Job):
+        """Mark a job done"""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(self._keys(job.queue)["processing"], job.id)
+            pipe.hset(f"job:{job.id}", mapping={"status": "completed", "finished_at": datetime.utcnow().isoformat()})
+            pipe.expire(f"job:{job.id}", FINISHED_JOB_TTL)
+            await pipe.execute()
+
+    async def fail(self, job: Job, error: str) -> bool:
+        """
+        Record a failed attempt. The job is retried after a backoff delay, or
+        dead-lettered once it has used all its attempts.
+
+        Returns:
+            bool: True if the job will be retried
+        """
+        keys = self._keys(job.queue)
+        retry = not job.exhausted
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(keys["processing"], job.id)
+            if retry:
+                pipe.hset(f"job:{job.id}", mapping={"status": "retrying", "last_error": error})
+                pipe.zadd(keys["delayed"], {job.id: time.time() + retry_delay(job.attempts)})
+            else:
+                pipe.hset(f"job:{job.id}", mapping={
+                    "status": "dead",
+                    "last_error": error,
+                    "finished_at": datetime.utcnow().isoformat()
+                })
+                pipe.lpush(keys["dead"], job.id)
+            await pipe.execute()
+
+        if retry:
+            logger.warning(f"Job {job.id} failed (attempt {job.attempts}/{job.max_attempts}), retrying: {error}")
+        else:
+            logger.error(f"Job {job.id} dead-lettered after {job.attempts} attempts: {error}")
+        return retry
+
+    async def requeue_dead(self, queue: str, limit: int = 100) -> List[str]:
+        """Give dead-lettered jobs a fresh set of attempts"""
+        keys = self._keys(queue)
+        requeued = []
+        for _ in range(limit):
+            job_id = await self.redis.rpop(keys["dead"])
+            if not job_id:
+                break
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(f"job:{job_id}", mapping={"status": "queued", "attempts": 0})
+                pipe.persist(f"job:{job_id}")
+                pipe.lpush(keys["ready"], job_id)
+                await pipe.execute()
+            requeued.append(job_id)
+        return requeued
+
+    async def stats(self, queue: str) -> Dict[str, int]:
+        keys = self._keys(queue)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.llen(keys["ready"])
+            pipe.zcard(keys["delayed"])
+            pipe.zcard(keys["processing"])
+            pipe.llen(keys["dead"])
+            ready, delayed, processing, dead = await pipe.execute()
+        return {"ready": ready, "delayed": delayed, "processing": processing, "dead": dead}
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import os
+import signal
+import traceback
+from typing import Dict, List, Optional
+
+from autostack_engine.utils.database.mongo_client import get_database_manager
+from autostack_engine.utils.jobs.handlers import report_job_cancelled, report_job_failure, run_job
+from autostack_engine.utils.jobs.queue import ORCHESTRATION_QUEUE, Job, RedisJobQueue, parse_queues
+from autostack_engine.utils.logging.sink import get_log_sink
+from autostack_engine.utils.orchestration.admission import get_admission_controller
+from autostack_engine.utils.project.coalescing import CoalescingOperationStore
+from autostack_engine.utils.project.subscription import create_operation_store
+
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = int(os.getenv("JOB_POLL_INTERVAL_MS", "500")) / 1000
+SHUTDOWN_GRACE = int(os.getenv("JOB_SHUTDOWN_GRACE_SECONDS", "60"))
+
+
+class JobWorker:
+    """
+    Runs jobs from one or more queues in the current process.
+
+    Each queue gets as many consumers as its concurrency limit, so at most
+    that many of its jobs run here at once (per worker process). Progress
+    goes through the shared operation store exactly as it did when jobs ran
+    in the gateway.
+
+    On SIGTERM/SIGINT the worker stops taking jobs and gives running ones
+    SHUTDOWN_GRACE seconds to finish; anything still running is abandoned
+    and picked up again once its visibility timeout expires.
+
+    Cancellation requests (cancel_operation) reach the worker through the
+    operation store's control channel and cancel the job's task; a job
+    cancelled before it started is dropped when it is reserved. The projects
+    of a manifest batch are operations without jobs of their own, and
+    cancelling one stops just that project (cancel_batch_project).
+    """
+
+    def __init__(self, queues: Optional[Dict[str, int]] = None):
+        self.queues = queues or parse_queues()
+        self.job_queue: Optional[RedisJobQueue] = None
+        self.operation_store: Optional[CoalescingOperationStore] = None
+        self._stopping = asyncio.Event()
+        self._running: Dict[str, asyncio.Task] = {}
+
+        self.completed = 0
+        self.failed = 0
+
+    async def run(self):
+        db = get_database_manager()
+        await db.connect_all()
+
+        store = create_operation_store(operation_ttl=3600)
+        await store.initialize()
+        self.operation_store = CoalescingOperationStore(store)
+
+        self.job_queue = RedisJobQueue()
+        await self.job_queue.initialize()
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._stopping.set)
+        watcher = asyncio.create_task(self.operation_store.watch_cancellations(self._cancel))
+
+        consumers: List[asyncio.Task] = [
+            asyncio.create_task(self._consume(queue))
+            for queue, concurrency in self.queues.items()
+            for _ in range(concurrency)
+        ]
+        logger.info(f"Worker {os.getpid()} consuming {self.queues}")
+        admission_cap = get_admission_controller().max_concurrent
+        if 0 < self.queues.get(ORCHESTRATION_QUEUE, 0) <= admission_cap:
+            logger.warning(
+                f"Orchestration concurrency {self.queues[ORCHESTRATION_QUEUE]} does not exceed "
+                f"ADMISSION_MAX_CONCURRENT ({admission_cap}), jobs are never queued for fairness"
+            )
+
+        try:
+            await self._stopping.wait()
+            logger.info(f"Worker {os.getpid()} stopping, {len(self._running)} jobs running")
+            _, pending = await asyncio.wait(consumers, timeout=SHUTDOWN_GRACE)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+            await self.operation_store.close()
+            await store.close()
+            await self.job_queue.close()
+            await get_log_sink().close()
+            await db.disconnect()
+            logger.info(f"Worker {os.getpid()} stopped ({self.completed} completed, {self.failed} failed)")
+
+    def _cancel(self, operation_id: str):
+        from autostack_engine.services.orchestration.service.batch import cancel_batch_project
+
+        task = self._running.get(operation_id)
+        if task and not task.done():
+            logger.info(f"Cancelling job {operation_id}")
+            task.cancel()
+        elif cancel_batch_project(operation_id):
+            logger.info(f"Cancelling batch project {operation_id}")
+
+    async def _consume(self, queue: str):
+        while not self._stopping.is_set():
+            try:
+                job = await self.job_queue.reserve(queue)
+            except Exception as e:
+                logger.error(f"Failed to reserve from '{queue}': {e}")
+                job = None
+
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._process(job)
+
+    async def _heartbeat(self, job: Job):
+        interval = max(job.visibility_timeout / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.job_queue.heartbeat(job)
+                # Catches cancellation requests whose control message was missed
+                if await self.operation_store.cancel_requested(job.payload["operation_id"]):
+                    self._cancel(job.id)
+            except Exception as e:
+                logger.warning(f"Heartbeat for job {job.id} failed: {e}")
+
+    async def _process(self, job: Job):
+        if job.attempts > job.max_attempts:
+            # Redelivered after its worker died on the last allowed attempt
+            error = "Job was interrupted and has no attempts left"
+            await self.job_queue.fail(job, error)
+            await report_job_failure(job, self.operation_store, error)
+            self.failed += 1
+            return
+
+        if await self.operation_store.cancel_requested(job.payload["operation_id"]):
+            logger.info(f"Skipping cancelled {job.kind} job {job.id}")
+            await self.job_queue.ack(job)
+            await report_job_cancelled(job, self.operation_store)
+            return
+
+        logger.info(f"Running {job.kind} job {job.id} (attempt {job.attempts}/{job.max_attempts})")
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        # The handler runs in its own task so a cancellation request stops the
+        # job without stopping this consumer
+        handler = asyncio.create_task(run_job(job, self.operation_store))
+        self._running[job.id] = handler
+
+        try:
+            await handler
+            await self.job_queue.ack(job)
+            self.completed += 1
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                # Worker shutdown: left in the processing set and retried
+                # after its visibility timeout
+                raise
+            logger.info(f"{job.kind} job {job.id} cancelled")
+            await self.job_queue.ack(job)
+            await report_job_cancelled(job, self.operation_store)
+        except Exception as e:
+            self.failed += 1
+            error = str(e)
+            logger.error(f"{job.kind} job {job.id} failed: {error}\n{traceback.format_exc()}")
+            try:
+                retrying = await self.job_queue.fail(job, error)
+                await report_job_failure(job, self.operation_store, error, retrying=retrying)
+            except Exception as report_error:
+                logger.error(f"Failed to record failure of job {job.id}: {report_error}")
+        finally:
+            heartbeat.cancel()
+            if self._running.get(job.id) is handler:
+                del self._running[job.id]
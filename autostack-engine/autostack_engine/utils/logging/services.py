@@ -58,6 +58,10 @@ class ServiceLog(Document):
             [("service_name", 1), ("timestamp", -1)],
             [("project_id", 1), ("timestamp", -1)],
             [("log_level", 1), ("timestamp", -1)],
+            # Keyset pagination sorts on (timestamp, _id)
+            [("timestamp", -1), ("_id", -1)],
+            [("service_name", 1), ("timestamp", -1), ("_id", -1)],
+            [("project_id", 1), ("timestamp", -1), ("_id", -1)],
         ]
     
     class Config:
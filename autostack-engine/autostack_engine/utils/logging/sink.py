@@ -0,0 +1,253 @@
+import asyncio
+import os
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Dict, List, Optional, Set
+
+import structlog
+from beanie import PydanticObjectId
+from beanie.odm.utils.dump import get_dict
+from pymongo import WriteConcern
+
+from autostack_engine.utils.database.mongo_client import DatabaseManager, get_database_manager
+from autostack_engine.utils.logging.models import LogLevel
+from autostack_engine.utils.logging.services import ServiceLog
+
+logger = structlog.get_logger()
+
+
+class BackpressurePolicy(str, Enum):
+    """What to do with a new log entry when the sink queue is full"""
+    BLOCK = "block"              # Wait for the flusher to make room
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued entry
+    DROP_DEBUG = "drop_debug"    # Drop DEBUG entries, block for everything else
+
+
+class ServiceLogSink:
+    """
+    Write-behind sink for ServiceLog documents.
+
+    Log calls put entries on a bounded in-process queue. A single background
+    flusher drains it and writes with insert_many once either the batch size
+    or the flush interval is reached. Levels listed as unacknowledged are
+    written with w=0, so the flusher never waits on the server for them.
+
+    Callers that cannot wait (offer) park entries the policy would block on
+    in a bounded overflow buffer, which the flusher moves into the queue as
+    it makes room; once that is full too, entries are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        db: Optional[DatabaseManager] = None,
+        max_queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[int] = None,
+        backpressure: Optional[BackpressurePolicy] = None,
+        unacked_levels: Optional[Set[LogLevel]] = None,
+        max_overflow: Optional[int] = None
+    ):
+        self._db = db or get_database_manager()
+        self.max_queue_size = max_queue_size or int(os.getenv("LOG_SINK_MAX_QUEUE_SIZE", "10000"))
+        self.max_overflow = max_overflow if max_overflow is not None else int(
+            os.getenv("LOG_SINK_MAX_OVERFLOW", "1000")
+        )
+        self.batch_size = batch_size or int(os.getenv("LOG_SINK_BATCH_SIZE", "500"))
+        self.flush_interval = (flush_interval_ms or int(os.getenv("LOG_SINK_FLUSH_INTERVAL_MS", "1000"))) / 1000
+        self.backpressure = backpressure or BackpressurePolicy(
+            os.getenv("LOG_SINK_BACKPRESSURE", BackpressurePolicy.DROP_DEBUG.value).lower()
+        )
+        if unacked_levels is None:
+            unacked_levels = {
+                LogLevel(level.strip().upper())
+                for level in os.getenv("LOG_SINK_UNACKED_LEVELS", "DEBUG,INFO").split(",")
+                if level.strip()
+            }
+        self.unacked_levels = unacked_levels
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._overflow: deque = deque()
+        self._flusher: Optional[asyncio.Task] = None
+        self._closing = False
+
+        # Metrics
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+        self.write_errors = 0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, batch sizes and dropped-entry count"""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "max_queue_size": self.max_queue_size,
+            "overflow_depth": len(self._overflow),
+            "max_overflow": self.max_overflow,
+            "backpressure": self.backpressure.value,
+            "dropped": self.dropped,
+            "written": self.written,
+            "batches": self.batches,
+            "write_errors": self.write_errors,
+            "last_batch_size": self.last_batch_size,
+            "max_batch_size": self.max_batch_size,
+            "avg_batch_size": round(self.written / self.batches, 2) if self.batches else 0,
+        }
+
+    def _ensure_started(self) -> asyncio.Queue:
+        """Create the queue and flusher on first use inside the running loop"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        if (self._flusher is None or self._flusher.done()) and not self._closing:
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+        return self._queue
+
+    def put_nowait(self, entry: ServiceLog) -> bool:
+        """
+        Enqueue without waiting.
+
+        Returns False only when the entry still needs to wait for room
+        (BLOCK policy, or a non-debug entry under DROP_DEBUG); the caller
+        should then await put().
+        """
+        queue = self._ensure_started()
+        try:
+            queue.put_nowait(entry)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.backpressure == BackpressurePolicy.DROP_OLDEST:
+            try:
+                queue.get_nowait()
+                queue.task_done()
+                self.dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+            try:
+                queue.put_nowait(entry)
+            except asyncio.QueueFull:
+                self.dropped += 1
+            return True
+
+        if self.backpressure == BackpressurePolicy.DROP_DEBUG and entry.log_level == LogLevel.DEBUG:
+            self.dropped += 1
+            return True
+
+        return False
+
+    async def put(self, entry: ServiceLog) -> None:
+        """Enqueue an entry, waiting for room if the policy requires it"""
+        if not self.put_nowait(entry):
+            await self._ensure_started().put(entry)
+
+    def offer(self, entry: ServiceLog) -> None:
+        """
+        Enqueue from code that cannot await. Entries the policy would wait on
+        go to the overflow buffer, or are dropped once it holds max_overflow.
+        """
+        if self._overflow:
+            # Keep order behind entries already waiting for room
+            self._ensure_started()
+        elif self.put_nowait(entry):
+            return
+
+        if len(self._overflow) < self.max_overflow:
+            self._overflow.append(entry)
+        else:
+            self.dropped += 1
+
+    def _drain_overflow(self, queue: asyncio.Queue) -> None:
+        """Move overflowed entries into the queue while it has room"""
+        while self._overflow and not queue.full():
+            queue.put_nowait(self._overflow.popleft())
+
+    async def _run(self):
+        """Background flusher: drain on size or time threshold"""
+        queue = self._queue
+        while True:
+            batch: List[ServiceLog] = [await queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+            # Refill before the batch is marked done, so flush() also waits for overflow
+            self._drain_overflow(queue)
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _write(self, batch: List[ServiceLog]) -> None:
+        """Write one batch, splitting acknowledged and unacknowledged levels"""
+        acked = [entry for entry in batch if entry.log_level not in self.unacked_levels]
+        unacked = [entry for entry in batch if entry.log_level in self.unacked_levels]
+
+        try:
+            await self._db.connect([ServiceLog])
+
+            if unacked:
+                for entry in unacked:
+                    if entry.id is None:
+                        entry.id = PydanticObjectId()
+                collection = ServiceLog.get_pymongo_collection().with_options(
+                    write_concern=WriteConcern(w=0)
+                )
+                await collection.insert_many(
+                    [get_dict(entry, to_db=True) for entry in unacked],
+                    ordered=False
+                )
+
+            if acked:
+                await ServiceLog.insert_many(acked)
+
+            self.batches += 1
+            self.written += len(batch)
+            self.last_batch_size = len(batch)
+            self.max_batch_size = max(self.max_batch_size, len(batch))
+        except Exception as e:
+            # Don't let logging failures break the application
+            self.write_errors += 1
+            self.dropped += len(batch)
+            logger.error(f"Failed to persist {len(batch)} logs to MongoDB: {e}")
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far has been written"""
+        if self._queue is None:
+            return
+        self._ensure_started()
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush pending entries and stop the flusher"""
+        self._closing = True
+        if self._queue is not None and self._flusher is not None and not self._flusher.done():
+            await self.flush()
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        self._closing = False
+
+
+# Process-wide shared instance
+_log_sink: Optional[ServiceLogSink] = None
+
+
+def get_log_sink() -> ServiceLogSink:
+    """Get the process-wide log sink, creating it on first use"""
+    global _log_sink
+    if _log_sink is None:
+        _log_sink = ServiceLogSink()
+    return _log_sink
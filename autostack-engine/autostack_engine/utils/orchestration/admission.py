@@ -0,0 +1,235 @@
+import asyncio
+import os
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set
+
+import structlog
+
+from autostack_engine.utils.project.subscription import ProjectCreationStatus
+
+logger = structlog.get_logger()
+
+ANONYMOUS = "anonymous"
+
+
+def _read_available_memory() -> Optional[float]:
+    """Fraction of memory available (MemAvailable / MemTotal), None where /proc is missing"""
+    try:
+        fields = {}
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                name, _, rest = line.partition(":")
+                fields[name] = int(rest.split()[0])
+        return fields["MemAvailable"] / fields["MemTotal"]
+    except (OSError, KeyError, ValueError, ZeroDivisionError):
+        return None
+
+
+def _read_cpu_load() -> Optional[float]:
+    """One-minute load average per CPU"""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except OSError:
+        return None
+
+
+@dataclass
+class Ticket:
+    """An operation waiting for (or holding) an admission slot"""
+    operation_id: str
+    user_id: str
+    operation_store: Any = None
+    admitted: asyncio.Event = field(default_factory=asyncio.Event)
+    position: Optional[int] = None
+
+
+class AdmissionController:
+    """
+    Limits how many heavy operations (project provisioning) run at once in
+    this process. The cap is per process: each worker (and the gateway in
+    inline mode) admits up to max_concurrent operations, so the total is
+    this cap times the number of processes. Workers must reserve more
+    orchestration jobs than they admit (JOB_QUEUES concurrency above
+    ADMISSION_MAX_CONCURRENT) for waiting jobs to be ordered fairly;
+    waiting jobs keep their reservation and are heartbeated while they wait.
+
+    Waiting operations are admitted to the user (user_id_var) with the
+    fewest operations running, rotating between users on ties, so one
+    user's burst cannot starve everybody else; each user's own operations
+    run in FIFO order. Every waiting operation gets a QUEUED update with its position
+    whenever that position changes.
+
+    In "resource" mode an operation is only admitted while the machine has
+    headroom (load per CPU below ADMISSION_MAX_CPU_LOAD and at least
+    ADMISSION_MIN_FREE_MEMORY of memory available), still bounded by the
+    concurrency cap; one operation is always allowed to run so the queue
+    cannot stall behind unrelated load.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        mode: Optional[str] = None,
+        max_cpu_load: Optional[float] = None,
+        min_free_memory: Optional[float] = None,
+        poll_interval: Optional[float] = None
+    ):
+        self.max_concurrent = max_concurrent or int(os.getenv("ADMISSION_MAX_CONCURRENT", "2"))
+        self.mode = (mode or os.getenv("ADMISSION_MODE", "static")).lower()
+        self.max_cpu_load = max_cpu_load or float(os.getenv("ADMISSION_MAX_CPU_LOAD", "0.85"))
+        self.min_free_memory = min_free_memory or float(os.getenv("ADMISSION_MIN_FREE_MEMORY", "0.2"))
+        self.poll_interval = poll_interval or float(os.getenv("ADMISSION_POLL_INTERVAL_SECONDS", "2"))
+
+        self._waiting: "OrderedDict[str, Deque[Ticket]]" = OrderedDict()
+        self._running: Dict[str, Ticket] = {}
+        self._poller: Optional[asyncio.Task] = None
+        self._reports: Set[asyncio.Task] = set()
+
+        self.admitted = 0
+        self.deferred_for_resources = 0
+
+    @property
+    def waiting(self) -> int:
+        return sum(len(tickets) for tickets in self._waiting.values())
+
+    def has_headroom(self) -> bool:
+        if self.mode != "resource":
+            return True
+        load = _read_cpu_load()
+        if load is not None and load > self.max_cpu_load:
+            return False
+        available = _read_available_memory()
+        if available is not None and available < self.min_free_memory:
+            return False
+        return True
+
+    def _running_per_user(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for ticket in self._running.values():
+            counts[ticket.user_id] = counts.get(ticket.user_id, 0) + 1
+        return counts
+
+    @staticmethod
+    def _next_user(waiting: "OrderedDict[str, Deque[Ticket]]", running: Dict[str, int]) -> str:
+        """The waiting user with the fewest running operations, longest-waiting first on ties"""
+        return min(waiting, key=lambda user_id: running.get(user_id, 0))
+
+    def _queue_order(self) -> List[Ticket]:
+        """Waiting tickets in the order they will be admitted"""
+        waiting = OrderedDict((user_id, deque(tickets)) for user_id, tickets in self._waiting.items())
+        running = self._running_per_user()
+        order = []
+        while waiting:
+            user_id = self._next_user(waiting, running)
+            tickets = waiting.pop(user_id)
+            order.append(tickets.popleft())
+            running[user_id] = running.get(user_id, 0) + 1
+            if tickets:
+                waiting[user_id] = tickets
+        return order
+
+    def _pop_next(self) -> Ticket:
+        # A served user goes to the back of the rotation
+        user_id = self._next_user(self._waiting, self._running_per_user())
+        tickets = self._waiting.pop(user_id)
+        ticket = tickets.popleft()
+        if tickets:
+            self._waiting[user_id] = tickets
+        return ticket
+
+    def _schedule(self):
+        while self._waiting and len(self._running) < self.max_concurrent:
+            if self._running and not self.has_headroom():
+                self.deferred_for_resources += 1
+                self._ensure_poller()
+                break
+            ticket = self._pop_next()
+            self._running[ticket.operation_id] = ticket
+            self.admitted += 1
+            ticket.admitted.set()
+
+        for position, ticket in enumerate(self._queue_order(), start=1):
+            if ticket.position != position:
+                ticket.position = position
+                report = asyncio.create_task(self._report_position(ticket))
+                self._reports.add(report)
+                report.add_done_callback(self._reports.discard)
+
+    def _ensure_poller(self):
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.create_task(self._poll())
+
+    async def _poll(self):
+        """Re-check headroom while work is deferred for lack of resources"""
+        while self._waiting and len(self._running) < self.max_concurrent:
+            await asyncio.sleep(self.poll_interval)
+            self._schedule()
+
+    async def _report_position(self, ticket: Ticket):
+        if ticket.operation_store is None or ticket.admitted.is_set():
+            return
+        ahead = ticket.position - 1
+        try:
+            await ticket.operation_store.update_operation(
+                ticket.operation_id,
+                ProjectCreationStatus.QUEUED,
+                f"Waiting for a free build slot ({ahead} operation{'s' if ahead != 1 else ''} ahead)",
+                0
+            )
+        except Exception as e:
+            logger.error(f"Failed to report queue position for {ticket.operation_id}: {e}")
+
+    def _remove(self, ticket: Ticket):
+        tickets = self._waiting.get(ticket.user_id)
+        if tickets and ticket in tickets:
+            tickets.remove(ticket)
+            if not tickets:
+                del self._waiting[ticket.user_id]
+
+    @asynccontextmanager
+    async def admit(self, operation_id: str, user_id: Optional[str] = None, operation_store=None):
+        """Wait for a slot, hold it for the duration of the block"""
+        ticket = Ticket(operation_id, user_id or ANONYMOUS, operation_store)
+        self._waiting.setdefault(ticket.user_id, deque()).append(ticket)
+        self._schedule()
+
+        try:
+            await ticket.admitted.wait()
+        except BaseException:
+            # Cancelled while waiting, possibly after _schedule admitted it
+            if ticket.admitted.is_set():
+                self._running.pop(operation_id, None)
+            else:
+                self._remove(ticket)
+            self._schedule()
+            raise
+
+        try:
+            yield
+        finally:
+            self._running.pop(operation_id, None)
+            self._schedule()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "max_concurrent": self.max_concurrent,
+            "running": len(self._running),
+            "waiting": self.waiting,
+            "waiting_users": len(self._waiting),
+            "admitted": self.admitted,
+            "deferred_for_resources": self.deferred_for_resources,
+        }
+
+
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """The process-wide (per worker) admission controller for project provisioning"""
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = AdmissionController()
+    return _admission_controller
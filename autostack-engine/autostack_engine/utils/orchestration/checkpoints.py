@@ -0,0 +1,136 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+import structlog
+
+from autostack_engine.utils.database.models.orchestration.models import (
+    CheckpointStatus,
+    OperationCheckpoint,
+    StepCheckpoint,
+)
+
+logger = structlog.get_logger()
+
+
+def _json_safe(value: Any) -> Any:
+    return json.loads(json.dumps(value, default=str))
+
+
+def inputs_hash(step: str, inputs: Dict[str, Any], key: Any = None) -> str:
+    """Stable hash of what a step was run with: its dependencies' results and its own config"""
+    payload = json.dumps({"step": step, "inputs": inputs, "key": key}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def completed_checkpoint(
+    operation_id: str,
+    input_data: Dict[str, Any],
+    steps: Dict[str, Tuple[str, Any]],
+    project_id: Optional[str] = None
+) -> OperationCheckpoint:
+    """
+    An unsaved checkpoint whose steps (name -> (inputs hash, value)) are
+    already completed, for work done outside a StepGraph such as records
+    inserted in bulk. Running the operation with resume=True skips them.
+    """
+    return OperationCheckpoint(
+        operation_id=operation_id,
+        input=_json_safe(input_data),
+        project_id=project_id,
+        steps={
+            name: StepCheckpoint(status=CheckpointStatus.COMPLETED, inputs_hash=step_hash, value=_json_safe(value))
+            for name, (step_hash, value) in steps.items()
+        }
+    )
+
+
+class CheckpointStore:
+    """
+    Records each step of an orchestration run in an OperationCheckpoint.
+
+    A step that completed with the same inputs hash is not run again when
+    the operation is resumed; its stored value is handed to the steps that
+    depend on it instead. Checkpointing is best effort: a failed write is
+    logged and never fails the step.
+    """
+
+    def __init__(self, operation_id: str):
+        self.operation_id = operation_id
+        self.checkpoint: Optional[OperationCheckpoint] = None
+
+    async def load(self) -> Optional[OperationCheckpoint]:
+        self.checkpoint = await OperationCheckpoint.find_one(OperationCheckpoint.operation_id == self.operation_id)
+        return self.checkpoint
+
+    async def start(self, input_data: Dict[str, Any]) -> OperationCheckpoint:
+        """Begin (or continue) a run for this operation with the given input"""
+        if self.checkpoint is None:
+            await self.load()
+        if self.checkpoint is None:
+            self.checkpoint = OperationCheckpoint(operation_id=self.operation_id, input=_json_safe(input_data))
+            await self.checkpoint.insert()
+        else:
+            await self._update({"completed": False, "failed_step": None, "error": None})
+        return self.checkpoint
+
+    def completed(self, step: str, step_hash: str) -> Tuple[bool, Any]:
+        """(True, value) if the step already completed with these inputs"""
+        if self.checkpoint is None:
+            return False, None
+        previous = self.checkpoint.steps.get(step)
+        if previous and previous.status == CheckpointStatus.COMPLETED and previous.inputs_hash == step_hash:
+            return True, previous.value
+        return False, None
+
+    async def record(
+        self,
+        step: str,
+        step_hash: str,
+        success: bool,
+        value: Any = None,
+        error: Optional[str] = None,
+        duration_ms: float = 0.0
+    ):
+        if self.checkpoint is None:
+            return
+        previous = self.checkpoint.steps.get(step)
+        entry = StepCheckpoint(
+            status=CheckpointStatus.COMPLETED if success else CheckpointStatus.FAILED,
+            inputs_hash=step_hash,
+            value=_json_safe(value) if success else None,
+            error=error,
+            duration_ms=duration_ms,
+            attempts=(previous.attempts + 1) if previous else 1
+        )
+        self.checkpoint.steps[step] = entry
+        data = entry.model_dump()
+        data["status"] = entry.status.value
+        await self._update({f"steps.{step}": data})
+
+    async def finish(
+        self,
+        success: bool,
+        project_id: Optional[str] = None,
+        failed_step: Optional[str] = None,
+        error: Optional[str] = None
+    ):
+        await self._update({
+            "completed": success,
+            "project_id": project_id,
+            "failed_step": failed_step,
+            "error": error
+        })
+
+    async def delete(self):
+        await OperationCheckpoint.find_one(OperationCheckpoint.operation_id == self.operation_id).delete()
+        self.checkpoint = None
+
+    async def _update(self, fields: Dict[str, Any]):
+        try:
+            await OperationCheckpoint.find_one(OperationCheckpoint.operation_id == self.operation_id).update(
+                {"$set": {**fields, "updated_at": datetime.now()}}
+            )
+        except Exception as e:
+            logger.error(f"Failed to write checkpoint for {self.operation_id}: {e}")
@@ -0,0 +1,70 @@
+import json
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+
+def _normalize_project(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Bring one manifest entry into the shape orchestrate_full_project takes
+    (the same as a FullProjectInput), accepting the example.yml layout:
+    technologies keyed by name, tags under project.metadata, and
+    human-readable IDs on technologies and connections.
+    """
+    project = dict(entry.get('project') or {})
+    metadata = project.pop('metadata', None) or {}
+    project.setdefault('tags', metadata.get('tags', []))
+    project.setdefault('environment', metadata.get('environment', 'development'))
+    # Every provisioned copy gets its own project ID
+    project.pop('id', None)
+
+    technologies = entry.get('technologies') or []
+    if isinstance(technologies, dict):
+        technologies = [{'name': name, **(config or {})} for name, config in technologies.items()]
+    # Document IDs are UUIDs; manifest IDs are only labels
+    technologies = [{k: v for k, v in tech.items() if k != 'id'} for tech in technologies]
+    connections = [{k: v for k, v in conn.items() if k != 'id'} for conn in entry.get('connections') or []]
+
+    normalized = {'project': project}
+    if technologies:
+        normalized['technologies'] = technologies
+    if entry.get('components'):
+        normalized['components'] = list(entry['components'])
+    if connections:
+        normalized['connections'] = connections
+    # JSON-safe, so checkpoint hashes match when the input is read back
+    return json.loads(json.dumps(normalized, default=str))
+
+
+def parse_manifest(text: str) -> tuple[bool, Optional[List[Dict[str, Any]]], Optional[str]]:
+    """
+    Parse a YAML or JSON manifest of projects.
+
+    Accepts a mapping with a `projects` list, a bare list of projects, or a
+    single project document such as example.yml.
+
+    Returns:
+        tuple: (success: bool, projects: Optional[list], error_message: Optional[str])
+    """
+    try:
+        document = yaml.safe_load(text)
+    except yaml.YAMLError as e:
+        return False, None, f"Manifest is not valid YAML or JSON: {e}"
+
+    if isinstance(document, dict) and 'projects' in document:
+        entries = document['projects']
+    elif isinstance(document, dict) and 'project' in document:
+        entries = [document]
+    else:
+        entries = document
+
+    if not isinstance(entries, list) or not entries:
+        return False, None, "Manifest must contain a non-empty list of projects"
+
+    projects = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not isinstance(entry.get('project'), dict):
+            return False, None, f"projects[{index}]: expected a mapping with a 'project' section"
+        projects.append(_normalize_project(entry))
+
+    return True, projects, None
@@ -6,9 +6,10 @@ from typing import Any, Dict, Optional
 import traceback as tb
 import time
 
-from autostack_engine.utils.database.mongo_client import DatabaseManager
+from autostack_engine.utils.database.mongo_client import DatabaseManager, get_database_manager
 from autostack_engine.utils.logging.models import LogCategory, LogLevel
 from autostack_engine.utils.logging.services import ServiceLog
+from autostack_engine.utils.logging.sink import get_log_sink
 
 logger = structlog.get_logger()
 
@@ -24,9 +25,11 @@ class BaseService(ABC):
     
     service_name: Optional[str] = None
     
-    def __init__(self):
+    def __init__(self, db: Optional[DatabaseManager] = None):
         if not self.service_name:
             raise ValueError("service_name must be defined in the subclass")
+        # Shared, pooled database manager (one client per process)
+        self.db = db or get_database_manager()
         self.logger = structlog.get_logger().bind(service=self.service_name)
         self._current_operation: Optional[str] = None
         self._operation_start_time: Optional[float] = None
@@ -42,6 +45,47 @@ class BaseService(ABC):
         }
         return category_map.get(self.service_name.upper(), LogCategory.SYSTEM)
     
+    def _build_log(
+        self,
+        message: str,
+        log_level: LogLevel,
+        operation: Optional[str] = None,
+        project_id: Optional[str] = None,
+        component_id: Optional[str] = None,
+        technology_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        error_traceback: Optional[str] = None,
+        duration_ms: Optional[float] = None
+    ) -> ServiceLog:
+        """Build a ServiceLog entry carrying the current request context"""
+        return ServiceLog(
+            service_name=self.service_name.upper(),
+            log_level=log_level,
+            category=self._get_log_category(),
+            message=message,
+            operation=operation or self._current_operation,
+            project_id=project_id,
+            component_id=component_id,
+            technology_id=technology_id,
+            metadata=metadata,
+            error_traceback=error_traceback,
+            duration_ms=duration_ms,
+            request_id=request_id_var.get(),
+            user_id=user_id_var.get(),
+            timestamp=datetime.now()
+        )
+    
+    def _dispatch_log(self, log_level: LogLevel, message: str, **kwargs):
+        """Hand a log entry to the write-behind sink without awaiting"""
+        try:
+            get_log_sink().offer(self._build_log(message=message, log_level=log_level, **kwargs))
+        except RuntimeError:
+            # No event loop available, skip MongoDB logging
+            pass
+        except Exception as e:
+            # Don't let logging failures break the application
+            self.logger.error(f"Failed to queue log for MongoDB: {e}")
+    
     async def _persist_log(
         self,
         message: str,
@@ -54,28 +98,19 @@ class BaseService(ABC):
         error_traceback: Optional[str] = None,
         duration_ms: Optional[float] = None
     ):
-        """Persist log to MongoDB"""
+        """Queue log for batched persistence to MongoDB"""
         try:
-            db = DatabaseManager()
-            await db.connect([ServiceLog])
-            
-            log_entry = ServiceLog(
-                service_name=self.service_name.upper(),
-                log_level=log_level,
-                category=self._get_log_category(),
+            await get_log_sink().put(self._build_log(
                 message=message,
-                operation=operation or self._current_operation,
+                log_level=log_level,
+                operation=operation,
                 project_id=project_id,
                 component_id=component_id,
                 technology_id=technology_id,
                 metadata=metadata,
                 error_traceback=error_traceback,
-                duration_ms=duration_ms,
-                request_id=request_id_var.get(),
-                user_id=user_id_var.get(),
-                timestamp=datetime.now()
-            )
-            await log_entry.insert()
+                duration_ms=duration_ms
+            ))
         except Exception as e:
             # Don't let logging failures break the application
             self.logger.error(f"Failed to persist log to MongoDB: {e}")
@@ -85,19 +120,13 @@ class BaseService(ABC):
         formatted_msg = f"[{self.service_name.upper()}] {message}"
         self.logger.info(formatted_msg, **kwargs)
         
-        # Async log to MongoDB (non-blocking)
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            loop.create_task(self._persist_log(
-                message=message,
-                log_level=LogLevel.INFO,
-                operation=operation,
-                metadata=kwargs if kwargs else None
-            ))
-        except RuntimeError:
-            # No event loop available, skip MongoDB logging
-            pass
+        # Batched write-behind log to MongoDB (non-blocking)
+        self._dispatch_log(
+            LogLevel.INFO,
+            message,
+            operation=operation,
+            metadata=kwargs if kwargs else None
+        )
     
     def log_error(self, message: str, operation: Optional[str] = None, error: Optional[Exception] = None, **kwargs):
         """Log error message to console and MongoDB"""
@@ -111,55 +140,40 @@ class BaseService(ABC):
         elif kwargs.get('exc_info'):
             error_traceback = tb.format_exc()
         
-        # Async log to MongoDB
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            loop.create_task(self._persist_log(
-                message=message,
-                log_level=LogLevel.ERROR,
-                operation=operation,
-                metadata=kwargs if kwargs else None,
-                error_traceback=error_traceback
-            ))
-        except RuntimeError:
-            pass
+        # Batched write-behind log to MongoDB
+        self._dispatch_log(
+            LogLevel.ERROR,
+            message,
+            operation=operation,
+            metadata=kwargs if kwargs else None,
+            error_traceback=error_traceback
+        )
     
     def log_warning(self, message: str, operation: Optional[str] = None, **kwargs):
         """Log warning message to console and MongoDB"""
         formatted_msg = f"[{self.service_name.upper()}] {message}"
         self.logger.warning(formatted_msg, **kwargs)
         
-        # Async log to MongoDB
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            loop.create_task(self._persist_log(
-                message=message,
-                log_level=LogLevel.WARNING,
-                operation=operation,
-                metadata=kwargs if kwargs else None
-            ))
-        except RuntimeError:
-            pass
+        # Batched write-behind log to MongoDB
+        self._dispatch_log(
+            LogLevel.WARNING,
+            message,
+            operation=operation,
+            metadata=kwargs if kwargs else None
+        )
     
     def log_debug(self, message: str, operation: Optional[str] = None, **kwargs):
         """Log debug message to console and MongoDB"""
         formatted_msg = f"[{self.service_name.upper()}] {message}"
         self.logger.debug(formatted_msg, **kwargs)
         
-        # Async log to MongoDB
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-            loop.create_task(self._persist_log(
-                message=message,
-                log_level=LogLevel.DEBUG,
-                operation=operation,
-                metadata=kwargs if kwargs else None
-            ))
-        except RuntimeError:
-            pass
+        # Batched write-behind log to MongoDB
+        self._dispatch_log(
+            LogLevel.DEBUG,
+            message,
+            operation=operation,
+            metadata=kwargs if kwargs else None
+        )
     
     def start_operation(self, operation_name: str):
         """Start tracking an operation for duration logging"""
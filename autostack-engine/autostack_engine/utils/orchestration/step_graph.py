@@ -0,0 +1,232 @@
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import structlog
+
+from autostack_engine.utils.orchestration.checkpoints import inputs_hash
+from autostack_engine.utils.project.subscription import ProjectCreationStatus
+
+logger = structlog.get_logger()
+
+# A step receives the results of the steps it depends on, keyed by step name,
+# and returns the usual service tuple: (success, value, error_message)
+StepFunc = Callable[[Dict[str, Any]], Awaitable[tuple[bool, Any, Optional[str]]]]
+
+
+@dataclass
+class Step:
+    """A unit of orchestration work and the steps it has to wait for"""
+    name: str
+    func: StepFunc
+    depends_on: List[str] = field(default_factory=list)
+    status: ProjectCreationStatus = ProjectCreationStatus.PROCESSING
+    message: Optional[str] = None
+    weight: int = 1
+    # Static configuration the step's outcome depends on, part of its checkpoint hash
+    key: Any = None
+
+
+@dataclass
+class StepResult:
+    name: str
+    success: bool
+    value: Any = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+    skipped: bool = False
+
+
+class StepFailedError(Exception):
+    def __init__(self, step: str, error: Optional[str]):
+        super().__init__(f"Step '{step}' failed: {error}")
+        self.step = step
+        self.error = error
+
+
+class StepGraph:
+    """
+    Executes a DAG of steps.
+
+    Every step whose dependencies have completed is started right away, up to
+    `max_parallel` at a time. The first failing step cancels all running
+    siblings and the run stops (fail fast). Progress is reported per step
+    between `progress_start` and `progress_end`, scaled by step weight.
+
+    With a CheckpointStore, every step's outcome is recorded, and a step that
+    already completed with the same inputs is skipped and its stored value
+    reused, so a resumed run only repeats the failed and missing steps.
+
+    Given `estimates` (expected duration in ms per step, see TimingHistory),
+    each progress update also carries the estimated time remaining: the
+    longest chain of unfinished steps, crediting running steps with the time
+    they have already taken.
+    """
+
+    def __init__(
+        self,
+        steps: List[Step],
+        max_parallel: Optional[int] = None,
+        operation_store=None,
+        operation_id: Optional[str] = None,
+        progress_start: int = 0,
+        progress_end: int = 100,
+        checkpoints=None,
+        estimates: Optional[Dict[str, float]] = None
+    ):
+        self.steps: Dict[str, Step] = {}
+        for step in steps:
+            if step.name in self.steps:
+                raise ValueError(f"Duplicate step name: {step.name}")
+            self.steps[step.name] = step
+        for step in steps:
+            for dep in step.depends_on:
+                if dep not in self.steps:
+                    raise ValueError(f"Step '{step.name}' depends on unknown step '{dep}'")
+
+        self.max_parallel = max_parallel or int(os.getenv("ORCHESTRATION_MAX_PARALLEL_STEPS", "4"))
+        self.operation_store = operation_store
+        self.operation_id = operation_id
+        self.progress_start = progress_start
+        self.progress_end = progress_end
+        self.checkpoints = checkpoints
+        self.estimates = estimates or {}
+        self.results: Dict[str, StepResult] = {}
+        self._started: Dict[str, float] = {}
+
+        self._total_weight = sum(step.weight for step in steps) or 1
+        self._completed_weight = 0
+
+    @property
+    def progress(self) -> int:
+        span = self.progress_end - self.progress_start
+        return self.progress_start + int(span * self._completed_weight / self._total_weight)
+
+    @property
+    def eta_seconds(self) -> Optional[int]:
+        """Estimated seconds until every step has finished, None without estimates"""
+        if not self.estimates:
+            return None
+
+        now = time.monotonic()
+        finish: Dict[str, float] = {}
+
+        def finish_ms(name: str) -> float:
+            if name not in finish:
+                own = 0.0
+                if name not in self.results:
+                    elapsed = (now - self._started[name]) * 1000 if name in self._started else 0.0
+                    own = max(self.estimates.get(name, 0.0) - elapsed, 0.0)
+                finish[name] = own + max((finish_ms(dep) for dep in self.steps[name].depends_on), default=0.0)
+            return finish[name]
+
+        return round(max((finish_ms(name) for name in self.steps), default=0.0) / 1000)
+
+    async def _report(self, status: ProjectCreationStatus, message: str):
+        if self.operation_store and self.operation_id:
+            try:
+                await self.operation_store.update_operation(
+                    self.operation_id,
+                    status,
+                    message,
+                    self.progress,
+                    eta_seconds=self.eta_seconds
+                )
+            except Exception as e:
+                # Progress reporting must not fail the step itself
+                logger.error(f"Failed to report progress for {self.operation_id}: {e}")
+
+    async def _run_step(self, step: Step, semaphore: asyncio.Semaphore) -> StepResult:
+        async with semaphore:
+            inputs = {dep: self.results[dep].value for dep in step.depends_on}
+            step_hash = inputs_hash(step.name, inputs, step.key)
+
+            if self.checkpoints:
+                done, value = self.checkpoints.completed(step.name, step_hash)
+                if done:
+                    result = StepResult(step.name, True, value, skipped=True)
+                    self.results[step.name] = result
+                    self._completed_weight += step.weight
+                    await self._report(step.status, f"Skipped {step.name} (already completed)")
+                    return result
+
+            self._started[step.name] = time.monotonic()
+            await self._report(step.status, step.message or f"Running {step.name}")
+
+            started = time.monotonic()
+            try:
+                success, value, error = await step.func(inputs)
+            except Exception as e:
+                if self.checkpoints:
+                    await self.checkpoints.record(
+                        step.name, step_hash, False, error=str(e),
+                        duration_ms=(time.monotonic() - started) * 1000
+                    )
+                raise
+            duration_ms = (time.monotonic() - started) * 1000
+
+            if self.checkpoints:
+                await self.checkpoints.record(step.name, step_hash, success, value, error, duration_ms)
+
+            result = StepResult(step.name, success, value, error, duration_ms)
+            if not success:
+                raise StepFailedError(step.name, error)
+
+            self.results[step.name] = result
+            self._completed_weight += step.weight
+            await self._report(step.status, f"Finished {step.name}")
+            return result
+
+    async def run(self) -> tuple[bool, Dict[str, StepResult], Optional[str], Optional[str]]:
+        """
+        Run every step in dependency order.
+
+        Returns:
+            tuple: (success, results by step name, error_message, failed_step)
+        """
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        pending = dict(self.steps)
+        running: Dict[asyncio.Task, str] = {}
+
+        try:
+            while pending or running:
+                ready = [
+                    step for step in pending.values()
+                    if all(dep in self.results for dep in step.depends_on)
+                ]
+                for step in ready:
+                    del pending[step.name]
+                    task = asyncio.create_task(self._run_step(step, semaphore), name=step.name)
+                    running[task] = step.name
+
+                if not running:
+                    # Nothing runnable and nothing in flight: dependency cycle
+                    cycle = ", ".join(sorted(pending))
+                    return False, self.results, f"Dependency cycle between steps: {cycle}", None
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name = running.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        await self._cancel(running)
+                        if isinstance(error, StepFailedError):
+                            return False, self.results, error.error, error.step
+                        return False, self.results, str(error), name
+
+            return True, self.results, None, None
+
+        except asyncio.CancelledError:
+            await self._cancel(running)
+            raise
+
+    @staticmethod
+    async def _cancel(running: Dict[asyncio.Task, str]):
+        """Cancel sibling steps and wait for them to unwind"""
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        running.clear()
@@ -0,0 +1,133 @@
+import os
+import statistics
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import structlog
+
+from autostack_engine.utils.database.models.orchestration.models import OperationTiming
+
+logger = structlog.get_logger()
+
+# Most recent runs an estimate is based on, and how many a shape needs before
+# its own history is trusted over that of similar projects
+ETA_HISTORY_SAMPLES = int(os.getenv("ETA_HISTORY_SAMPLES", "20"))
+ETA_MIN_SAMPLES = int(os.getenv("ETA_MIN_SAMPLES", "3"))
+
+
+def project_shape(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    What provisioning time mostly depends on: the frameworks to scaffold and
+    how many technologies and components there are.
+    """
+    components = input_data.get('components') or []
+    frameworks = sorted({str(comp.get('framework') or 'none').lower() for comp in components})
+    technology_count = len(input_data.get('technologies') or [])
+    component_count = len(components)
+    return {
+        "shape": f"{'+'.join(frameworks) or 'none'}/t{technology_count}/c{component_count}",
+        "frameworks": frameworks,
+        "technology_count": technology_count,
+        "component_count": component_count
+    }
+
+
+class TimingHistory:
+    """
+    Step durations of past orchestration runs (OperationTiming).
+
+    Estimates use the median duration of each step over the latest runs of
+    the same shape, falling back to runs with the same frameworks and then to
+    all runs while a shape has fewer than ETA_MIN_SAMPLES. Reads and writes
+    are best effort: without history there is simply no estimate.
+    """
+
+    async def estimate(self, shape: Dict[str, Any]) -> Dict[str, float]:
+        """Expected duration in ms of each step, empty without history"""
+        try:
+            runs: List[OperationTiming] = []
+            for query in ({"shape": shape["shape"]}, {"frameworks": shape["frameworks"]}, {}):
+                runs = await OperationTiming.find({**query, "success": True}) \
+                    .sort(-OperationTiming.created_at).limit(ETA_HISTORY_SAMPLES).to_list()
+                if len(runs) >= ETA_MIN_SAMPLES:
+                    break
+
+            durations: Dict[str, List[float]] = {}
+            for run in runs:
+                for step, duration_ms in run.steps.items():
+                    durations.setdefault(step, []).append(duration_ms)
+            return {step: statistics.median(values) for step, values in durations.items()}
+
+        except Exception as e:
+            logger.warning(f"Could not load step timings for {shape['shape']}: {e}")
+            return {}
+
+    async def record(self, operation_id: str, shape: Dict[str, Any], steps: Dict[str, float], success: bool):
+        """Store the durations of the steps a run actually executed"""
+        if not steps:
+            return
+        try:
+            await OperationTiming(
+                operation_id=operation_id,
+                steps=steps,
+                total_ms=sum(steps.values()),
+                success=success,
+                **shape
+            ).insert()
+        except Exception as e:
+            logger.warning(f"Could not record step timings for {operation_id}: {e}")
+
+    async def report(self, days: int = 30) -> Dict[str, Any]:
+        """
+        Where provisioning time goes over the last `days`: per step and per
+        framework, slowest first. A run counts towards every framework it
+        scaffolded.
+        """
+        match = {"$match": {"created_at": {"$gte": datetime.now() - timedelta(days=days)}}}
+        by_step = await OperationTiming.aggregate([
+            match,
+            {"$project": {"steps": {"$objectToArray": "$steps"}}},
+            {"$unwind": "$steps"},
+            {"$group": {
+                "_id": "$steps.k",
+                "runs": {"$sum": 1},
+                "total_ms": {"$sum": "$steps.v"},
+                "avg_ms": {"$avg": "$steps.v"},
+                "max_ms": {"$max": "$steps.v"}
+            }},
+            {"$sort": {"total_ms": -1}}
+        ]).to_list()
+
+        by_framework = await OperationTiming.aggregate([
+            match,
+            {"$unwind": "$frameworks"},
+            {"$group": {
+                "_id": "$frameworks",
+                "runs": {"$sum": 1},
+                "failed": {"$sum": {"$cond": ["$success", 0, 1]}},
+                "total_ms": {"$sum": "$total_ms"},
+                "avg_ms": {"$avg": "$total_ms"},
+                "max_ms": {"$max": "$total_ms"}
+            }},
+            {"$sort": {"total_ms": -1}}
+        ]).to_list()
+
+        totals = await OperationTiming.aggregate([
+            match,
+            {"$group": {
+                "_id": None,
+                "runs": {"$sum": 1},
+                "failed": {"$sum": {"$cond": ["$success", 0, 1]}},
+                "total_ms": {"$sum": "$total_ms"}
+            }}
+        ]).to_list()
+
+        return {
+            "days": days,
+            "runs": totals[0]["runs"] if totals else 0,
+            "failed": totals[0]["failed"] if totals else 0,
+            "total_ms": totals[0]["total_ms"] if totals else 0.0,
+            "steps": [{"name": row.pop("_id"), **row} for row in by_step],
+            "frameworks": [{"name": row.pop("_id"), **row} for row in by_framework]
+        }
+
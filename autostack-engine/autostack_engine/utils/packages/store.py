@@ -0,0 +1,423 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import stat
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+HASH_CHUNK = 1024 * 1024
+
+# Fields that only identify the project itself; they differ per component
+# and do not affect what gets installed
+IDENTITY_FIELDS = ("name", "version")
+
+
+def default_store_root() -> Path:
+    return Path(os.getenv(
+        "AUTOSTACK_PACKAGE_STORE_DIR",
+        Path.home() / ".cache" / "autostack" / "store"
+    ))
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def normalized_manifest(path: Path) -> bytes:
+    """
+    What of package.json / package-lock.json decides the installed tree:
+    everything but the project's own name and version (and the lockfile's
+    root package entry, which repeats them next to package.json's
+    dependencies). Falls back to the raw bytes if the file is not JSON.
+    """
+    data = _read_json(path)
+    if data is None:
+        return path.read_bytes()
+    data = {field: value for field, value in data.items() if field not in IDENTITY_FIELDS}
+    if isinstance(data.get("packages"), dict):
+        data["packages"] = {rel: entry for rel, entry in data["packages"].items() if rel != ""}
+    return json.dumps(data, sort_keys=True).encode()
+
+
+def stamp_lockfile(path: Path, identity: Dict[str, Any]):
+    """
+    Write a project's name/version into a lockfile restored from another
+    project. The file is rewritten as a private copy, so a hardlinked store
+    object is never modified.
+    """
+    data = _read_json(path)
+    if data is None:
+        return
+    data.update(identity)
+    root = data.get("packages", {}).get("")
+    if isinstance(root, dict):
+        root.update(identity)
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+    tmp.write_text(json.dumps(data, indent=2) + "\n")
+    os.replace(tmp, path)
+
+
+class PackageStore:
+    """
+    Machine-wide, content-addressed store for installed dependencies.
+
+    Layout under root:
+        objects/<aa>/<sha256>[-x]   one file per distinct content (+ exec bit)
+        manifests/node/<key>.json   node_modules tree -> object list
+        npm-cache/                  shared npm cache (verified, never wiped)
+        wheelhouse/                 shared pip wheels for --find-links
+
+    A node_modules tree is ingested once per (package.json, lockfile, node
+    version) key, ignoring the project's own name and version; every later
+    install with the same key is materialized by hardlinking objects, so
+    identical files share one inode across projects. Restored lockfiles are
+    re-stamped with the restoring project's name and version.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else default_store_root()
+        self.enabled = os.getenv("AUTOSTACK_PACKAGE_STORE_ENABLED", "true").lower() in ("1", "true", "yes")
+        self.objects_dir = self.root / "objects"
+        self.node_manifests_dir = self.root / "manifests" / "node"
+        self.npm_cache_dir = self.root / "npm-cache"
+        self.wheelhouse_dir = self.root / "wheelhouse"
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def ensure_layout(self):
+        for directory in (self.objects_dir, self.node_manifests_dir, self.npm_cache_dir, self.wheelhouse_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def lock(self, key: str) -> asyncio.Lock:
+        return self._locks.setdefault(key, asyncio.Lock())
+
+    def node_env_vars(self) -> Dict[str, str]:
+        """Variables that point npm/npx at the shared cache"""
+        self.ensure_layout()
+        return {"npm_config_cache": str(self.npm_cache_dir)}
+
+    def node_env(self) -> Dict[str, str]:
+        """Current environment pointed at the shared npm cache"""
+        return {**os.environ, **self.node_env_vars()}
+
+    # Keys and manifests
+
+    @staticmethod
+    def node_key(project_dir: Path, node_version: str) -> Optional[str]:
+        """Key for a node_modules tree: package.json + lockfile (without name/version) + node version"""
+        package_json = project_dir / "package.json"
+        if not package_json.exists():
+            return None
+        digest = hashlib.sha256(node_version.encode())
+        for name in ("package.json", "package-lock.json"):
+            path = project_dir / name
+            if path.exists():
+                digest.update(name.encode())
+                digest.update(normalized_manifest(path))
+        return digest.hexdigest()
+
+    def _manifest_path(self, key: str) -> Path:
+        return self.node_manifests_dir / f"{key}.json"
+
+    def _read_manifest(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._manifest_path(key)) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_manifest(self, key: str, manifest: Dict[str, Any]):
+        path = self._manifest_path(key)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, path)
+
+    def _touch_manifest(self, key: str, manifest: Dict[str, Any]):
+        manifest["last_used"] = time.time()
+        manifest["uses"] = manifest.get("uses", 0) + 1
+        self._write_manifest(key, manifest)
+
+    def _object_path(self, digest: str, executable: bool) -> Path:
+        name = f"{digest}-x" if executable else digest
+        return self.objects_dir / digest[:2] / name
+
+    # Ingest / materialize
+
+    def _ingest_file(self, path: Path) -> str:
+        """Move a file's content into the object store and hardlink it back"""
+        executable = bool(path.stat().st_mode & stat.S_IXUSR)
+        digest = file_digest(path)
+        obj = self._object_path(digest, executable)
+        obj.parent.mkdir(parents=True, exist_ok=True)
+
+        if not obj.exists():
+            try:
+                os.link(path, obj)
+                return obj.name
+            except FileExistsError:
+                pass  # Another ingest stored the same content first
+            except OSError:
+                # Store on another filesystem: keep a copy instead
+                tmp = obj.with_name(f".{obj.name}.{uuid.uuid4().hex[:8]}")
+                shutil.copy2(path, tmp)
+                os.replace(tmp, obj)
+                return obj.name
+
+        try:
+            tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex[:8]}")
+            os.link(obj, tmp)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # Leave the private copy in place
+        return obj.name
+
+    def ingest_tree(self, tree: Path) -> Dict[str, Any]:
+        """Ingest every file under tree; returns {files: [[rel, object]], symlinks: [[rel, target]]}"""
+        files: List[List[str]] = []
+        symlinks: List[List[str]] = []
+        for current, dirs, names in os.walk(tree):
+            for name in dirs + names:
+                path = Path(current) / name
+                if path.is_symlink():
+                    symlinks.append([str(path.relative_to(tree)), os.readlink(path)])
+            for name in names:
+                path = Path(current) / name
+                if path.is_symlink() or not path.is_file():
+                    continue
+                files.append([str(path.relative_to(tree)), self._ingest_file(path)])
+        return {"files": files, "symlinks": symlinks}
+
+    def materialize_tree(self, manifest: Dict[str, Any], target: Path) -> bool:
+        """Recreate a manifest's tree under target with hardlinks into the store"""
+        if target.exists():
+            shutil.rmtree(target)
+        target.mkdir(parents=True)
+
+        for rel, name in manifest["files"]:
+            obj = self.objects_dir / name[:2] / name
+            dst = target / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(obj, dst)
+            except FileNotFoundError:
+                logger.warning(f"Package store object missing: {name}")
+                return False
+            except OSError:
+                shutil.copy2(obj, dst)
+
+        for rel, link_target in manifest["symlinks"]:
+            dst = target / rel
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            if dst.is_symlink() or dst.exists():
+                continue
+            os.symlink(link_target, dst)
+
+        return True
+
+    async def restore_node_modules(self, project_dir: Path, key: str) -> bool:
+        """Materialize node_modules (and the lockfile it was installed from) for key"""
+        manifest = self._read_manifest(key)
+        if not manifest:
+            return False
+
+        def restore() -> bool:
+            if not self.materialize_tree(manifest, project_dir / "node_modules"):
+                return False
+            package = _read_json(project_dir / "package.json") or {}
+            identity = {field: package[field] for field in IDENTITY_FIELDS if field in package}
+
+            # The entry may have been installed by a project with another name
+            hidden_lockfile = project_dir / "node_modules" / ".package-lock.json"
+            if identity and hidden_lockfile.exists():
+                stamp_lockfile(hidden_lockfile, identity)
+            lockfile = manifest.get("lockfile")
+            if lockfile and not (project_dir / "package-lock.json").exists():
+                shutil.copy2(self.objects_dir / lockfile[:2] / lockfile, project_dir / "package-lock.json")
+                if identity:
+                    stamp_lockfile(project_dir / "package-lock.json", identity)
+            return True
+
+        if not await asyncio.to_thread(restore):
+            # Broken entry: drop it so the next install repopulates
+            self._manifest_path(key).unlink(missing_ok=True)
+            return False
+
+        self._touch_manifest(key, manifest)
+        self.hits += 1
+        return True
+
+    async def save_node_modules(self, project_dir: Path, key: str, node_version: str) -> bool:
+        """Ingest a freshly installed node_modules under key"""
+        node_modules = project_dir / "node_modules"
+        if not node_modules.is_dir():
+            return False
+
+        def ingest() -> Dict[str, Any]:
+            self.ensure_layout()
+            manifest = self.ingest_tree(node_modules)
+            lockfile = project_dir / "package-lock.json"
+            if lockfile.exists():
+                digest = file_digest(lockfile)
+                obj = self._object_path(digest, False)
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                if not obj.exists():
+                    shutil.copy2(lockfile, obj)
+                manifest["lockfile"] = obj.name
+            return manifest
+
+        manifest = await asyncio.to_thread(ingest)
+        now = time.time()
+        manifest.update({"node_version": node_version, "created_at": now, "last_used": now, "uses": 0})
+        self._write_manifest(key, manifest)
+        self.misses += 1
+        logger.info(f"Stored node_modules {key[:12]} ({len(manifest['files'])} files)")
+        return True
+
+    # Maintenance
+
+    def stats(self) -> Dict[str, Any]:
+        manifests = list(self.node_manifests_dir.glob("*.json")) if self.node_manifests_dir.exists() else []
+        objects = 0
+        size = 0
+        if self.objects_dir.exists():
+            for current, _, names in os.walk(self.objects_dir):
+                for name in names:
+                    objects += 1
+                    size += os.lstat(os.path.join(current, name)).st_size
+        wheels = list(self.wheelhouse_dir.glob("*.whl")) if self.wheelhouse_dir.exists() else []
+        return {
+            "root": str(self.root),
+            "node_manifests": len(manifests),
+            "objects": objects,
+            "object_bytes": size,
+            "wheels": len(wheels),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def gc(self, max_age_days: float) -> Dict[str, int]:
+        """
+        Drop manifests not used for max_age_days, then every object no longer
+        linked from any project (link count 1 means only the store holds it)
+        and wheels not modified for max_age_days.
+        """
+        cutoff = time.time() - max_age_days * 86400
+        removed_manifests = 0
+        if self.node_manifests_dir.exists():
+            for path in self.node_manifests_dir.glob("*.json"):
+                try:
+                    with open(path) as f:
+                        last_used = json.load(f).get("last_used", 0)
+                except (OSError, json.JSONDecodeError):
+                    last_used = 0
+                if last_used < cutoff:
+                    path.unlink(missing_ok=True)
+                    removed_manifests += 1
+
+        referenced = set()
+        if self.node_manifests_dir.exists():
+            for path in self.node_manifests_dir.glob("*.json"):
+                try:
+                    with open(path) as f:
+                        manifest = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    continue
+                referenced.update(name for _, name in manifest.get("files", []))
+                if manifest.get("lockfile"):
+                    referenced.add(manifest["lockfile"])
+
+        removed_objects = 0
+        freed = 0
+        if self.objects_dir.exists():
+            for current, _, names in os.walk(self.objects_dir):
+                for name in names:
+                    path = Path(current) / name
+                    st = path.stat()
+                    if name not in referenced and st.st_nlink == 1:
+                        path.unlink()
+                        removed_objects += 1
+                        freed += st.st_size
+
+        removed_wheels = 0
+        if self.wheelhouse_dir.exists():
+            for wheel in self.wheelhouse_dir.glob("*.whl"):
+                if wheel.stat().st_mtime < cutoff:
+                    wheel.unlink()
+                    removed_wheels += 1
+
+        return {
+            "manifests": removed_manifests,
+            "objects": removed_objects,
+            "bytes": freed,
+            "wheels": removed_wheels,
+        }
+
+    def verify(self, deep: bool = False) -> Dict[str, int]:
+        """
+        Check that every manifest's objects exist (and, with deep, still hash
+        to their name). Broken manifests are removed so they get rebuilt.
+        """
+        checked = 0
+        broken = 0
+        if not self.node_manifests_dir.exists():
+            return {"manifests": 0, "broken": 0}
+
+        for path in self.node_manifests_dir.glob("*.json"):
+            checked += 1
+            try:
+                with open(path) as f:
+                    manifest = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                path.unlink(missing_ok=True)
+                broken += 1
+                continue
+
+            names = [name for _, name in manifest.get("files", [])]
+            if manifest.get("lockfile"):
+                names.append(manifest["lockfile"])
+
+            ok = True
+            for name in names:
+                obj = self.objects_dir / name[:2] / name
+                if not obj.exists() or (deep and file_digest(obj) != name.removesuffix("-x")):
+                    ok = False
+                    break
+            if not ok:
+                path.unlink(missing_ok=True)
+                broken += 1
+
+        return {"manifests": checked, "broken": broken}
+
+
+_package_store: Optional[PackageStore] = None
+
+
+def get_package_store() -> PackageStore:
+    """Get the process-wide package store"""
+    global _package_store
+    if _package_store is None:
+        _package_store = PackageStore()
+    return _package_store
@@ -0,0 +1,201 @@
+import asyncio
+import os
+import signal
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import structlog
+
+logger = structlog.get_logger()
+
+DEFAULT_TIMEOUT = float(os.getenv("PROCESS_TIMEOUT_SECONDS", "9000"))
+KILL_GRACE_PERIOD = float(os.getenv("PROCESS_KILL_GRACE_SECONDS", "5"))
+STREAM_LIMIT = 1024 * 1024  # Longest single output line we buffer (npm can be chatty)
+
+
+@dataclass
+class OperationContext:
+    """Where live command output for the current operation is published"""
+    operation_store: Any
+    operation_id: str
+
+
+operation_context_var: ContextVar[Optional[OperationContext]] = ContextVar('operation_context', default=None)
+
+
+def set_operation_context(operation_store, operation_id: str) -> Token:
+    """Route output of commands run in this context to an operation's channel"""
+    return operation_context_var.set(OperationContext(operation_store, operation_id))
+
+
+def reset_operation_context(token: Token):
+    operation_context_var.reset(token)
+
+
+@dataclass
+class CommandResult:
+    """Outcome of a single command"""
+    cmd: List[str]
+    returncode: Optional[int]
+    stdout: str = ""
+    stderr: str = ""
+    duration_ms: float = 0.0
+    timed_out: bool = False
+    lines: int = field(default=0, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+
+async def _publish(context: Optional[OperationContext], stream: str, line: str, label: str):
+    if context is None:
+        return
+    try:
+        await context.operation_store.publish_output(context.operation_id, stream, line, label)
+    except Exception as e:
+        # Live output is best effort; never fail the command because of it
+        logger.debug(f"Failed to publish output for {context.operation_id}: {e}")
+
+
+async def _read_stream(
+    reader: asyncio.StreamReader,
+    stream: str,
+    sink: List[str],
+    context: Optional[OperationContext],
+    label: str
+):
+    while True:
+        try:
+            raw = await reader.readline()
+        except ValueError:
+            # Line longer than STREAM_LIMIT: take what is buffered and carry on
+            raw = await reader.read(STREAM_LIMIT)
+        if not raw:
+            break
+        line = raw.decode(errors="replace")
+        sink.append(line)
+        await _publish(context, stream, line.rstrip("\n"), label)
+
+
+async def _kill_process_group(process: asyncio.subprocess.Process):
+    """SIGTERM the whole process group, then SIGKILL whatever is left"""
+    if process.returncode is not None:
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(process.wait(), timeout=KILL_GRACE_PERIOD)
+    except asyncio.TimeoutError:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            return
+        await process.wait()
+
+
+async def run_command(
+    cmd: Sequence[str],
+    cwd: Optional[str] = None,
+    env: Optional[Dict[str, str]] = None,
+    input: Optional[str] = None,
+    timeout: Optional[float] = None,
+    label: Optional[str] = None,
+    publish: bool = True
+) -> CommandResult:
+    """
+    Run a command without blocking the event loop.
+
+    stdout/stderr are read line by line and, when an operation context is set
+    (see set_operation_context), published live to the operation's output
+    channel. The command runs in its own process group so that a timeout or a
+    cancelled task kills npx/devbox and every child they spawned.
+
+    Args:
+        cmd: Command and arguments
+        cwd: Working directory
+        env: Full environment for the child (defaults to the current one)
+        input: Text written to stdin, which is then closed
+        timeout: Seconds before the process group is killed
+        label: Short name shown next to published output lines
+        publish: Whether to publish output to the operation (off for output
+            that must not reach clients, e.g. environment dumps)
+
+    Returns:
+        CommandResult with exit code, captured output and duration. A missing
+        executable is reported as exit code 127 rather than raised.
+    """
+    cmd = [str(part) for part in cmd]
+    timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+    label = label or os.path.basename(cmd[0])
+    context = operation_context_var.get() if publish else None
+    stdout_lines: List[str] = []
+    stderr_lines: List[str] = []
+    started = time.monotonic()
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=cwd,
+            env=env,
+            stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+            limit=STREAM_LIMIT
+        )
+    except (FileNotFoundError, PermissionError) as e:
+        return CommandResult(cmd, 127, stderr=str(e), duration_ms=(time.monotonic() - started) * 1000)
+
+    async def communicate():
+        if input is not None:
+            try:
+                process.stdin.write(input.encode())
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            finally:
+                process.stdin.close()
+        await asyncio.gather(
+            _read_stream(process.stdout, "stdout", stdout_lines, context, label),
+            _read_stream(process.stderr, "stderr", stderr_lines, context, label)
+        )
+        return await process.wait()
+
+    timed_out = False
+    try:
+        returncode = await asyncio.wait_for(communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        timed_out = True
+        await _kill_process_group(process)
+        returncode = process.returncode
+    except asyncio.CancelledError:
+        await _kill_process_group(process)
+        raise
+
+    result = CommandResult(
+        cmd=cmd,
+        returncode=returncode,
+        stdout="".join(stdout_lines),
+        stderr="".join(stderr_lines),
+        duration_ms=(time.monotonic() - started) * 1000,
+        timed_out=timed_out,
+        lines=len(stdout_lines) + len(stderr_lines)
+    )
+
+    logger.info(
+        "process.finished",
+        cmd=" ".join(cmd),
+        cwd=cwd,
+        returncode=result.returncode,
+        duration_ms=round(result.duration_ms, 1),
+        timed_out=timed_out
+    )
+    if timed_out:
+        await _publish(context, "stderr", f"Command timed out after {timeout:.0f}s: {' '.join(cmd)}", label)
+
+    return result
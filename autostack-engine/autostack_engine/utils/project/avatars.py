@@ -0,0 +1,24 @@
+import hashlib
+import os
+from typing import Optional
+
+from autostack_engine.utils.database.models.project.models import ProjectAvatar
+from autostack_engine.utils.project.icon_generator import IdenticonGenerator
+
+# Public address of the gateway, avatar URLs handed to clients start with it
+AVATAR_BASE_URL = os.getenv("AVATAR_BASE_URL", f"http://localhost:{os.getenv('GATEWAY_PORT', '8020')}").rstrip("/")
+
+
+def avatar_url(avatar_hash: Optional[str]) -> Optional[str]:
+    """Where the gateway serves a project's avatar (see gateway/avatars.py)"""
+    if not avatar_hash:
+        return None
+    return f"{AVATAR_BASE_URL}/avatars/{avatar_hash}.png"
+
+
+def create_avatar(project_name: str) -> ProjectAvatar:
+    """An unsaved identicon avatar for a project name"""
+    generator = IdenticonGenerator()
+    img, hash_hex = generator.generate_identicon(project_name)
+    data = generator.image_to_bytes(img)
+    return ProjectAvatar(hash=hash_hex, data=data, etag=hashlib.sha256(data).hexdigest())
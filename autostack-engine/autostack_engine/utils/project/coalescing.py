@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from autostack_engine.utils.project.subscription import TERMINAL_STATUSES, ProjectCreationStatus
+
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingOperationStore:
+    """
+    Rate-limits writes to an operation store.
+
+    Non-terminal updates to the same operation within a window are merged
+    into one: the latest status, message and ETA, the highest progress, and
+    the latest non-empty project_id/error/result. Every window, all merged
+    updates go out in a single batch (update_operations) and buffered output
+    lines in another (publish_outputs). Store load then grows with wall-clock
+    time rather than with the number of events.
+
+    Terminal updates (COMPLETED/FAILED) are written immediately, after the
+    operation's buffered output and any in-flight batch, so they are always
+    the last thing subscribers see. Everything else (subscribe, cleanup,
+    redis, ...) is passed through to the wrapped store.
+    """
+
+    def __init__(self, store, window_ms: Optional[int] = None):
+        self.store = store
+        window_ms = window_ms if window_ms is not None else int(os.getenv("OPERATION_UPDATE_WINDOW_MS", "100"))
+        self.window = window_ms / 1000
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._output: List[Dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+
+        self.received = 0
+        self.written = 0
+        self.output_received = 0
+        self.output_written = 0
+
+    def __getattr__(self, name):
+        return getattr(self.store, name)
+
+    async def update_operation(
+        self,
+        operation_id: str,
+        status: ProjectCreationStatus,
+        message: str,
+        progress: int,
+        project_id: Optional[str] = None,
+        error: Optional[str] = None,
+        result: Optional[Any] = None,
+        eta_seconds: Optional[int] = None
+    ) -> Optional[str]:
+        """Queue an update; terminal updates are written right away and return their event ID"""
+        self.received += 1
+
+        if self.window <= 0:
+            self.written += 1
+            return await self.store.update_operation(
+                operation_id, status, message, progress, project_id, error, result, eta_seconds
+            )
+
+        if status.value in TERMINAL_STATUSES:
+            async with self._flush_lock:
+                pending = self._pending.pop(operation_id, None)
+                await self._write_output([line for line in self._output if line["operation_id"] == operation_id])
+                self._output = [line for line in self._output if line["operation_id"] != operation_id]
+
+                if pending:
+                    progress = max(progress, pending["progress"])
+                    project_id = project_id if project_id is not None else pending["project_id"]
+                    error = error if error is not None else pending["error"]
+                    result = result if result is not None else pending["result"]
+
+                self.written += 1
+                return await self.store.update_operation(
+                    operation_id, status, message, progress, project_id, error, result, eta_seconds
+                )
+
+        pending = self._pending.get(operation_id)
+        if pending:
+            pending.update(
+                status=status,
+                message=message,
+                progress=max(progress, pending["progress"]),
+                project_id=project_id if project_id is not None else pending["project_id"],
+                error=error if error is not None else pending["error"],
+                result=result if result is not None else pending["result"],
+                eta_seconds=eta_seconds
+            )
+        else:
+            self._pending[operation_id] = {
+                "operation_id": operation_id,
+                "status": status,
+                "message": message,
+                "progress": progress,
+                "project_id": project_id,
+                "error": error,
+                "result": result,
+                "eta_seconds": eta_seconds
+            }
+        self._ensure_flusher()
+        return None
+
+    async def publish_output(self, operation_id: str, stream: str, line: str, command: Optional[str] = None):
+        """Buffer one output line for the next batch"""
+        self.output_received += 1
+
+        if self.window <= 0:
+            self.output_written += 1
+            await self.store.publish_output(operation_id, stream, line, command)
+            return
+
+        self._output.append({"operation_id": operation_id, "stream": stream, "line": line, "command": command})
+        self._ensure_flusher()
+
+    def _ensure_flusher(self):
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self._pending or self._output:
+            await asyncio.sleep(self.window)
+            await self.flush()
+
+    async def _write_output(self, lines: List[Dict[str, Any]]):
+        if not lines:
+            return
+        await self.store.publish_outputs(lines)
+        self.output_written += len(lines)
+
+    async def flush(self):
+        """Write every buffered update and output line now"""
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            output, self._output = self._output, []
+            try:
+                # Output first, so lines precede the progress they led to
+                await self._write_output(output)
+                if pending:
+                    await self.store.update_operations(list(pending.values()))
+                    self.written += len(pending)
+            except Exception as e:
+                # Progress is best effort; the next update supersedes these
+                logger.error(f"Failed to write {len(pending)} coalesced updates and {len(output)} output lines: {e}")
+
+    async def close(self):
+        """Flush what is buffered and stop the flusher"""
+        await self.flush()
+        if self._flusher and not self._flusher.done():
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "window_ms": int(self.window * 1000),
+            "updates_received": self.received,
+            "updates_written": self.written,
+            "output_received": self.output_received,
+            "output_written": self.output_written,
+            "pending": len(self._pending),
+        }
@@ -54,11 +54,16 @@ class IdenticonGenerator:
         return img, hash_hex
     
     @staticmethod
-    def image_to_base64(img: Image.Image, format: str = 'PNG') -> str:
-        """Convert PIL Image to base64 string"""
+    def image_to_bytes(img: Image.Image, format: str = 'PNG') -> bytes:
+        """Encode PIL Image as an image file"""
         buffer = io.BytesIO()
         img.save(buffer, format=format)
-        img_bytes = buffer.getvalue()
+        return buffer.getvalue()
+    
+    @staticmethod
+    def image_to_base64(img: Image.Image, format: str = 'PNG') -> str:
+        """Convert PIL Image to base64 string"""
+        img_bytes = IdenticonGenerator.image_to_bytes(img, format)
         return base64.b64encode(img_bytes).decode('utf-8')
     
     @staticmethod
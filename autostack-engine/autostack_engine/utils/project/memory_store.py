@@ -0,0 +1,321 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from autostack_engine.utils.project.pubsub import ConflatingQueue, Subscription
+from autostack_engine.utils.project.subscription import (
+    EVENTS_MAXLEN,
+    OUTPUT_QUEUE_SIZE,
+    TERMINAL_STATUSES,
+    UPDATE_QUEUE_SIZE,
+    OperationOutputLine,
+    ProjectCreationStatus,
+    ProjectCreationUpdate,
+    event_id_key,
+    update_from_message,
+)
+
+
+logger = logging.getLogger(__name__)
+
+SWEEP_INTERVAL = 60
+
+
+class InMemoryOperationStore:
+    """
+    Operation store that lives in the current process.
+
+    Same behaviour as RedisOperationStore (event log with replay, conflating
+    subscriber queues, TTL expiry) without a Redis server, for single-node
+    installs, CI and load tests. Nothing is shared between processes, so the
+    gateway and whatever runs operations must be the same process.
+    """
+
+    def __init__(self, operation_ttl: int = 3600):
+        self.operation_ttl = operation_ttl
+        self._operations: Dict[str, Dict[str, Any]] = {}
+        self._events: Dict[str, Deque[Tuple[str, Dict[str, Any]]]] = {}
+        self._expires: Dict[str, float] = {}
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._cancel_requested: Set[str] = set()
+        self._cancel_watchers: List[Callable[[str], Any]] = []
+        self._last_event: Tuple[int, int] = (0, 0)
+        self._sweeper: Optional[asyncio.Task] = None
+
+        self.delivered = 0
+
+    async def initialize(self):
+        self._sweeper = asyncio.create_task(self._sweep())
+        logger.info("In-memory operation store initialized")
+
+    async def close(self):
+        if self._sweeper:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+        for subs in self._subscriptions.values():
+            for subscription in subs:
+                subscription.active = False
+        self._subscriptions.clear()
+
+    # Expiry
+
+    def _touch(self, operation_id: str):
+        self._expires[operation_id] = time.monotonic() + self.operation_ttl
+
+    def _alive(self, operation_id: str) -> bool:
+        expires = self._expires.get(operation_id)
+        if expires is None:
+            return False
+        if expires <= time.monotonic():
+            self._evict(operation_id)
+            return False
+        return True
+
+    def _evict(self, operation_id: str):
+        self._operations.pop(operation_id, None)
+        self._events.pop(operation_id, None)
+        self._expires.pop(operation_id, None)
+        self._cancel_requested.discard(operation_id)
+
+    async def _sweep(self):
+        while True:
+            await asyncio.sleep(SWEEP_INTERVAL)
+            now = time.monotonic()
+            expired = [operation_id for operation_id, expires in self._expires.items() if expires <= now]
+            for operation_id in expired:
+                self._evict(operation_id)
+            if expired:
+                logger.info(f"Evicted {len(expired)} expired operations")
+
+    def _next_event_id(self) -> str:
+        ms = int(time.time() * 1000)
+        last_ms, last_seq = self._last_event
+        self._last_event = (ms, 0) if ms > last_ms else (last_ms, last_seq + 1)
+        return f"{self._last_event[0]}-{self._last_event[1]}"
+
+    # Writes
+
+    async def create_operation(self, operation_id: str):
+        self._operations[operation_id] = {
+            "status": ProjectCreationStatus.QUEUED.value,
+            "progress": 0,
+            "message": "Operation queued",
+            "project_id": None,
+            "error": None,
+            "created_at": datetime.now().isoformat()
+        }
+        self._events[operation_id] = deque(maxlen=EVENTS_MAXLEN)
+        self._cancel_requested.discard(operation_id)
+        self._touch(operation_id)
+        logger.info(f"Operation created: {operation_id}")
+
+    async def update_operation(
+        self,
+        operation_id: str,
+        status: ProjectCreationStatus,
+        message: str,
+        progress: int,
+        project_id: Optional[str] = None,
+        error: Optional[str] = None,
+        result: Optional[Any] = None,
+        eta_seconds: Optional[int] = None
+    ) -> str:
+        """Update operation and notify subscribers"""
+        operation = self._operations.get(operation_id) if self._alive(operation_id) else None
+        if operation is None:
+            operation = self._operations[operation_id] = {"created_at": None}
+            self._events[operation_id] = deque(maxlen=EVENTS_MAXLEN)
+
+        event_id = self._next_event_id()
+        update_message = {
+            "operation_id": operation_id,
+            "status": status.value,
+            "message": message,
+            "progress": progress,
+            "project_id": project_id,
+            "error": error,
+            "eta_seconds": eta_seconds,
+            "updated_at": datetime.utcnow().isoformat(),
+            "created_at": operation.get("created_at"),
+            "event_id": event_id
+        }
+
+        operation.update(status=status.value, message=message, progress=progress, eta_seconds=eta_seconds,
+                         updated_at=update_message["updated_at"], event_id=event_id)
+        if project_id is not None:
+            operation["project_id"] = project_id
+        if error is not None:
+            operation["error"] = error
+        if result is not None:
+            operation["result"] = result
+            if status.value in TERMINAL_STATUSES:
+                update_message["result"] = result
+
+        self._events[operation_id].append((event_id, update_message))
+        self._touch(operation_id)
+        self._dispatch(operation_id, "updates", update_message)
+
+        logger.info(f"Operation updated: {operation_id} - {status.value} ({progress}%)")
+        return event_id
+
+    async def update_operations(self, updates: List[Dict[str, Any]]) -> List[str]:
+        return [await self.update_operation(**update) for update in updates]
+
+    async def publish_output(self, operation_id: str, stream: str, line: str, command: Optional[str] = None):
+        self._dispatch(operation_id, "output", {
+            "operation_id": operation_id,
+            "stream": stream,
+            "line": line,
+            "command": command,
+            "timestamp": datetime.utcnow().isoformat()
+        })
+
+    async def publish_outputs(self, lines: List[Dict[str, Any]]):
+        for line in lines:
+            await self.publish_output(line["operation_id"], line["stream"], line["line"], line.get("command"))
+
+    # Reads
+
+    async def get_operation(self, operation_id: str) -> Optional[ProjectCreationUpdate]:
+        """Current state of an operation, None if unknown or expired"""
+        if not self._alive(operation_id) or "status" not in self._operations[operation_id]:
+            return None
+        operation = self._operations[operation_id]
+        terminal = operation["status"] in TERMINAL_STATUSES
+        return update_from_message({
+            **operation,
+            "operation_id": operation_id,
+            "result": operation.get("result") if terminal else None
+        })
+
+    async def load_result(self, result_key: str) -> Optional[Any]:
+        # Results are kept inline, so nothing is ever stored under a key
+        return None
+
+    async def read_events(self, operation_id: str, after: str = "0-0") -> List[ProjectCreationUpdate]:
+        if not self._alive(operation_id):
+            return []
+        after_key = event_id_key(after)
+        return [
+            update_from_message(message)
+            for event_id, message in self._events.get(operation_id, ())
+            if event_id_key(event_id) > after_key
+        ]
+
+    # Subscriptions
+
+    def _dispatch(self, operation_id: str, kind: str, message: Dict[str, Any]):
+        for subscription in list(self._subscriptions.get(operation_id, ())):
+            if not subscription.active or kind not in subscription.kinds:
+                continue
+            self.delivered += 1
+            if subscription.handler(kind, message) is False:
+                self._detach(subscription)
+
+    def _attach(self, subscription: Subscription):
+        self._subscriptions.setdefault(subscription.operation_id, set()).add(subscription)
+
+    def _detach(self, subscription: Subscription):
+        subscription.active = False
+        subs = self._subscriptions.get(subscription.operation_id)
+        if subs is None:
+            return
+        subs.discard(subscription)
+        if not subs:
+            del self._subscriptions[subscription.operation_id]
+
+    async def subscribe(self, operation_id: str, last_event_id: Optional[str] = None) -> ConflatingQueue:
+        """
+        Subscribe to operation updates, starting with the current state or,
+        with last_event_id, with every logged update after it.
+        """
+        queue = ConflatingQueue(
+            maxsize=UPDATE_QUEUE_SIZE,
+            droppable=lambda update: update.status.value not in TERMINAL_STATUSES
+        )
+
+        # Nothing can be published between reading the backlog and attaching
+        if last_event_id:
+            backlog = await self.read_events(operation_id, last_event_id)
+        else:
+            current = await self.get_operation(operation_id)
+            backlog = [current] if current else []
+        for update in backlog:
+            queue.put_nowait(update)
+
+        def on_message(kind: str, data: dict) -> bool:
+            update = update_from_message(data)
+            queue.put_nowait(update)
+            return update.status.value not in TERMINAL_STATUSES
+
+        queue.subscription = Subscription(operation_id, ("updates",), on_message)
+        if not any(update.status.value in TERMINAL_STATUSES for update in backlog):
+            self._attach(queue.subscription)
+        return queue
+
+    async def cleanup(self, operation_id: str, queue: ConflatingQueue):
+        if queue.subscription:
+            self._detach(queue.subscription)
+
+    async def subscribe_output(self, operation_id: str) -> ConflatingQueue:
+        """Live command output; ends with None once the operation finishes"""
+        queue = ConflatingQueue(maxsize=OUTPUT_QUEUE_SIZE, droppable=lambda item: item is not None)
+
+        def on_message(kind: str, data: dict) -> bool:
+            if kind == "updates":
+                if data['status'] in TERMINAL_STATUSES:
+                    queue.put_nowait(None)
+                    return False
+                return True
+
+            queue.put_nowait(OperationOutputLine(
+                operation_id=data['operation_id'],
+                stream=data['stream'],
+                line=data['line'],
+                command=data.get('command'),
+                timestamp=data.get('timestamp')
+            ))
+            return True
+
+        queue.subscription = Subscription(operation_id, ("output", "updates"), on_message)
+        self._attach(queue.subscription)
+        return queue
+
+    async def cleanup_output(self, queue: ConflatingQueue):
+        if queue.subscription:
+            self._detach(queue.subscription)
+
+    # Cancellation
+
+    async def request_cancel(self, operation_id: str):
+        self._cancel_requested.add(operation_id)
+        for callback in list(self._cancel_watchers):
+            try:
+                callback(operation_id)
+            except Exception as e:
+                logger.error(f"Cancellation handler failed for {operation_id}: {e}")
+        logger.info(f"Cancellation requested: {operation_id}")
+
+    async def cancel_requested(self, operation_id: str) -> bool:
+        return operation_id in self._cancel_requested
+
+    async def watch_cancellations(self, callback: Callable[[str], Any]):
+        """Call callback(operation_id) for every cancellation request until cancelled"""
+        self._cancel_watchers.append(callback)
+        try:
+            await asyncio.Future()
+        finally:
+            self._cancel_watchers.remove(callback)
+
+    def subscription_stats(self) -> Dict[str, Any]:
+        return {
+            "operations": len(self._operations),
+            "subscribers": sum(len(subs) for subs in self._subscriptions.values()),
+            "delivered": self.delivered,
+        }
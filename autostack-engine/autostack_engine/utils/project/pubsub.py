@@ -0,0 +1,233 @@
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+import redis.asyncio as redis
+
+
+logger = logging.getLogger(__name__)
+
+# Channels are operation:{operation_id}:{kind}
+CHANNEL_PATTERNS = ("operation:*:updates", "operation:*:output")
+
+RECONNECT_MIN_DELAY = 0.5
+RECONNECT_MAX_DELAY = 10.0
+
+
+class ConflatingQueue:
+    """
+    Bounded queue for one subscriber that never blocks the producer.
+
+    When full, the oldest item that `droppable` allows is discarded to make
+    room (e.g. an intermediate progress update that a later one supersedes).
+    Items that are not droppable, such as terminal updates, are always kept,
+    even past maxsize. get() is compatible with asyncio.Queue.get().
+    """
+
+    def __init__(self, maxsize: int = 100, droppable: Optional[Callable[[Any], bool]] = None):
+        self.maxsize = maxsize
+        self.droppable = droppable or (lambda item: True)
+        self.dropped = 0
+        self.subscription: Optional["Subscription"] = None
+        self._items: deque = deque()
+        self._available = asyncio.Event()
+
+    def put_nowait(self, item: Any):
+        if self.maxsize > 0 and len(self._items) >= self.maxsize:
+            for index, queued in enumerate(self._items):
+                if self.droppable(queued):
+                    del self._items[index]
+                    self.dropped += 1
+                    break
+        self._items.append(item)
+        self._available.set()
+
+    async def put(self, item: Any):
+        self.put_nowait(item)
+
+    async def get(self) -> Any:
+        while not self._items:
+            self._available.clear()
+            await self._available.wait()
+        return self._items.popleft()
+
+    def get_nowait(self) -> Any:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._items.popleft()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+
+# Called with (kind, data) for every message on a subscribed operation's
+# channels; returning False detaches the subscription (e.g. after a terminal
+# update). Runs on the listener task, so it must not block.
+MessageHandler = Callable[[str, Dict[str, Any]], bool]
+
+
+class Subscription:
+    """One subscriber's interest in an operation's channels"""
+
+    def __init__(self, operation_id: str, kinds: Iterable[str], handler: MessageHandler):
+        self.operation_id = operation_id
+        self.kinds = frozenset(kinds)
+        self.handler = handler
+        self.active = True
+
+
+class OperationPubSub:
+    """
+    Fans out operation channels to in-process subscribers.
+
+    A single pattern subscription (operation:*:updates, operation:*:output)
+    per process replaces a pubsub connection per subscriber, so the number of
+    Redis connections stays flat no matter how many clients are watching.
+    Messages are routed by operation ID to reference-counted subscriptions;
+    the pattern subscription is opened with the first subscriber and closed
+    with the last one.
+    """
+
+    def __init__(self, client: redis.Redis):
+        self.client = client
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._lock = asyncio.Lock()
+
+        self.delivered = 0
+        self.reconnects = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._subscriptions.values())
+
+    async def subscribe(
+        self,
+        operation_id: str,
+        kinds: Iterable[str],
+        handler: MessageHandler
+    ) -> Subscription:
+        """Register a handler for an operation; the listener is subscribed when this returns"""
+        subscription = Subscription(operation_id, kinds, handler)
+        async with self._lock:
+            self._subscriptions.setdefault(operation_id, set()).add(subscription)
+            if self._listener is None or self._listener.done():
+                self._ready = asyncio.Event()
+                self._listener = asyncio.create_task(self._listen())
+            ready = self._ready
+        await ready.wait()
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription):
+        """Drop a subscription; closes the pattern subscription once nobody is left"""
+        subscription.active = False
+        async with self._lock:
+            self._detach(subscription)
+            if self._subscriptions or self._listener is None:
+                return
+            listener, self._listener = self._listener, None
+
+        listener.cancel()
+        try:
+            await listener
+        except asyncio.CancelledError:
+            pass
+
+    def _detach(self, subscription: Subscription):
+        subs = self._subscriptions.get(subscription.operation_id)
+        if subs is None:
+            return
+        subs.discard(subscription)
+        if not subs:
+            del self._subscriptions[subscription.operation_id]
+
+    def _dispatch(self, channel: str, data: bytes):
+        _, _, rest = channel.partition(":")
+        operation_id, _, kind = rest.rpartition(":")
+        subs = self._subscriptions.get(operation_id)
+        if not subs:
+            return
+
+        try:
+            payload = json.loads(data)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid message on {channel}: {e}")
+            return
+
+        for subscription in list(subs):
+            if not subscription.active or kind not in subscription.kinds:
+                continue
+            try:
+                keep = subscription.handler(kind, payload)
+            except Exception as e:
+                logger.error(f"Subscriber for {operation_id} failed on {kind} message: {e}")
+                continue
+            self.delivered += 1
+            if keep is False:
+                subscription.active = False
+                self._detach(subscription)
+
+    async def _listen(self):
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.psubscribe(*CHANNEL_PATTERNS)
+                self._ready.set()
+                delay = RECONNECT_MIN_DELAY
+                logger.info("Operation pubsub listener subscribed")
+
+                async for message in pubsub.listen():
+                    if message['type'] != 'pmessage':
+                        continue
+                    channel = message['channel']
+                    if isinstance(channel, bytes):
+                        channel = channel.decode()
+                    self._dispatch(channel, message['data'])
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Subscribers stay registered; messages published while
+                # reconnecting are missed
+                self.reconnects += 1
+                logger.warning(f"Operation pubsub listener lost its connection, retrying in {delay:.1f}s: {e}")
+                self._ready.set()
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    async def close(self):
+        """Stop the listener and drop every subscription"""
+        async with self._lock:
+            for subs in self._subscriptions.values():
+                for subscription in subs:
+                    subscription.active = False
+            self._subscriptions.clear()
+            listener, self._listener = self._listener, None
+
+        if listener:
+            listener.cancel()
+            try:
+                await listener
+            except asyncio.CancelledError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "listening": self._listener is not None and not self._listener.done(),
+            "operations": len(self._subscriptions),
+            "subscribers": self.subscriber_count,
+            "delivered": self.delivered,
+            "reconnects": self.reconnects,
+        }
@@ -2,7 +2,7 @@ import asyncio
 from datetime import datetime
 from enum import Enum
 import json
-from typing import Optional, Protocol
+from typing import Any, Callable, Optional, Protocol
 import strawberry
 import redis.asyncio as redis
 from redis.asyncio.connection import ConnectionPool
@@ -10,6 +10,13 @@ import os
 from dotenv import load_dotenv
 import logging
 
+from autostack_engine.utils.project.pubsub import (
+    RECONNECT_MAX_DELAY,
+    RECONNECT_MIN_DELAY,
+    ConflatingQueue,
+    OperationPubSub,
+)
+
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -26,6 +33,22 @@ class ProjectCreationStatus(Enum):
     PROCESSING = "PROCESSING"
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+    
+# Statuses after which an operation publishes nothing more
+TERMINAL_STATUSES = frozenset({
+    ProjectCreationStatus.COMPLETED.value,
+    ProjectCreationStatus.FAILED.value,
+    ProjectCreationStatus.CANCELLED.value
+})
+
+UPDATE_QUEUE_SIZE = int(os.getenv("OPERATION_UPDATE_QUEUE_SIZE", "100"))
+# Results larger than this are stored under their own key and only referenced
+# from the hash and from published updates
+RESULT_INLINE_BYTES = int(os.getenv("OPERATION_RESULT_INLINE_BYTES", "65536"))
+# Approximate number of updates kept per operation for replay
+EVENTS_MAXLEN = int(os.getenv("OPERATION_EVENTS_MAXLEN", "500"))
+OUTPUT_QUEUE_SIZE = int(os.getenv("OPERATION_OUTPUT_QUEUE_SIZE", "1000"))
     
 class ProjectDeletionStatus(Enum):
     QUEUED = "QUEUED"
@@ -41,6 +64,21 @@ class ProjectCreationUpdate:
     progress: int  # 0-100
     project_id: Optional[str] = None
     error: Optional[str] = None
+    eta_seconds: Optional[int] = None  # Estimated time remaining, from past runs of similar projects
+    event_id: Optional[str] = None  # Pass back as last_event_id to resume after a reconnect
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    # Job result, only on the terminal update: inline, or the key it is stored under
+    result: strawberry.Private[Optional[Any]] = None
+    result_key: strawberry.Private[Optional[str]] = None
+    
+@strawberry.type
+class OperationOutputLine:
+    operation_id: str
+    stream: str  # stdout | stderr
+    line: str
+    command: Optional[str] = None
+    timestamp: Optional[str] = None
     
 @strawberry.type
 class InitiateProjectResponse:
@@ -51,6 +89,112 @@ class InitiateProjectResponse:
     
                 
 
+# Applies one operation update atomically in a single round trip: logs it to
+# the event stream, updates the hash (and the separately stored result, if
+# any), refreshes the TTLs and publishes the update. The logged and published
+# update gets the operation's created_at, and the published one its event ID,
+# appended to the JSON object.
+# KEYS: hash, events stream, result
+# ARGV: update JSON, stream maxlen, ttl, channel, result JSON or '', hash field/value pairs...
+UPDATE_OPERATION_SCRIPT = """
+local update = ARGV[1]
+local created_at = redis.call('HGET', KEYS[1], 'created_at')
+if created_at then
+    update = string.sub(update, 1, -2) .. ',"created_at":' .. cjson.encode(created_at) .. '}'
+end
+local event_id = redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[2], '*', 'data', update)
+if ARGV[5] ~= '' then
+    redis.call('SET', KEYS[3], ARGV[5], 'EX', ARGV[3])
+end
+redis.call('HSET', KEYS[1], 'event_id', event_id, unpack(ARGV, 6))
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+redis.call('PUBLISH', ARGV[4], string.sub(update, 1, -2) .. ',"event_id":"' .. event_id .. '"}')
+return event_id
+"""
+
+
+def event_id_key(event_id: str) -> tuple[int, int]:
+    """Sortable form of a stream entry ID ("<ms>-<seq>")"""
+    ms, _, seq = event_id.partition("-")
+    return int(ms), int(seq or 0)
+
+
+def update_from_message(data: dict) -> ProjectCreationUpdate:
+    """Build an update from a published/logged update message"""
+    return ProjectCreationUpdate(
+        operation_id=data['operation_id'],
+        status=ProjectCreationStatus(data['status']),
+        message=data['message'],
+        progress=data['progress'],
+        project_id=data.get('project_id'),
+        error=data.get('error'),
+        eta_seconds=data.get('eta_seconds'),
+        event_id=data.get('event_id'),
+        created_at=data.get('created_at'),
+        updated_at=data.get('updated_at'),
+        result=data.get('result'),
+        result_key=data.get('result_key')
+    )
+
+
+class OperationStore(Protocol):
+    """
+    What the gateway, orchestration and workers need from an operation store.
+    
+    Implemented by RedisOperationStore (shared across processes) and
+    InMemoryOperationStore (single process); see create_operation_store.
+    """
+    
+    operation_ttl: int
+    
+    async def initialize(self): ...
+    
+    async def close(self): ...
+    
+    async def create_operation(self, operation_id: str): ...
+    
+    async def update_operation(
+        self,
+        operation_id: str,
+        status: ProjectCreationStatus,
+        message: str,
+        progress: int,
+        project_id: Optional[str] = None,
+        error: Optional[str] = None,
+        result: Optional[Any] = None,
+        eta_seconds: Optional[int] = None
+    ) -> Optional[str]: ...
+    
+    async def update_operations(self, updates: list[dict[str, Any]]) -> list[str]: ...
+    
+    async def get_operation(self, operation_id: str) -> Optional[ProjectCreationUpdate]: ...
+    
+    async def load_result(self, result_key: str) -> Optional[Any]: ...
+    
+    async def publish_output(self, operation_id: str, stream: str, line: str, command: Optional[str] = None): ...
+    
+    async def publish_outputs(self, lines: list[dict[str, Any]]): ...
+    
+    async def read_events(self, operation_id: str, after: str = "0-0") -> list[ProjectCreationUpdate]: ...
+    
+    async def subscribe(self, operation_id: str, last_event_id: Optional[str] = None) -> ConflatingQueue: ...
+    
+    async def cleanup(self, operation_id: str, queue: ConflatingQueue): ...
+    
+    async def subscribe_output(self, operation_id: str) -> ConflatingQueue: ...
+    
+    async def cleanup_output(self, queue: ConflatingQueue): ...
+    
+    def subscription_stats(self) -> dict[str, Any]: ...
+    
+    async def request_cancel(self, operation_id: str): ...
+    
+    async def cancel_requested(self, operation_id: str) -> bool: ...
+    
+    async def watch_cancellations(self, callback: Callable[[str], Any]): ...
+
+
 class RedisOperationStore:
     """Redis-backed operation store for production use"""
     
@@ -71,20 +215,22 @@ class RedisOperationStore:
         )
         
         self.redis: Optional[redis.Redis] = None
-        self._pubsub_clients = {}
+        self.pubsub: Optional[OperationPubSub] = None
+        self._update_script = None
     
     async def initialize(self):
         """Initialize Redis connection"""
         self.redis = redis.Redis(connection_pool=self.pool)
         await self.redis.ping()
+        self.pubsub = OperationPubSub(self.redis)
+        self._update_script = self.redis.register_script(UPDATE_OPERATION_SCRIPT)
         logger.info("Redis connection established")
     
     async def close(self):
         """Close Redis connections"""
-        # Close all pubsub connections
-        for pubsub in self._pubsub_clients.values():
-            await pubsub.close()
-        self._pubsub_clients.clear()
+        # Stop the shared pubsub listener
+        if self.pubsub:
+            await self.pubsub.close()
         
         # Close main connection
         if self.redis:
@@ -106,28 +252,32 @@ class RedisOperationStore:
         
         key = f"operation:{operation_id}"
         
-        await self.redis.hset(key, mapping=operation_data)
-        await self.redis.expire(key, self.operation_ttl)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=operation_data)
+            pipe.expire(key, self.operation_ttl)
+            pipe.delete(f"{key}:cancel")
+            await pipe.execute()
         
         logger.info(f"Operation created: {operation_id}")
     
-    async def update_operation(
+    def _update_script_call(
         self,
         operation_id: str,
         status: ProjectCreationStatus,
         message: str,
         progress: int,
         project_id: Optional[str] = None,
-        error: Optional[str] = None
-    ):
-        """Update operation and notify subscribers"""
-        key = f"operation:{operation_id}"
-        
-        # Update data
+        error: Optional[str] = None,
+        result: Optional[Any] = None,
+        eta_seconds: Optional[int] = None
+    ) -> tuple[list[str], list[Any]]:
+        """KEYS and ARGV of UPDATE_OPERATION_SCRIPT for one update"""
         update_data = {
             "status": status.value,
             "progress": str(progress),
             "message": message,
+            # Always written, so a stale estimate never outlives the update it came with
+            "eta_seconds": "" if eta_seconds is None else str(eta_seconds),
             "updated_at": datetime.utcnow().isoformat()
         }
         
@@ -137,110 +287,342 @@ class RedisOperationStore:
         if error is not None:
             update_data["error"] = error
         
-        # Update hash
-        await self.redis.hset(key, mapping=update_data)
-        
-        # Publish update to subscribers
         update_message = {
             "operation_id": operation_id,
             "status": status.value,
             "message": message,
             "progress": progress,
             "project_id": project_id,
-            "error": error
+            "error": error,
+            "eta_seconds": eta_seconds,
+            "updated_at": update_data["updated_at"]
         }
         
-        channel = f"operation:{operation_id}:updates"
-        await self.redis.publish(channel, json.dumps(update_message))
+        # Results travel with the terminal update, so subscribers never
+        # have to read them back from the hash
+        result_key = f"operation:{operation_id}:result"
+        stored_result = ""
+        if result is not None:
+            result_json = json.dumps(result)
+            terminal = status.value in TERMINAL_STATUSES
+            if len(result_json) > RESULT_INLINE_BYTES:
+                stored_result = result_json
+                update_data["result"] = ""
+                update_data["result_key"] = result_key
+                if terminal:
+                    update_message["result_key"] = result_key
+            else:
+                update_data["result"] = result_json
+                if terminal:
+                    update_message["result"] = result
+        
+        keys = [f"operation:{operation_id}", f"operation:{operation_id}:events", result_key]
+        args = [
+            json.dumps(update_message),
+            EVENTS_MAXLEN,
+            self.operation_ttl,
+            f"operation:{operation_id}:updates",
+            stored_result
+        ]
+        for field, value in update_data.items():
+            args.extend([field, value])
+        return keys, args
+    
+    async def update_operation(
+        self,
+        operation_id: str,
+        status: ProjectCreationStatus,
+        message: str,
+        progress: int,
+        project_id: Optional[str] = None,
+        error: Optional[str] = None,
+        result: Optional[Any] = None,
+        eta_seconds: Optional[int] = None
+    ) -> str:
+        """
+        Update operation and notify subscribers.
+        
+        The hash update, event log entry and publish happen atomically in one
+        round trip (see UPDATE_OPERATION_SCRIPT). result, if given, is stored
+        JSON-encoded in the hash alongside the update.
+        
+        Returns:
+            str: The update's event ID
+        """
+        keys, args = self._update_script_call(
+            operation_id, status, message, progress, project_id, error, result, eta_seconds
+        )
+        event_id = await self._update_script(keys=keys, args=args)
         
         logger.info(f"Operation updated: {operation_id} - {status.value} ({progress}%)")
+        return event_id.decode() if isinstance(event_id, bytes) else event_id
     
-    async def subscribe(self, operation_id: str) -> asyncio.Queue:
-        """Subscribe to operation updates"""
-        queue = asyncio.Queue(maxsize=100)
+    async def update_operations(self, updates: list[dict[str, Any]]) -> list[str]:
+        """
+        Apply many operation updates in one pipelined round trip.
         
-        # Get current state first
-        key = f"operation:{operation_id}"
-        current = await self.redis.hgetall(key)
-        
-        if current:
-            await queue.put(ProjectCreationUpdate(
-                operation_id=operation_id,
-                status=ProjectCreationStatus(current[b'status'].decode()),
-                message=current[b'message'].decode(),
-                progress=int(current[b'progress']),
-                project_id=current[b'project_id'].decode() or None,
-                error=current[b'error'].decode() or None
+        Args:
+            updates: update_operation keyword arguments, one dict per update
+            
+        Returns:
+            list: Event IDs, in the order of updates
+        """
+        if not updates:
+            return []
+        
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for update in updates:
+                keys, args = self._update_script_call(**update)
+                await self._update_script(keys=keys, args=args, client=pipe)
+            event_ids = await pipe.execute()
+        
+        logger.info(f"Updated {len(updates)} operations")
+        return [event_id.decode() if isinstance(event_id, bytes) else event_id for event_id in event_ids]
+    
+    async def publish_output(self, operation_id: str, stream: str, line: str, command: Optional[str] = None):
+        """Publish one line of command output for an operation"""
+        output_message = {
+            "operation_id": operation_id,
+            "stream": stream,
+            "line": line,
+            "command": command,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+        
+        channel = f"operation:{operation_id}:output"
+        await self.redis.publish(channel, json.dumps(output_message))
+    
+    async def publish_outputs(self, lines: list[dict[str, Any]]):
+        """Publish many output lines (publish_output keyword arguments) in one round trip"""
+        timestamp = datetime.utcnow().isoformat()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for line in lines:
+                output_message = {
+                    "operation_id": line["operation_id"],
+                    "stream": line["stream"],
+                    "line": line["line"],
+                    "command": line.get("command"),
+                    "timestamp": timestamp
+                }
+                pipe.publish(f"operation:{line['operation_id']}:output", json.dumps(output_message))
+            await pipe.execute()
+    
+    @staticmethod
+    def _update_from_hash(operation_id: str, current: dict) -> ProjectCreationUpdate:
+        def field(name: bytes) -> Optional[str]:
+            value = current.get(name)
+            return value.decode() if value else None
+        
+        status = ProjectCreationStatus(current[b'status'].decode())
+        result = None
+        if status.value in TERMINAL_STATUSES and current.get(b'result'):
+            result = json.loads(current[b'result'])
+        
+        return ProjectCreationUpdate(
+            operation_id=operation_id,
+            status=status,
+            message=current[b'message'].decode(),
+            progress=int(current[b'progress']),
+            project_id=field(b'project_id'),
+            error=field(b'error'),
+            eta_seconds=int(field(b'eta_seconds')) if field(b'eta_seconds') else None,
+            event_id=field(b'event_id'),
+            created_at=field(b'created_at'),
+            updated_at=field(b'updated_at'),
+            result=result,
+            result_key=field(b'result_key')
+        )
+    
+    async def load_result(self, result_key: str) -> Optional[Any]:
+        """Read a result stored under its own key (see RESULT_INLINE_BYTES)"""
+        data = await self.redis.get(result_key)
+        return json.loads(data) if data else None
+    
+    async def get_operation(self, operation_id: str) -> Optional[ProjectCreationUpdate]:
+        """Current state of an operation, None if unknown or expired"""
+        current = await self.redis.hgetall(f"operation:{operation_id}")
+        if not current or b'status' not in current:
+            return None
+        return self._update_from_hash(operation_id, current)
+    
+    def subscription_stats(self) -> dict[str, Any]:
+        return self.pubsub.stats() if self.pubsub else {}
+    
+    async def read_events(self, operation_id: str, after: str = "0-0") -> list[ProjectCreationUpdate]:
+        """Logged updates of an operation newer than the event ID after"""
+        response = await self.redis.xread({f"operation:{operation_id}:events": after})
+        updates = []
+        for _, entries in response or []:
+            for entry_id, fields in entries:
+                data = json.loads(fields[b'data'])
+                data["event_id"] = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+                updates.append(update_from_message(data))
+        return updates
+    
+    async def subscribe_output(self, operation_id: str) -> ConflatingQueue:
+        """
+        Subscribe to live command output for an operation.
+        
+        The queue receives OperationOutputLine items and a final None once the
+        operation reaches COMPLETED or FAILED. A slow consumer loses the oldest
+        lines rather than stalling delivery to everyone else.
+        """
+        queue = ConflatingQueue(maxsize=OUTPUT_QUEUE_SIZE, droppable=lambda item: item is not None)
+        
+        def on_message(kind: str, data: dict) -> bool:
+            if kind == "updates":
+                if data['status'] in TERMINAL_STATUSES:
+                    queue.put_nowait(None)
+                    return False
+                return True
+            
+            queue.put_nowait(OperationOutputLine(
+                operation_id=data['operation_id'],
+                stream=data['stream'],
+                line=data['line'],
+                command=data.get('command'),
+                timestamp=data.get('timestamp')
             ))
+            return True
         
-        # Create pubsub connection
-        pubsub = self.redis.pubsub()
-        channel = f"operation:{operation_id}:updates"
-        await pubsub.subscribe(channel)
+        queue.subscription = await self.pubsub.subscribe(operation_id, ("output", "updates"), on_message)
+        return queue
+    
+    async def cleanup_output(self, queue: ConflatingQueue):
+        """Clean up an output subscription"""
+        if queue.subscription:
+            await self.pubsub.unsubscribe(queue.subscription)
+    
+    async def subscribe(self, operation_id: str, last_event_id: Optional[str] = None) -> ConflatingQueue:
+        """
+        Subscribe to operation updates.
+        
+        Without last_event_id the queue starts with the current state. With it,
+        every update logged after that event is replayed first, so a client
+        that reconnects resumes where it left off. Live updates are delivered
+        through the process-wide pattern subscription and deduplicated against
+        the replay. A slow consumer's intermediate updates are conflated (the
+        oldest non-terminal update is dropped when the queue is full); terminal
+        updates are always delivered.
+        """
+        queue = ConflatingQueue(
+            maxsize=UPDATE_QUEUE_SIZE,
+            droppable=lambda update: update.status.value not in TERMINAL_STATUSES
+        )
+        # Live updates are held back until the replay/snapshot is queued
+        held: Optional[list] = []
+        last_seen = [event_id_key(last_event_id) if last_event_id else (0, 0)]
+        
+        def deliver(update: ProjectCreationUpdate):
+            if update.event_id:
+                if event_id_key(update.event_id) <= last_seen[0]:
+                    return
+                last_seen[0] = event_id_key(update.event_id)
+            queue.put_nowait(update)
+        
+        def on_message(kind: str, data: dict) -> bool:
+            update = update_from_message(data)
+            if held is not None:
+                held.append(update)
+                return True
+            deliver(update)
+            # Stop after completion/failure
+            return update.status.value not in TERMINAL_STATUSES
         
-        # Store for cleanup
-        self._pubsub_clients[operation_id] = pubsub
+        # Subscribe before reading the log/state so no update falls in between
+        queue.subscription = await self.pubsub.subscribe(operation_id, ("updates",), on_message)
         
-        # Background task to forward messages
-        async def listen_and_forward():
+        if last_event_id:
+            backlog = await self.read_events(operation_id, last_event_id)
+        else:
+            backlog = []
+            current = await self.redis.hgetall(f"operation:{operation_id}")
+            if current:
+                backlog.append(self._update_from_hash(operation_id, current))
+        
+        for update in backlog + held:
+            deliver(update)
+        held = None
+        
+        finished = any(update.status.value in TERMINAL_STATUSES for update in backlog)
+        if finished:
+            await self.pubsub.unsubscribe(queue.subscription)
+        
+        return queue
+    
+    async def cleanup(self, operation_id: str, queue: ConflatingQueue):
+        """Clean up subscription"""
+        if queue.subscription:
+            await self.pubsub.unsubscribe(queue.subscription)
+    
+    async def request_cancel(self, operation_id: str):
+        """
+        Ask whichever process runs the operation to cancel it. The flag covers
+        operations that have not started yet (or whose runner missed the
+        control message); the control message stops running ones right away.
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(f"operation:{operation_id}:cancel", "1", ex=self.operation_ttl)
+            pipe.publish(f"operation:{operation_id}:control", json.dumps({"action": "cancel"}))
+            await pipe.execute()
+        logger.info(f"Cancellation requested: {operation_id}")
+    
+    async def cancel_requested(self, operation_id: str) -> bool:
+        return bool(await self.redis.exists(f"operation:{operation_id}:cancel"))
+    
+    async def watch_cancellations(self, callback: Callable[[str], Any]):
+        """Call callback(operation_id) for every cancellation request until cancelled"""
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            pubsub = self.redis.pubsub()
             try:
+                await pubsub.psubscribe("operation:*:control")
+                delay = RECONNECT_MIN_DELAY
+                
                 async for message in pubsub.listen():
-                    if message['type'] == 'message':
-                        try:
-                            data = json.loads(message['data'])
-                            update = ProjectCreationUpdate(
-                                operation_id=data['operation_id'],
-                                status=ProjectCreationStatus(data['status']),
-                                message=data['message'],
-                                progress=data['progress'],
-                                project_id=data.get('project_id'),
-                                error=data.get('error')
-                            )
-                            
-                            await queue.put(update)
-                            
-                            # Stop after completion/failure
-                            if update.status in [
-                                ProjectCreationStatus.COMPLETED,
-                                ProjectCreationStatus.FAILED
-                            ]:
-                                break
-                                
-                        except (json.JSONDecodeError, KeyError) as e:
-                            logger.error(f"Invalid message format: {e}")
+                    if message['type'] != 'pmessage':
+                        continue
+                    channel = message['channel']
+                    if isinstance(channel, bytes):
+                        channel = channel.decode()
+                    operation_id = channel[len("operation:"):-len(":control")]
+                    try:
+                        callback(operation_id)
+                    except Exception as e:
+                        logger.error(f"Cancellation handler failed for {operation_id}: {e}")
             
             except asyncio.CancelledError:
-                pass
+                raise
             except Exception as e:
-                logger.error(f"Error in listener: {e}")
+                # Runners also check the cancel flag, so a missed message only delays cancellation
+                logger.warning(f"Cancellation listener lost its connection, retrying in {delay:.1f}s: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
             finally:
-                await pubsub.unsubscribe(channel)
-                await pubsub.close()
-                if operation_id in self._pubsub_clients:
-                    del self._pubsub_clients[operation_id]
-        
-        # Start listener
-        task = asyncio.create_task(listen_and_forward())
-        queue._listener_task = task  # type: ignore
-        
-        return queue
-    
-    async def cleanup(self, operation_id: str, queue: asyncio.Queue):
-        """Clean up subscription"""
-        # Cancel listener task
-        if hasattr(queue, '_listener_task'):
-            task = queue._listener_task  # type: ignore
-            if not task.done():
-                task.cancel()
                 try:
-                    await task
-                except asyncio.CancelledError:
+                    await pubsub.aclose()
+                except Exception:
                     pass
-        
-        # Close pubsub if exists
-        if operation_id in self._pubsub_clients:
-            pubsub = self._pubsub_clients[operation_id]
-            await pubsub.close()
-            del self._pubsub_clients[operation_id]
 
 
+def create_operation_store(backend: Optional[str] = None, operation_ttl: int = 3600) -> OperationStore:
+    """
+    Operation store selected by OPERATION_STORE_BACKEND: "redis" (default),
+    shared by every gateway and worker process, or "memory" for single-process
+    installs, CI and load tests.
+    """
+    backend = (backend or os.getenv("OPERATION_STORE_BACKEND", "redis")).lower()
+    
+    if backend == "memory":
+        from autostack_engine.utils.project.memory_store import InMemoryOperationStore
+        return InMemoryOperationStore(operation_ttl=operation_ttl)
+    
+    if backend != "redis":
+        raise ValueError(f"Unknown OPERATION_STORE_BACKEND '{backend}'")
+    
+    return RedisOperationStore(
+        redis_url=f'redis://{os.getenv("REDIS_USER")}:{os.getenv("REDIS_PASSWORD")}@{os.getenv("REDIS_HOST")}:6379/0',
+        # Subscribers share one pattern subscription, so the pool only serves commands
+        max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "200")),
+        operation_ttl=operation_ttl
+    )
@@ -0,0 +1,375 @@
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import structlog
+
+from autostack_engine.utils.process.runner import run_command
+
+logger = structlog.get_logger()
+
+# Name every cached skeleton is scaffolded with; replaced by the real name on restore
+SKELETON_NAME = "autostackskeleton"
+
+# Directories inside a skeleton that are hardlinked instead of copied. Their
+# files are never edited in place, so sharing inodes between projects is safe.
+SHARED_DIRS = {"node_modules"}
+
+# Skip name substitution for files larger than this (lockfiles, bundles, ...)
+MAX_SUBSTITUTION_BYTES = 2 * 1024 * 1024
+
+ScaffoldBuilder = Callable[[Path], Awaitable[bool]]
+
+
+def default_cache_root() -> Path:
+    return Path(os.getenv(
+        "AUTOSTACK_SCAFFOLD_CACHE_DIR",
+        Path.home() / ".cache" / "autostack" / "scaffolds"
+    ))
+
+
+def tree_size(path: Path) -> int:
+    """Total size in bytes of the regular files under path"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def hardlink_tree(source: Path, target: Path):
+    """Recreate source under target with every regular file hardlinked"""
+    for root, dirs, files in os.walk(source):
+        rel = Path(root).relative_to(source)
+        (target / rel).mkdir(parents=True, exist_ok=True)
+        for name in files:
+            src = Path(root) / name
+            dst = target / rel / name
+            if dst.exists() or dst.is_symlink():
+                dst.unlink()
+            if src.is_symlink():
+                os.symlink(os.readlink(src), dst)
+                continue
+            try:
+                os.link(src, dst)
+            except OSError:
+                # Different filesystem or link limit reached
+                shutil.copy2(src, dst)
+
+
+async def copy_tree(source: Path, target: Path, exclude: Optional[set] = None):
+    """
+    Copy source into target, using copy-on-write reflinks where the filesystem
+    supports them (cp --reflink=auto) and a plain copy otherwise.
+    """
+    exclude = exclude or set()
+    target.mkdir(parents=True, exist_ok=True)
+    entries = [entry for entry in source.iterdir() if entry.name not in exclude]
+    if not entries:
+        return
+
+    if shutil.which("cp"):
+        result = await run_command(
+            ["cp", "-a", "--reflink=auto", *[str(entry) for entry in entries], str(target)],
+            timeout=600,
+            label="scaffold-cache"
+        )
+        if result.ok:
+            return
+        logger.warning(f"cp --reflink failed, falling back to copy: {result.stderr.strip()}")
+
+    def copy():
+        for entry in entries:
+            dst = target / entry.name
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.copytree(entry, dst, symlinks=True, dirs_exist_ok=True)
+            else:
+                shutil.copy2(entry, dst, follow_symlinks=False)
+
+    await asyncio.to_thread(copy)
+
+
+def substitute_name(root: Path, placeholder: str, name: str):
+    """Replace the placeholder in file contents and paths (outside shared dirs)"""
+    variants = [(placeholder, name), (placeholder.capitalize(), name[:1].upper() + name[1:])]
+
+    for current, dirs, files in os.walk(root, topdown=True):
+        dirs[:] = [d for d in dirs if d not in SHARED_DIRS]
+        for filename in files:
+            path = Path(current) / filename
+            if path.is_symlink():
+                continue
+            try:
+                if path.stat().st_size > MAX_SUBSTITUTION_BYTES:
+                    continue
+                content = path.read_text()
+            except (UnicodeDecodeError, OSError):
+                continue  # Binary or unreadable
+            updated = content
+            for old, new in variants:
+                updated = updated.replace(old, new)
+            if updated != content:
+                path.write_text(updated)
+
+    # Rename paths deepest first so parents are renamed last
+    for current, dirs, files in os.walk(root, topdown=False):
+        if any(part in SHARED_DIRS for part in Path(current).relative_to(root).parts):
+            continue
+        for entry in dirs + files:
+            if placeholder in entry:
+                src = Path(current) / entry
+                src.rename(Path(current) / entry.replace(placeholder, name))
+
+
+class ScaffoldCache:
+    """
+    Local cache of pristine framework skeletons.
+
+    Each entry is the tree a framework CLI produced for a given key
+    (framework, toolchain version, command), scaffolded under the placeholder
+    name SKELETON_NAME. Restoring an entry copies it with reflinks (hardlinks
+    for node_modules) and substitutes the real component name.
+
+    Layout: <root>/<key>/tree/ and <root>/<key>/meta.json. Entries are evicted
+    least-recently-used first once the cache exceeds max_bytes, except entries
+    being restored from and the one just captured. Entries built from @latest
+    commands expire after latest_ttl seconds.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        latest_ttl: Optional[int] = None
+    ):
+        self.root = Path(root) if root else default_cache_root()
+        self.max_bytes = max_bytes or int(os.getenv("AUTOSTACK_SCAFFOLD_CACHE_MAX_BYTES", str(5 * 1024 ** 3)))
+        self.latest_ttl = latest_ttl or int(os.getenv("AUTOSTACK_SCAFFOLD_CACHE_LATEST_TTL", str(7 * 24 * 3600)))
+        self.enabled = os.getenv("AUTOSTACK_SCAFFOLD_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # Restores in progress per key; eviction holds _evict_lock and skips
+        # these, and restores only start while no eviction is running
+        self._in_use: Dict[str, int] = {}
+        self._evict_lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(framework: str, toolchain: str, command: List[str]) -> str:
+        payload = json.dumps([framework, toolchain, command])
+        return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.root / key
+
+    def _read_meta(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._entry_dir(key) / "meta.json") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _write_meta(self, key: str, meta: Dict[str, Any]):
+        path = self._entry_dir(key) / "meta.json"
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp, path)
+
+    def has(self, key: str) -> bool:
+        """Whether a usable (present and not expired) skeleton exists for key"""
+        return self._is_valid(key)
+
+    def _is_valid(self, key: str) -> bool:
+        meta = self._read_meta(key)
+        if not meta or not (self._entry_dir(key) / "tree").is_dir():
+            return False
+        if "@latest" in " ".join(meta.get("command", [])):
+            return time.time() - meta.get("created_at", 0) < self.latest_ttl
+        return True
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Metadata of every cache entry"""
+        if not self.root.exists():
+            return []
+        entries = []
+        for entry in self.root.iterdir():
+            if entry.is_dir() and not entry.name.startswith("."):
+                meta = self._read_meta(entry.name)
+                if meta:
+                    entries.append({"key": entry.name, **meta})
+        return entries
+
+    def stats(self) -> Dict[str, Any]:
+        entries = self.entries()
+        return {
+            "root": str(self.root),
+            "entries": len(entries),
+            "size_bytes": sum(entry.get("size_bytes", 0) for entry in entries),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    async def restore(self, key: str, target_dir: Path, name: str) -> bool:
+        """Materialize a cached skeleton into target_dir, renamed to name"""
+        async with self._evict_lock:
+            if not self._is_valid(key):
+                return False
+            self._in_use[key] = self._in_use.get(key, 0) + 1
+
+        try:
+            tree = self._entry_dir(key) / "tree"
+            target_dir.mkdir(parents=True, exist_ok=True)
+
+            await copy_tree(tree, target_dir, exclude=SHARED_DIRS)
+            for shared in SHARED_DIRS:
+                if (tree / shared).is_dir():
+                    await asyncio.to_thread(hardlink_tree, tree / shared, target_dir / shared)
+            await asyncio.to_thread(substitute_name, target_dir, SKELETON_NAME, name)
+
+            meta = self._read_meta(key) or {}
+            meta["last_used"] = time.time()
+            meta["uses"] = meta.get("uses", 0) + 1
+            self._write_meta(key, meta)
+            return True
+        finally:
+            self._in_use[key] -= 1
+            if not self._in_use[key]:
+                del self._in_use[key]
+
+    async def populate(
+        self,
+        key: str,
+        builder: ScaffoldBuilder,
+        staging_parent: Path,
+        meta: Dict[str, Any]
+    ) -> bool:
+        """
+        Build a skeleton with builder into a staging dir named SKELETON_NAME
+        and capture it as the entry for key.
+        """
+        staging_root = staging_parent / f"cache-{key[:12]}-{uuid.uuid4().hex[:8]}"
+        staging_dir = staging_root / SKELETON_NAME
+        staging_dir.mkdir(parents=True)
+        try:
+            if not await builder(staging_dir):
+                return False
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp_entry = self.root / f".{key}.{uuid.uuid4().hex[:8]}"
+            await asyncio.to_thread(shutil.move, str(staging_dir), str(tmp_entry / "tree"))
+
+            now = time.time()
+            size = await asyncio.to_thread(tree_size, tmp_entry / "tree")
+            with open(tmp_entry / "meta.json", "w") as f:
+                json.dump({**meta, "size_bytes": size, "created_at": now, "last_used": now, "uses": 0}, f, indent=2)
+
+            # Swap in atomically, replacing an expired entry if there is one
+            # (nothing restores from it: restore only reads valid entries)
+            entry_dir = self._entry_dir(key)
+            if entry_dir.exists():
+                await asyncio.to_thread(shutil.rmtree, entry_dir, True)
+            os.rename(tmp_entry, entry_dir)
+
+            logger.info(f"Captured scaffold skeleton {key} ({size / 1024 ** 2:.1f} MiB)", **meta)
+            await self.evict_unused(keep=key)
+            return True
+        finally:
+            shutil.rmtree(staging_root, ignore_errors=True)
+
+    async def get_or_build(
+        self,
+        key: str,
+        target_dir: Path,
+        name: str,
+        builder: ScaffoldBuilder,
+        staging_parent: Path,
+        meta: Dict[str, Any],
+        fallback: Optional[ScaffoldBuilder] = None
+    ) -> tuple[bool, bool]:
+        """
+        Restore the skeleton for key into target_dir, building it first on a miss.
+        Concurrent callers for the same key wait for a single build. If the
+        skeleton was built but cannot be restored, target_dir is cleared and
+        fallback (a direct scaffold into target_dir) is used instead.
+
+        Returns:
+            tuple: (success: bool, cache_hit: bool)
+        """
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            if await self.restore(key, target_dir, name):
+                self.hits += 1
+                return True, True
+
+            self.misses += 1
+            if not await self.populate(key, builder, staging_parent, meta):
+                return False, False
+
+            try:
+                if await self.restore(key, target_dir, name):
+                    return True, False
+            except Exception as e:
+                logger.warning(f"Restoring scaffold skeleton {key} failed: {e}")
+
+        if fallback is None:
+            return False, False
+        logger.warning(f"Scaffold skeleton {key} unavailable after capture, scaffolding directly")
+        await asyncio.to_thread(shutil.rmtree, target_dir, True)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        return await fallback(target_dir), False
+
+    async def evict_unused(self, keep: Optional[str] = None) -> List[str]:
+        """evict() serialized against restores, sparing entries in use and keep"""
+        async with self._evict_lock:
+            protected = set(self._in_use)
+            if keep:
+                protected.add(keep)
+            return await asyncio.to_thread(self.evict, None, protected)
+
+    def evict(self, max_bytes: Optional[int] = None, protected: Optional[set] = None) -> List[str]:
+        """
+        Remove least-recently-used entries until the cache fits in max_bytes,
+        never touching the keys in protected. Not safe to run while restores
+        may be in progress; use evict_unused for that.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        protected = protected or set()
+        entries = sorted(self.entries(), key=lambda entry: entry.get("last_used", 0))
+        total = sum(entry.get("size_bytes", 0) for entry in entries)
+
+        evicted = []
+        for entry in entries:
+            if total <= limit:
+                break
+            if entry["key"] in protected:
+                continue
+            shutil.rmtree(self._entry_dir(entry["key"]), ignore_errors=True)
+            total -= entry.get("size_bytes", 0)
+            evicted.append(entry["key"])
+
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} scaffold skeletons", remaining_bytes=total)
+        return evicted
+
+
+_scaffold_cache: Optional[ScaffoldCache] = None
+
+
+def get_scaffold_cache() -> ScaffoldCache:
+    """Get the process-wide scaffold cache"""
+    global _scaffold_cache
+    if _scaffold_cache is None:
+        _scaffold_cache = ScaffoldCache()
+    return _scaffold_cache
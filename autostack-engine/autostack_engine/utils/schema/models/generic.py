@@ -6,4 +6,10 @@ import strawberry
 class DeleteResponse:
     success: bool
     message: Optional[str] = None
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+
+@strawberry.type
+class PageInfo:
+    end_cursor: Optional[str] = None
+    has_next_page: bool = False
+    total_count: Optional[int] = None
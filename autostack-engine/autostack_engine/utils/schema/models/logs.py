@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import List, Optional
 import strawberry
 
+from autostack_engine.utils.schema.models.generic import PageInfo
+
 
 @strawberry.type
 class LogEntry:
@@ -38,4 +40,10 @@ class LogStatisticsResponse:
 @strawberry.type
 class LogsResponse:
     logs: List[LogEntry]
-    total: int
\ No newline at end of file
+    total: int
+
+@strawberry.type
+class LogsPage:
+    logs: List[LogEntry]
+    page_info: PageInfo
+    error: Optional[str] = None
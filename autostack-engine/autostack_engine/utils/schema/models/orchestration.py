@@ -0,0 +1,31 @@
+from typing import List
+import strawberry
+
+
+@strawberry.type
+class StepTimingStat:
+    name: str
+    runs: int
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+
+
+@strawberry.type
+class FrameworkTimingStat:
+    name: str
+    runs: int
+    failed: int
+    total_ms: float
+    avg_ms: float
+    max_ms: float
+
+
+@strawberry.type
+class ProvisioningTimeReport:
+    days: int
+    runs: int
+    failed: int
+    total_ms: float
+    steps: List[StepTimingStat]
+    frameworks: List[FrameworkTimingStat]
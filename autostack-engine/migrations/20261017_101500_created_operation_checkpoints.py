@@ -0,0 +1,50 @@
+"""
+Migration: created operation checkpoints
+Created: 2026-10-17T10:15:00.000000
+"""
+import os
+from motor.motor_asyncio import AsyncIOMotorClient
+from beanie import init_beanie
+import logging
+
+from autostack_engine.utils.database.models.orchestration.models import OperationCheckpoint
+
+
+
+logger = logging.getLogger(__name__)
+
+async def up():
+    """
+    Apply the migration
+    """
+    logger.info('Applying migration: Created operation checkpoints')
+    mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+    database_name = os.getenv("DATABASE_NAME", "autostack")
+    
+    client = AsyncIOMotorClient(mongodb_url)
+    database = client[database_name]
+    
+    # Creates the collection and its indexes
+    await init_beanie(
+        database=database,
+        document_models=[
+            OperationCheckpoint
+        ]
+    )
+    
+    logger.info('Migration complete')
+
+
+async def down():
+    """
+    Rollback the migration
+    """
+    logger.info('Rolling back migration: Created operation checkpoints')
+    mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+    database_name = os.getenv("DATABASE_NAME", "autostack")
+    
+    client = AsyncIOMotorClient(mongodb_url)
+    database = client[database_name]
+    await database.drop_collection("operation_checkpoints")
+    
+    logger.info('Rollback complete')
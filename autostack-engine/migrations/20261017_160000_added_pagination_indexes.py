@@ -0,0 +1,68 @@
+"""
+Migration: added pagination indexes
+Created: 2026-10-17T16:00:00.000000
+"""
+import os
+from motor.motor_asyncio import AsyncIOMotorClient
+from beanie import init_beanie
+import logging
+
+from autostack_engine.utils.database.models.activities.models import ActivityLog
+from autostack_engine.utils.database.models.ai.models import ProjectChat
+from autostack_engine.utils.database.models.project.models import Project
+from autostack_engine.utils.logging.services import ServiceLog
+
+
+
+logger = logging.getLogger(__name__)
+
+# (collection, index keys) added for keyset pagination
+PAGINATION_INDEXES = [
+    ("projects", [("created_at", -1), ("_id", -1)]),
+    ("project_chat", [("created_at", -1), ("_id", -1)]),
+    ("activity_logs", [("created_at", -1), ("_id", -1)]),
+    ("activity_logs", [("project_id", 1), ("created_at", -1), ("_id", -1)]),
+    ("service_logs", [("timestamp", -1), ("_id", -1)]),
+    ("service_logs", [("service_name", 1), ("timestamp", -1), ("_id", -1)]),
+    ("service_logs", [("project_id", 1), ("timestamp", -1), ("_id", -1)]),
+]
+
+async def up():
+    """
+    Apply the migration
+    """
+    logger.info('Applying migration: Added pagination indexes')
+    mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+    database_name = os.getenv("DATABASE_NAME", "autostack")
+    
+    client = AsyncIOMotorClient(mongodb_url)
+    database = client[database_name]
+    
+    # Creates the indexes missing from the models' settings
+    await init_beanie(
+        database=database,
+        document_models=[
+            Project,
+            ProjectChat,
+            ActivityLog,
+            ServiceLog
+        ]
+    )
+    
+    logger.info('Migration complete')
+
+
+async def down():
+    """
+    Rollback the migration
+    """
+    logger.info('Rolling back migration: Added pagination indexes')
+    mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+    database_name = os.getenv("DATABASE_NAME", "autostack")
+    
+    client = AsyncIOMotorClient(mongodb_url)
+    database = client[database_name]
+    for collection, keys in PAGINATION_INDEXES:
+        await database[collection].drop_index(keys)
+    
+    logger.info('Rollback complete')
@@ -0,0 +1,93 @@
+"""
+Migration: moved project avatars
+Created: 2026-10-17T18:00:00.000000
+"""
+import base64
+import hashlib
+import os
+from motor.motor_asyncio import AsyncIOMotorClient
+from beanie import init_beanie
+import logging
+
+from autostack_engine.utils.database.models.project.models import Project, ProjectAvatar, ProjectManager
+
+
+
+logger = logging.getLogger(__name__)
+
+async def up():
+    """
+    Apply the migration
+    """
+    logger.info('Applying migration: Moved project avatars')
+    mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+    database_name = os.getenv("DATABASE_NAME", "autostack")
+    
+    client = AsyncIOMotorClient(mongodb_url)
+    database = client[database_name]
+    
+    await init_beanie(
+        database=database,
+        document_models=[
+            Project,
+            ProjectAvatar
+        ]
+    )
+    
+    # Copy every inline avatar into project_avatars, then drop it from the project.
+    # avatar_data is only removed from projects whose avatar was actually moved.
+    projects = database["projects"]
+    moved = 0
+    skipped = 0
+    async for project in projects.find(
+        {"avatar_data": {"$ne": None}},
+        {"avatar_data": 1, "avatar_hash": 1, "name": 1}
+    ):
+        # Older projects have no avatar_hash; it is the MD5 of the name (see IdenticonGenerator)
+        avatar_hash = project.get("avatar_hash") or (
+            hashlib.md5(project["name"].encode('utf-8')).hexdigest() if project.get("name") else None
+        )
+        try:
+            data = base64.b64decode(project["avatar_data"])
+        except (TypeError, ValueError):
+            data = None
+        if not avatar_hash or not data:
+            logger.warning(f'Keeping the inline avatar of project {project["_id"]}, it could not be moved')
+            skipped += 1
+            continue
+
+        await ProjectManager.save_avatar(ProjectAvatar(
+            hash=avatar_hash,
+            data=data,
+            etag=hashlib.sha256(data).hexdigest()
+        ))
+        await projects.update_one(
+            {"_id": project["_id"]},
+            {"$set": {"avatar_hash": avatar_hash}, "$unset": {"avatar_data": ""}}
+        )
+        moved += 1
+    # Explicit nulls carry no image
+    await projects.update_many({"avatar_data": None}, {"$unset": {"avatar_data": ""}})
+    
+    logger.info(f'Migration complete, moved {moved} avatars, kept {skipped} inline')
+
+
+async def down():
+    """
+    Rollback the migration
+    """
+    logger.info('Rolling back migration: Moved project avatars')
+    mongodb_url = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
+    database_name = os.getenv("DATABASE_NAME", "autostack")
+    
+    client = AsyncIOMotorClient(mongodb_url)
+    database = client[database_name]
+    
+    async for avatar in database["project_avatars"].find({}, {"hash": 1, "data": 1}):
+        await database["projects"].update_many(
+            {"avatar_hash": avatar["hash"]},
+            {"$set": {"avatar_data": base64.b64encode(avatar["data"]).decode('utf-8')}}
+        )
+    await database.drop_collection("project_avatars")
+    
+    logger.info('Rollback complete')
@@ -266,7 +266,7 @@ def main_menu():
                 "project_chat", "schema_rating", "service_logs", 
                 "activity_logs", "projects", "components", 
                 "environments", "connections", "technology_configs",
-                "project_configs"
+                "project_configs", "project_avatars"
             ]
             
             env_vars = get_env_vars()